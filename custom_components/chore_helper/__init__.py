@@ -9,6 +9,8 @@ from __future__ import annotations
 from datetime import timedelta
 
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import discovery
+from homeassistant.helpers.importlib import async_import_module
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -20,9 +22,14 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, ServiceCall
 import voluptuous as vol
 
-from . import const, helpers
+from . import const, helpers, registry, tracing
 from .const import LOGGER
-from homeassistant.helpers.template import Template
+from .events import LoadedEventDispatcher
+from .ledger import CompletionLedger
+from .metrics import SECTION_SERVICE
+from .snapshot import ScheduleSnapshot
+from .state_store import ChoreStateStore
+from .workload import WorkloadTracker
 
 PLATFORMS: list[str] = [const.SENSOR_PLATFORM]
 
@@ -63,7 +70,24 @@ SENSOR_SCHEMA = vol.Schema(
 CONFIG_SCHEMA = vol.Schema(
     {
         const.DOMAIN: vol.Schema(
-            {vol.Optional(const.CONF_SENSORS): vol.All(cv.ensure_list, [SENSOR_SCHEMA])}
+            {
+                vol.Optional(const.CONF_SENSORS): vol.All(
+                    cv.ensure_list, [SENSOR_SCHEMA]
+                ),
+                vol.Optional(
+                    const.CONF_LOADED_EVENT, default=const.LOADED_EVENT_FULL
+                ): vol.In(
+                    [
+                        const.LOADED_EVENT_FULL,
+                        const.LOADED_EVENT_COMPACT,
+                        const.LOADED_EVENT_CHANGED,
+                    ]
+                ),
+                vol.Optional(
+                    const.CONF_AGGREGATE_LOADED_EVENTS, default=False
+                ): cv.boolean,
+                vol.Optional(const.CONF_HEALTH_SENSOR, default=False): cv.boolean,
+            }
         )
     },
     extra=vol.ALLOW_EXTRA,
@@ -73,6 +97,7 @@ COMPLETE_NOW_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_ENTITY_ID): vol.All(cv.ensure_list, [cv.string]),
         vol.Optional(const.ATTR_LAST_COMPLETED): cv.datetime,
+        vol.Optional(const.CONF_COMPLETED_BY): cv.entity_id,
     }
 )
 
@@ -113,6 +138,13 @@ OFFSET_DATE_SCHEMA = vol.Schema(
     }
 )
 
+TRACE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ENTITY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(const.CONF_ENABLED, default=True): cv.boolean,
+    }
+)
+
 ASSIGN_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_ENTITY_ID): vol.All(cv.ensure_list, [cv.string]),
@@ -121,6 +153,48 @@ ASSIGN_SCHEMA = vol.Schema(
 )
 
 
+async def _async_setup_data(hass: HomeAssistant, config: dict) -> None:
+    """Initialize the integration-wide data structure and platforms."""
+    hass.data.setdefault(const.DOMAIN, {})
+    hass.data[const.DOMAIN].setdefault(const.SENSOR_PLATFORM, {})
+    hass.data[const.DOMAIN].setdefault(const.WORKLOAD, WorkloadTracker())
+    if const.LEDGER not in hass.data[const.DOMAIN]:
+        ledger = CompletionLedger(hass)
+        await ledger.async_load()
+        hass.data[const.DOMAIN][const.LEDGER] = ledger
+    if const.STATE_STORE not in hass.data[const.DOMAIN]:
+        state_store = ChoreStateStore(hass)
+        await state_store.async_load()
+        hass.data[const.DOMAIN][const.STATE_STORE] = state_store
+    if const.SCHEDULE_SNAPSHOT not in hass.data[const.DOMAIN]:
+        snapshot = ScheduleSnapshot(hass)
+        await snapshot.async_load()
+        hass.data[const.DOMAIN][const.SCHEDULE_SNAPSHOT] = snapshot
+    domain_config = config.get(const.DOMAIN, {})
+    hass.data[const.DOMAIN][const.LOADED_EVENTS] = LoadedEventDispatcher(
+        hass,
+        domain_config.get(const.CONF_LOADED_EVENT, const.LOADED_EVENT_FULL),
+        domain_config.get(const.CONF_AGGREGATE_LOADED_EVENTS, False),
+    )
+    if const.CALENDAR_PLATFORM not in hass.data[const.DOMAIN]:
+        # Imported off the event loop, as it pulls in the calendar component
+        calendar = await async_import_module(hass, f"{__package__}.calendar")
+        hass.data[const.DOMAIN][const.CALENDAR_PLATFORM] = (
+            calendar.EntitiesCalendarData(hass)
+        )
+        hass.async_create_task(
+            discovery.async_load_platform(
+                hass, const.CALENDAR_PLATFORM, const.DOMAIN, {}, config
+            )
+        )
+    if domain_config.get(const.CONF_HEALTH_SENSOR, False):
+        hass.async_create_task(
+            discovery.async_load_platform(
+                hass, const.SENSOR_PLATFORM, const.DOMAIN, {}, config
+            )
+        )
+
+
 # pylint: disable=unused-argument
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up platform - register services, initialize data structure."""
@@ -132,8 +206,9 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         for entity_id in entity_ids:
             LOGGER.debug("called add_date %s from %s", chore_date, entity_id)
             try:
-                entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                await entity.add_date(chore_date)
+                entity = registry.chore_by_entity_id(hass, entity_id)
+                with entity.metrics.timed(SECTION_SERVICE):
+                    await entity.add_date(chore_date)
             except KeyError as err:
                 LOGGER.error(
                     "Failed adding date %s to %s (%s)",
@@ -149,8 +224,9 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         for entity_id in entity_ids:
             LOGGER.debug("called remove_date %s from %s", chore_date, entity_id)
             try:
-                entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                await entity.remove_date(chore_date)
+                entity = registry.chore_by_entity_id(hass, entity_id)
+                with entity.metrics.timed(SECTION_SERVICE):
+                    await entity.remove_date(chore_date)
             except KeyError as err:
                 LOGGER.error(
                     "Failed removing date %s from %s (%s)",
@@ -172,8 +248,9 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
                 entity_id,
             )
             try:
-                entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                await entity.offset_date(offset, chore_date)
+                entity = registry.chore_by_entity_id(hass, entity_id)
+                with entity.metrics.timed(SECTION_SERVICE):
+                    await entity.offset_date(offset, chore_date)
             except (TypeError, KeyError) as err:
                 LOGGER.error("Failed offsetting date for %s - %s", entity_id, err)
                 break
@@ -184,8 +261,9 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         for entity_id in entity_ids:
             LOGGER.debug("called update_state for %s", entity_id)
             try:
-                entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                entity.update_state()
+                entity = registry.chore_by_entity_id(hass, entity_id)
+                with entity.metrics.timed(SECTION_SERVICE):
+                    entity.update_state()
             except KeyError as err:
                 LOGGER.error("Failed updating state for %s - %s", entity_id, err)
 
@@ -193,6 +271,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         """Handle the complete_chore service call."""
         entity_ids = call.data.get(CONF_ENTITY_ID, [])
         last_completed = call.data.get(const.ATTR_LAST_COMPLETED, None)
+        completed_by = call.data.get(const.CONF_COMPLETED_BY, None)
 
         LOGGER.debug(
             "Handling complete_chore. Entity IDs: %s, Last completed: %s",
@@ -201,6 +280,9 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         )
 
         # Evaluate the template if last_completed is a template string
+        # pylint: disable-next=import-outside-toplevel
+        from homeassistant.helpers.template import Template
+
         if isinstance(last_completed, Template):
             last_completed.hass = hass
             last_completed = last_completed.async_render()
@@ -213,15 +295,15 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         for entity_id in entity_ids:
             LOGGER.debug("Completing chore for entity: %s", entity_id)
             try:
-                entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                await entity.complete(last_completed)
+                entity = registry.chore_by_entity_id(hass, entity_id)
+                with entity.metrics.timed(SECTION_SERVICE):
+                    await entity.complete(last_completed, completed_by)
             except KeyError as err:
                 LOGGER.error(
                     "Failed setting last completed for %s - %s", entity_id, err
                 )
 
-    hass.data.setdefault(const.DOMAIN, {})
-    hass.data[const.DOMAIN].setdefault(const.SENSOR_PLATFORM, {})
+    await _async_setup_data(hass, config)
     hass.services.async_register(
         const.DOMAIN,
         "complete",
@@ -254,8 +336,9 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         for entity_id in entity_ids:
             LOGGER.debug("assign_chore called for %s to user %s", entity_id, user_id)
             try:
-                entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                await entity.assign_user(user_id)
+                entity = registry.chore_by_entity_id(hass, entity_id)
+                with entity.metrics.timed(SECTION_SERVICE):
+                    await entity.assign_user(user_id)
             except KeyError as err:
                 LOGGER.error(
                     "Failed assigning user %s to %s - %s", user_id, entity_id, err
@@ -265,6 +348,17 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         const.DOMAIN, "assign", handle_assign_chore, schema=ASSIGN_SCHEMA
     )
 
+    async def handle_trace(call: ServiceCall) -> None:
+        """Handle the trace service call."""
+        patterns = call.data.get(CONF_ENTITY_ID, [])
+        enabled = call.data.get(const.CONF_ENABLED, True)
+        LOGGER.debug("trace called for %s, enabled: %s", patterns, enabled)
+        tracing.set_tracing(hass, patterns, enabled)
+
+    hass.services.async_register(
+        const.DOMAIN, "trace", handle_trace, schema=TRACE_SCHEMA
+    )
+
     return True
 
 
@@ -284,6 +378,11 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
 async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Handle removal of an entry."""
+    chore_id = config_entry.data.get("unique_id", config_entry.entry_id)
+    if (state_store := hass.data[const.DOMAIN].get(const.STATE_STORE)) is not None:
+        state_store.remove(chore_id)
+    if (snapshot := hass.data[const.DOMAIN].get(const.SCHEDULE_SNAPSHOT)) is not None:
+        snapshot.remove(chore_id)
     try:
         await hass.config_entries.async_forward_entry_unload(
             config_entry, const.SENSOR_PLATFORM
@@ -294,7 +393,15 @@ async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Update listener - to re-create device after options update."""
+    """Update listener - apply the options in place, or re-create the device.
+
+    The entity is only re-created when the frequency needs another engine.
+    """
+    chore = registry.chore_by_entry_id(hass, entry.entry_id)
+    engine = const.FREQUENCY_ENGINES.get(entry.options.get(const.CONF_FREQUENCY))
+    if chore is not None and engine is not None and type(chore).__name__ == engine[1]:
+        chore.apply_options()
+        return
     await hass.config_entries.async_forward_entry_unload(entry, const.SENSOR_PLATFORM)
     hass.async_add_job(
         hass.config_entries.async_forward_entry_setup(entry, const.SENSOR_PLATFORM)
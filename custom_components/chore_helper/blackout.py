@@ -0,0 +1,231 @@
+"""Local holiday and blackout dates, indexed as one bitmap per year.
+
+Blackout dates come from the chore options, from an ICS file in the
+configuration directory and from the events of a calendar entity. The
+sources are read once a day and shared by the chores that use them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from . import const, helpers
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from .chore_config import ChoreConfig
+
+# Years read from calendars and recurring events: this one and the next
+BLACKOUT_YEARS = 2
+MAX_SHIFT = 366
+
+
+@lru_cache(maxsize=64)
+def _first_ordinal(year: int) -> int:
+    """Return the day ordinal of January 1st."""
+    return date(year, 1, 1).toordinal()
+
+
+class BlackoutIndex:
+    """Set of blackout dates, stored as one integer bitmap per year.
+
+    Bit n of a year is set if day n + 1 of the year is a blackout date, so
+    a membership check is a dictionary lookup and a shift.
+    """
+
+    __slots__ = ("_years",)
+
+    def __init__(self, days: Iterable[date] = ()) -> None:
+        """Create an index of the given days."""
+        self._years: dict[int, int] = {}
+        for day in days:
+            self.add(day)
+
+    def add(self, day: date) -> None:
+        """Add a blackout date."""
+        bit = 1 << (day.toordinal() - _first_ordinal(day.year))
+        self._years[day.year] = self._years.get(day.year, 0) | bit
+
+    def add_range(self, first: date, end: date) -> None:
+        """Add the days from first up to, but not including, end."""
+        for ordinal in range(first.toordinal(), max(end, first).toordinal()):
+            self.add(date.fromordinal(ordinal))
+
+    def __contains__(self, day: object) -> bool:
+        """Return True if the day is a blackout date."""
+        if not isinstance(day, date) or (bits := self._years.get(day.year)) is None:
+            return False
+        return bool(bits >> (day.toordinal() - _first_ordinal(day.year)) & 1)
+
+    def __len__(self) -> int:
+        """Return the number of blackout dates."""
+        return sum(bits.bit_count() for bits in self._years.values())
+
+    def resolve(self, day: date, shift: bool) -> date | None:
+        """Return the day itself, the next free day if shifting, else None."""
+        if day not in self:
+            return day
+        if not shift:
+            return None
+        for _ in range(MAX_SHIFT):
+            day += timedelta(days=1)
+            if day not in self:
+                return day
+        return None
+
+
+def _ics_date(value: str) -> date:
+    """Convert an ICS DATE or DATE-TIME value to a date."""
+    return datetime.strptime(value[:8], "%Y%m%d").date()
+
+
+def parse_ics(text: str, start: date, end: date) -> Iterator[tuple[date, date]]:
+    """Yield the first and the end day (excluded) of each event in ICS text.
+
+    Recurring events are expanded between start and end.
+    """
+    lines = text.replace("\r\n", "\n").replace("\n ", "").replace("\n\t", "")
+    event: dict[str, str] | None = None
+    for line in lines.split("\n"):
+        if line == "BEGIN:VEVENT":
+            event = {}
+        elif line == "END:VEVENT" and event is not None:
+            yield from _event_days(event, start, end)
+            event = None
+        elif event is not None and ":" in line:
+            name, _, value = line.partition(":")
+            event[name.split(";", 1)[0].upper()] = value.strip()
+
+
+def _event_days(
+    event: dict[str, str], start: date, end: date
+) -> Iterator[tuple[date, date]]:
+    """Yield the days covered by one ICS event and its recurrences."""
+    try:
+        first = _ics_date(event["DTSTART"])
+        last = _ics_date(event["DTEND"]) if "DTEND" in event else first
+    except (KeyError, ValueError):
+        return
+    duration = max(last - first, timedelta(days=1))
+    if "RRULE" not in event:
+        yield first, first + duration
+        return
+    # Loaded on first use, in the executor: few chores have blackout files
+    # pylint: disable-next=import-outside-toplevel
+    from dateutil.rrule import rrulestr
+
+    try:
+        rule = rrulestr(event["RRULE"], dtstart=datetime.combine(first, time()))
+    except (TypeError, ValueError):
+        LOGGER.warning("Ignoring the invalid recurrence %s", event["RRULE"])
+        return
+    window = datetime.combine(start, time()), datetime.combine(end, time())
+    for occurrence in rule.between(*window, inc=True):
+        yield occurrence.date(), occurrence.date() + duration
+
+
+def _load_ics(path: str, start: date, end: date) -> list[tuple[date, date]]:
+    """Read and parse an ICS file; runs in the executor."""
+    with open(path, encoding="utf-8") as file:
+        return list(parse_ics(file.read(), start, end))
+
+
+async def _async_calendar_events(
+    hass: HomeAssistant, entity_id: str, start: date, end: date
+) -> list[tuple[date, date]]:
+    """Return the first and end day of the events of a calendar entity."""
+    response = await hass.services.async_call(
+        "calendar",
+        "get_events",
+        {
+            ATTR_ENTITY_ID: entity_id,
+            "start_date_time": datetime.combine(start, time()).isoformat(),
+            "end_date_time": datetime.combine(end, time()).isoformat(),
+        },
+        blocking=True,
+        return_response=True,
+    )
+    days: list[tuple[date, date]] = []
+    for event in (response or {}).get(entity_id, {}).get("events", []):
+        first = helpers.parse_datetime(event.get("start"))
+        last = helpers.parse_datetime(event.get("end"))
+        if first is None:
+            continue
+        first_day = first.date()
+        end_day = last.date() if last is not None else first_day
+        days.append((first_day, max(end_day, first_day + timedelta(days=1))))
+    return days
+
+
+async def _async_build_index(
+    hass: HomeAssistant, config: ChoreConfig, today: date
+) -> tuple[BlackoutIndex, bool]:
+    """Read the blackout sources of a chore into an index.
+
+    Also return whether all the sources could be read.
+    """
+    complete = True
+    index = BlackoutIndex(date.fromordinal(day) for day in config.blackout_dates)
+    start, end = date(today.year, 1, 1), date(today.year + BLACKOUT_YEARS, 1, 1)
+    if config.blackout_file:
+        path = hass.config.path(config.blackout_file)
+        try:
+            events = await hass.async_add_executor_job(_load_ics, path, start, end)
+        except (OSError, UnicodeDecodeError) as err:
+            LOGGER.warning("Cannot read the blackout file %s: %s", path, err)
+            complete = False
+        else:
+            for first, last in events:
+                index.add_range(first, last)
+    if config.blackout_calendar:
+        try:
+            events = await _async_calendar_events(
+                hass, config.blackout_calendar, start, end
+            )
+        except HomeAssistantError as err:
+            LOGGER.warning(
+                "Cannot read the blackout calendar %s: %s",
+                config.blackout_calendar,
+                err,
+            )
+            complete = False
+        else:
+            for first, last in events:
+                index.add_range(first, last)
+    return index, complete
+
+
+async def async_blackout_index(
+    hass: HomeAssistant, config: ChoreConfig
+) -> BlackoutIndex | None:
+    """Return the blackout index of a chore, None if it has no blackout dates.
+
+    Indexes are cached for the day and shared by chores with the same sources.
+    An index missing a source that could not be read is built again on the
+    next call.
+    """
+    if not config.blackout:
+        return None
+    today = helpers.now().date()
+    key = (config.blackout_dates, config.blackout_file, config.blackout_calendar)
+    # The preview of the first chore runs before the integration is set up
+    cache: dict[tuple, tuple[date, asyncio.Future[tuple[BlackoutIndex, bool]]]] = (
+        hass.data.setdefault(const.DOMAIN, {}).setdefault(const.BLACKOUTS, {})
+    )
+    cached = cache.get(key)
+    if cached is None or cached[0] != today:
+        # Chores starting together wait for the same read
+        cached = today, hass.async_create_task(_async_build_index(hass, config, today))
+        cache[key] = cached
+    index, complete = await cached[1]
+    if not complete and cache.get(key) is cached:
+        del cache[key]
+    return index
@@ -3,27 +3,59 @@
 from __future__ import annotations
 import contextlib
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import Throttle
+from homeassistant.util.dt import as_local
 
 from .const import CALENDAR_NAME, CALENDAR_PLATFORM, DOMAIN, SENSOR_PLATFORM
+from .metrics import (
+    SECTION_CALENDAR,
+    integration_metrics,
+    integration_throughput,
+)
+
+if TYPE_CHECKING:
+    from .chore import Chore
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=1)
+# Length of the events of chores with a due time
+EVENT_DURATION = timedelta(hours=1)
 
 
 # pylint: disable=unused-argument
-async def async_setup_entry(
-    _: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+async def async_setup_platform(
+    _: HomeAssistant,
+    __: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
-    """Add calendar entity to HA."""
+    """Add the calendar entity, once for the whole integration."""
+    if discovery_info is None:
+        return
     async_add_entities([ChoreCalendar()], True)
 
 
+def chore_event(chore: Chore, day: date) -> CalendarEvent:
+    """Return the event of a chore on a day, at its due time if it has one.
+
+    Sub-daily chores pass the due time itself.
+    """
+    name = chore.name if chore.name is not None else "Unknown"
+    if isinstance(day, datetime):
+        start = day
+    elif (due_time := chore.due_time) is None:
+        return CalendarEvent(summary=name, start=day, end=day + timedelta(days=1))
+    else:
+        start = as_local(datetime.combine(day, due_time))
+    return CalendarEvent(summary=name, start=start, end=start + EVENT_DURATION)
+
+
 class ChoreCalendar(CalendarEntity):
     """The chore helper calendar class."""
 
@@ -94,54 +126,71 @@ class EntitiesCalendarData:
         events: list[CalendarEvent] = []
         if SENSOR_PLATFORM not in hass.data[DOMAIN]:
             return events
-        start_date = start_datetime.date()
-        end_date = end_datetime.date()
-        for entity in self.entities:
-            if (
-                entity not in hass.data[DOMAIN][SENSOR_PLATFORM]
-                or hass.data[DOMAIN][SENSOR_PLATFORM][entity].hidden
-            ):
-                continue
-            chore = hass.data[DOMAIN][SENSOR_PLATFORM][entity]
-            start = chore.get_next_due_date(start_date, True)
-            today = datetime.now().date()
-            while start is not None and start_date <= start <= end_date:
-                if chore.show_overdue_today and (start < today):
-                    start = today
-
-                try:
-                    end = start + timedelta(days=1)
-                except TypeError:
-                    end = start
-                name = chore.name if chore.name is not None else "Unknown"
-                event = CalendarEvent(
-                    summary=name,
-                    start=start,
-                    end=end,
-                )
-                events.append(event)
-                start = chore.get_next_due_date(start + timedelta(days=1), True)
+        metrics = integration_metrics(hass)
+        with metrics.timed(SECTION_CALENDAR):
+            start_date = start_datetime.date()
+            end_date = end_datetime.date()
+            chores = hass.data[DOMAIN][SENSOR_PLATFORM]
+            shown = [
+                chore
+                for entity in self.entities
+                if (chore := chores.get(entity)) is not None and not chore.hidden
+            ]
+            events = self._events(shown, start_date, end_date)
+        integration_throughput(hass).calendar_queries.add(
+            metrics.timings[SECTION_CALENDAR].last
+        )
+        return events
+
+    @classmethod
+    def _events(
+        cls, chores: list[Chore], start_date: date, end_date: date
+    ) -> list[CalendarEvent]:
+        """Get the events of several chores.
+
+        This stays on the event loop: it reads the state of the chores, and a
+        chore has a single next due date, so the work is one event per chore.
+        """
+        events: list[CalendarEvent] = []
+        for chore in chores:
+            with chore.metrics.timed(SECTION_CALENDAR):
+                events.extend(cls._chore_events(chore, start_date, end_date))
+        return events
+
+    @staticmethod
+    def _chore_events(
+        chore: Chore, start_date: date, end_date: date
+    ) -> list[CalendarEvent]:
+        """Get the events of one chore in a specific time frame."""
+        if (due_times := chore.due_times) is not None:
+            return [
+                chore_event(chore, due_time)
+                for due_time in due_times
+                if start_date <= due_time.date() <= end_date
+            ]
+        events: list[CalendarEvent] = []
+        start = chore.get_next_due_date(start_date, True)
+        today = datetime.now().date()
+        while start is not None and start_date <= start <= end_date:
+            if chore.show_overdue_today and (start < today):
+                start = today
+            events.append(chore_event(chore, start))
+            start = chore.get_next_due_date(start + timedelta(days=1), True)
         return events
 
     @Throttle(MIN_TIME_BETWEEN_UPDATES)
     async def async_update(self) -> None:
         """Get the latest data."""
+        chores = self._hass.data[DOMAIN][SENSOR_PLATFORM]
         next_due_dates = {}
         for entity in self.entities:
-            if (
-                self._hass.data[DOMAIN][SENSOR_PLATFORM][entity].next_due_date
-                is not None
+            if (chore := chores.get(entity)) is not None and (
+                chore.next_due_date is not None
             ):
-                next_due_dates[entity] = self._hass.data[DOMAIN][SENSOR_PLATFORM][
-                    entity
-                ].next_due_date
+                next_due_dates[entity] = chore.next_due_date
         if len(next_due_dates) > 0:
             entity_id = min(next_due_dates.keys(), key=lambda k: next_due_dates[k])
-            start = next_due_dates[entity_id]
-            end = start + timedelta(days=1)
-            name = self._hass.data[DOMAIN][SENSOR_PLATFORM][entity_id].name
-            self.event = CalendarEvent(
-                summary=name,
-                start=start,
-                end=end,
+            chore = chores[entity_id]
+            self.event = chore_event(
+                chore, chore.due_times[0] if chore.due_times else chore.next_due_date
             )
@@ -2,88 +2,120 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Generator
+from dataclasses import astuple
 from datetime import date, datetime, time, timedelta
+import json
+from time import monotonic
 from typing import Any
-from collections.abc import Generator
-from dateutil.relativedelta import relativedelta
+import zlib
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
-    ATTR_UNIT_OF_MEASUREMENT,
     ATTR_HIDDEN,
+    ATTR_UNIT_OF_MEASUREMENT,
     CONF_NAME,
 )
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.util.dt import (
-    now as ha_now,
-)  # Import Home Assistant's timezone-aware `now`
+from homeassistant.helpers.start import async_at_started
 from homeassistant.util.dt import (
     as_local,
-)  # Import function to convert to local timezone
+    now as ha_now,  # Home Assistant's timezone-aware `now`
+    start_of_local_day,
+)
 
-from . import const, helpers
+from . import blackout, const, helpers, registry, tracing
+from .chore_config import ChoreConfig
 from .const import LOGGER
-from .calendar import EntitiesCalendarData
-
-PLATFORMS: list[str] = [const.CALENDAR_PLATFORM]
+from .events import loaded_events
+from .metrics import SECTION_SCHEDULE, SECTION_STATE, Metrics, integration_throughput
+from .stats import CompletionStats
+from .timer import due_timer
+from .workload import WorkloadTracker
 
 
 class Chore(RestoreEntity):
     """Chore Sensor class."""
 
-    __slots__ = (
-        "_attr_icon",
-        "_attr_name",
-        "_attr_state",
-        "_due_dates",
-        "_date_format",
-        "_days",
-        "_first_month",
-        "_hidden",
-        "_icon_normal",
-        "_icon_today",
-        "_icon_tomorrow",
-        "_icon_overdue",
-        "_last_month",
-        "_last_updated",
-        "_manual",
-        "_next_due_date",
-        "_forecast_dates",
-        "_overdue",
-        "_overdue_days",
-        "_frequency",
-        "_start_date",
-        "_offset_dates",
-        "_add_dates",
-        "_remove_dates",
-        "show_overdue_today",
-        "config_entry",
-        "_assignee_user_id",
-        "_auto_assign",
-        "_last_assigned_user_id",
-        "last_completed",
+    # State transitions are driven by the integration timer
+    _attr_should_poll = False
+
+    # Bulky or slowly changing attributes that are not worth a recorder row
+    _unrecorded_attributes = frozenset(
+        {
+            const.ATTR_LAST_UPDATED,
+            const.ATTR_OFFSET_DATES,
+            const.ATTR_ADD_DATES,
+            const.ATTR_REMOVE_DATES,
+            const.ATTR_ASSIGNEE_FORECAST,
+            const.ATTR_RECENT_COMPLETIONS,
+            const.ATTR_INTERVAL_MEAN,
+            const.ATTR_INTERVAL_STDEV,
+            const.ATTR_LATENESS_MEAN,
+            const.ATTR_ON_TIME_RATIO,
+        }
     )
 
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Read configuration and initialise class variables."""
         config = config_entry.options
         self.config_entry = config_entry
+        entry_data = getattr(config_entry, "data", None) or {}
+        # unique_id is in the data of legacy config entries
+        self._unique_id: str = entry_data.get("unique_id", config_entry.entry_id)
+        self._read_options(config_entry)
+        self._due_dates: list[date] = []
+        self._next_due_date: date | None = None
+        self._last_updated: datetime | None = None
+        self.last_completed: datetime | None = None
+        self._days: int | None = None
+        self._overdue: bool = False
+        self._overdue_days: int | None = None
+        self._attr_state = self._days
+        self._attr_icon = self._icon_normal
+        self._offset_dates: str = None
+        self._add_dates: str = None
+        self._remove_dates: str = None
+
+        # Assignment state
+        self._assignee_user_id: str | None = config.get(const.CONF_ASSIGNEE_USER)
+        self._last_assigned_user_id: str | None = None
+        self._roster: tuple[str, ...] = ()
+        self._projection: dict[str, str | None] = {}
+        self._projection_key: tuple | None = None
+        self._stats = CompletionStats()
+        self._next_due_datetime_cache: tuple[date | None, datetime | None] = (
+            None,
+            None,
+        )
+        self._attributes: dict[str, Any] | None = None
+        self._fingerprint: int | None = None
+        self._written_fingerprint: int | None = None
+        self.suppressed_writes = 0
+        self.metrics = Metrics()
+        self._trace: deque[dict[str, Any]] | None = None
+        self._blackout: blackout.BlackoutIndex | None = None
+        self.last_compute: datetime | None = None
+        self._warm_started = False
+
+    def _read_options(self, config_entry: ConfigEntry) -> None:
+        """Read the settings from the config entry options.
+
+        The schedule settings are parsed into a shared ChoreConfig. This runs
+        again when the options change, so it must not touch the runtime state.
+        """
+        config = config_entry.options
         self._attr_name = (
             config_entry.title
             if config_entry.title is not None
             else config.get(CONF_NAME)
         )
+        self._config = ChoreConfig.from_options(config)
         self._hidden = config.get(ATTR_HIDDEN, False)
         self._manual = config.get(const.CONF_MANUAL)
-        first_month = config.get(const.CONF_FIRST_MONTH, const.DEFAULT_FIRST_MONTH)
-        months = [m["value"] for m in const.MONTH_OPTIONS]
-        self._first_month: int = (
-            months.index(first_month) + 1 if first_month in months else 1
-        )
-        last_month = config.get(const.CONF_LAST_MONTH, const.DEFAULT_LAST_MONTH)
-        self._last_month: int = (
-            months.index(last_month) + 1 if last_month in months else 12
-        )
         self._icon_normal = config.get(const.CONF_ICON_NORMAL)
         self._icon_today = config.get(const.CONF_ICON_TODAY)
         self._icon_tomorrow = config.get(const.CONF_ICON_TOMORROW)
@@ -91,35 +123,18 @@ class Chore(RestoreEntity):
         self._date_format = config.get(
             const.CONF_DATE_FORMAT, const.DEFAULT_DATE_FORMAT
         )
-        self._forecast_dates: int = config.get(const.CONF_FORECAST_DATES) or 0
         self.show_overdue_today: bool = (
             config.get(const.CONF_SHOW_OVERDUE_TODAY) or False
         )
-        self._due_dates: list[date] = []
-        self._next_due_date: date | None = None
-        self._last_updated: datetime | None = None
-        self.last_completed: datetime | None = None
-        self._days: int | None = None
-        self._overdue: bool = False
-        self._overdue_days: int | None = None
-        self._frequency: str = config.get(const.CONF_FREQUENCY)
-        self._attr_state = self._days
-        self._attr_icon = self._icon_normal
-        self._start_date: date | None
-        self._offset_dates: str = None
-        self._add_dates: str = None
-        self._remove_dates: str = None
-        try:
-            self._start_date = helpers.to_date(config.get(const.CONF_START_DATE))
-        except ValueError:
-            self._start_date = None
 
         # Assignment configuration
-        self._assignee_user_id: str | None = config.get(const.CONF_ASSIGNEE_USER)
         self._auto_assign: bool = config.get(
             const.CONF_AUTO_ASSIGN, const.DEFAULT_AUTO_ASSIGN
         )
-        self._last_assigned_user_id: str | None = None
+        self._assign_strategy: str = config.get(
+            const.CONF_ASSIGN_STRATEGY, const.DEFAULT_ASSIGN_STRATEGY
+        )
+        self._effort: float = config.get(const.CONF_EFFORT, const.DEFAULT_EFFORT)
 
     async def async_added_to_hass(self) -> None:
         """When sensor is added to HA, restore state and add it to calendar."""
@@ -136,10 +151,18 @@ class Chore(RestoreEntity):
 
         LOGGER.debug("Entity ID assigned: %s", self.entity_id)
 
-        self.hass.data[const.DOMAIN][const.SENSOR_PLATFORM][self.entity_id] = self
-
-        # Restore stored state
-        if (state := await self.async_get_last_state()) is not None:
+        registry.register(self.hass, self)
+        # A re-added entity has a new state object to write
+        self._written_fingerprint = None
+        self.set_tracing(tracing.is_traced(self.hass, self.entity_id))
+
+        # Restore stored state, preferring the integration state file
+        state_store = self.hass.data[const.DOMAIN].get(const.STATE_STORE)
+        if state_store is not None and (
+            stored := state_store.get(self.unique_id)
+        ) is not None:
+            self._restore_runtime_state(stored)
+        elif (state := await self.async_get_last_state()) is not None:
             self._last_updated = None  # Unblock update - after options change
             self._attr_state = state.state
             self._days = state.attributes.get(const.ATTR_DAYS, None)
@@ -169,35 +192,206 @@ class Chore(RestoreEntity):
                 const.ATTR_LAST_ASSIGNED, None
             )
 
-        # Create or add to calendar
-        if not self.hidden:
-            if const.CALENDAR_PLATFORM not in self.hass.data[const.DOMAIN]:
-                self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM] = (
-                    EntitiesCalendarData(self.hass)
-                )
-                LOGGER.debug("Creating chore calendar")
-                await self.hass.config_entries.async_forward_entry_setups(
-                    self.config_entry, PLATFORMS
-                )
+        self._invalidate_attributes()
+        self._warm_start()
+        self._schedule_transition()
+        self.async_on_remove(async_at_started(self.hass, self._async_hass_started))
 
+        # Add to the calendar, set up by the integration
+        if not self.hidden:
             self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM].add_entity(
                 self.entity_id
             )
 
+    def _runtime_state(self) -> dict[str, Any]:
+        """Return the durable runtime state of the chore."""
+        return {
+            "state": self._attr_state,
+            const.ATTR_DAYS: self._days,
+            const.ATTR_OVERDUE: self._overdue,
+            const.ATTR_OVERDUE_DAYS: self._overdue_days,
+            const.ATTR_LAST_COMPLETED: (
+                self.last_completed.isoformat()
+                if isinstance(self.last_completed, datetime)
+                else None
+            ),
+            const.ATTR_NEXT_DATE: (
+                self._next_due_date.isoformat() if self._next_due_date else None
+            ),
+            const.ATTR_OFFSET_DATES: self._offset_dates,
+            const.ATTR_ADD_DATES: self._add_dates,
+            const.ATTR_REMOVE_DATES: self._remove_dates,
+            const.ATTR_ASSIGNEE: self._assignee_user_id,
+            const.ATTR_LAST_ASSIGNED: self._last_assigned_user_id,
+            "stats": self._stats.as_dict(),
+        }
+
+    def _restore_runtime_state(self, stored: dict[str, Any]) -> None:
+        """Restore the runtime state saved by _runtime_state."""
+        self._last_updated = None  # Unblock update - after options change
+        self._attr_state = stored.get("state")
+        self._days = stored.get(const.ATTR_DAYS)
+        self._overdue = stored.get(const.ATTR_OVERDUE, False)
+        self._overdue_days = stored.get(const.ATTR_OVERDUE_DAYS)
+        if (next_due_date := stored.get(const.ATTR_NEXT_DATE)) is not None:
+            self._next_due_date = date.fromisoformat(next_due_date)
+        if (last_completed := stored.get(const.ATTR_LAST_COMPLETED)) is not None:
+            self.last_completed = helpers.parse_datetime(last_completed)
+        self._offset_dates = stored.get(const.ATTR_OFFSET_DATES)
+        self._add_dates = stored.get(const.ATTR_ADD_DATES)
+        self._remove_dates = stored.get(const.ATTR_REMOVE_DATES)
+        self._assignee_user_id = stored.get(
+            const.ATTR_ASSIGNEE, self._assignee_user_id
+        )
+        self._last_assigned_user_id = stored.get(const.ATTR_LAST_ASSIGNED)
+        if (stats := stored.get("stats")) is not None:
+            self._stats = CompletionStats.from_dict(stats)
+
+    def _save_runtime_state(self) -> None:
+        """Hand the runtime state to the integration state file."""
+        state_store = self.hass.data[const.DOMAIN].get(const.STATE_STORE)
+        if state_store is not None:
+            state_store.set(self.unique_id, self._runtime_state())
+
+    def _schedule_fingerprint(self) -> int:
+        """Return a checksum of everything the schedule is computed from.
+
+        It is stored across restarts, so it cannot use the salted hash().
+        Only the parsed schedule options count, so renaming the chore or
+        changing its icon keeps the snapshot.
+        """
+        inputs = [
+            type(self).__name__,
+            astuple(self._config),
+            self.last_completed.isoformat() if self.last_completed else None,
+            self._offset_dates,
+            self._add_dates,
+            self._remove_dates,
+        ]
+        return zlib.crc32(json.dumps(inputs, sort_keys=True, default=str).encode())
+
+    def _save_schedule_snapshot(self) -> None:
+        """Hand the computed due dates to the schedule snapshot."""
+        snapshot = self.hass.data[const.DOMAIN].get(const.SCHEDULE_SNAPSHOT)
+        if snapshot is not None:
+            snapshot.set(
+                self.unique_id,
+                self._schedule_fingerprint(),
+                ha_now().date(),
+                self._due_dates,
+            )
+
+    def _warm_start(self) -> None:
+        """Serve the due dates computed before a restart, if still valid.
+
+        The state is then available at once, and the first update is skipped
+        as the chore counts as updated today. What that update does besides
+        the schedule is left to _async_finish_warm_start.
+        """
+        snapshot = self.hass.data[const.DOMAIN].get(const.SCHEDULE_SNAPSHOT)
+        if snapshot is None or self._manual:
+            return
+        due_dates = snapshot.get(
+            self.unique_id, self._schedule_fingerprint(), ha_now().date()
+        )
+        if due_dates is None:
+            return
+        LOGGER.debug("(%s) Serving the schedule snapshot", self._attr_name)
+        self._due_dates = due_dates
+        self._warm_started = True
+        # Home Assistant writes the state once the entity is added
+        self._update_state(write=False)
+
     async def async_will_remove_from_hass(self) -> None:
         """When sensor is removed from HA, remove it and its calendar entity."""
         await super().async_will_remove_from_hass()
-        del self.hass.data[const.DOMAIN][const.SENSOR_PLATFORM][self.entity_id]
+        registry.unregister(self.hass, self)
+        integration_throughput(self.hass).removed_loop_time += self.metrics.loop_total
+        due_timer(self.hass).cancel(self.unique_id)
+        self._workload_tracker().remove(self.config_entry.entry_id)
+        loaded_events(self.hass).forget(self.entity_id)
         self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM].remove_entity(
             self.entity_id
         )
 
+    @callback
+    def _async_hass_started(self, _: HomeAssistant) -> None:
+        """Run the first update once Home Assistant has started."""
+        if self._warm_started:
+            self.hass.async_create_task(self._async_finish_warm_start())
+        else:
+            self.async_schedule_update_ha_state(True)
+
+    async def _async_finish_warm_start(self) -> None:
+        """Load what the skipped first update would have, fire the event."""
+        self._warm_started = False
+        await self._async_load_blackout()
+        if self._auto_assign:
+            await self._async_assignment_candidates()
+        self.update_state()
+        loaded_events(self.hass).loaded(self.entity_id, self._due_dates)
+
+    def _schedule_transition(self) -> None:
+        """Arm the next state change: the due time today, or midnight."""
+        now = ha_now()
+        when = start_of_local_day(now.date() + timedelta(days=1))
+        if (due := self._next_due_datetime()) is not None and now < due < when:
+            when = due
+        due_timer(self.hass).schedule(self.unique_id, when, self._transition)
+
+    @callback
+    def _transition(self, _: datetime) -> None:
+        """Refresh the chore on a new day, or update its state at the due time."""
+        self._schedule_transition()
+        if (
+            self._manual
+            or self._last_updated is None
+            or self._last_updated.date() != ha_now().date()
+        ):
+            self.async_schedule_update_ha_state(True)
+        else:
+            self.update_state()
+
+    @property
+    def due_time(self) -> time | None:
+        """Return the time of day the chore is due, None for the whole day."""
+        return self._config.due_time
+
+    @property
+    def due_times(self) -> list[datetime] | None:
+        """Return the forecast due times of sub-daily chores, None otherwise."""
+        return None
+
+    @property
+    def _timed(self) -> bool:
+        """Return True if the chore is due at a time rather than a day."""
+        return self._config.due_time is not None
+
+    @callback
+    def apply_options(self) -> None:
+        """Apply changed options in place, without recreating the entity."""
+        was_hidden, config = self._hidden, self._config
+        self._read_options(self.config_entry)
+        if self._hidden != was_hidden:
+            calendar = self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM]
+            if self._hidden:
+                calendar.remove_entity(self.entity_id)
+            else:
+                calendar.add_entity(self.entity_id)
+        if self._config is config and not self._manual:
+            # Same schedule: only the presentation changed
+            self.update_state()
+            return
+        self._last_updated = None  # Unblock update
+        self._projection_key = None
+        self._next_due_datetime_cache = (None, None)
+        self._invalidate_attributes()
+        self.async_schedule_update_ha_state(True)
+
     @property
     def unique_id(self) -> str:
         """Return a unique ID to use for this sensor."""
-        if "unique_id" in self.config_entry.data:  # From legacy config
-            return self.config_entry.data["unique_id"]
-        return self.config_entry.entry_id
+        return self._unique_id
 
     @property
     def name(self) -> str | None:
@@ -261,35 +455,114 @@ class Chore(RestoreEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+        """Return the state attributes, built once per change.
+
+        The assignee forecast is not part of the cache: it also follows the
+        workload of other chores, which does not invalidate the attributes.
+        """
+        if self._attributes is None:
+            self.metrics.cache_access("attributes", False)
+            self._attributes = self._build_state_attributes()
+        else:
+            self.metrics.cache_access("attributes", True)
+        return {
+            **self._attributes,
+            const.ATTR_ASSIGNEE_FORECAST: self.projected_assignees(),
+        }
+
+    def _invalidate_attributes(self) -> None:
+        """Mark the state attributes as changed."""
+        self._attributes = None
+        self._fingerprint = None
+
+    def _state_fingerprint(self) -> int:
+        """Return a hash of the state content, computed once per change.
+
+        last_updated is left out: a write that only moves it is not worth a
+        state change. The assignee forecast is hashed on each call, as it is
+        not cached with the other attributes.
+        """
+        if self._fingerprint is None:
+            attributes = {
+                key: value
+                for key, value in self.extra_state_attributes.items()
+                if key not in (const.ATTR_LAST_UPDATED, const.ATTR_ASSIGNEE_FORECAST)
+            }
+            self._fingerprint = hash(
+                (
+                    self._attr_state,
+                    self._attr_icon,
+                    self._attr_name,
+                    self.available,
+                    helpers.freeze(attributes),
+                )
+            )
+        return hash((self._fingerprint, helpers.freeze(self.projected_assignees())))
+
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write the state, unless it is identical to the last one written.
+
+        Only the chore's own state updates go through here; updates that Home
+        Assistant writes itself do not, so they are neither written twice nor
+        counted as suppressed.
+        """
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._written_fingerprint:
+            self.suppressed_writes += 1
+            return
+        self._written_fingerprint = fingerprint
+        self.async_write_ha_state()
+        integration_throughput(self.hass).state_writes.add()
+
+    def _build_state_attributes(self) -> dict[str, Any]:
+        """Build the state attributes."""
         return {
             const.ATTR_LAST_COMPLETED: self.last_completed,
             const.ATTR_LAST_UPDATED: self.last_updated,
             const.ATTR_OVERDUE: self.overdue,
             const.ATTR_OVERDUE_DAYS: self.overdue_days,
-            const.ATTR_NEXT_DATE: (
-                as_local(datetime.combine(self.next_due_date, time.min))
-                if self.next_due_date
-                else None
-            ),
+            const.ATTR_NEXT_DATE: self._next_due_datetime(),
             const.ATTR_OFFSET_DATES: self.offset_dates,
             const.ATTR_ADD_DATES: self.add_dates,
             const.ATTR_REMOVE_DATES: self.remove_dates,
             ATTR_UNIT_OF_MEASUREMENT: self.native_unit_of_measurement,
             # Needed for translations to work
             ATTR_DEVICE_CLASS: self.DEVICE_CLASS,
-            # Include frequency and period explicitly
-            const.ATTR_FREQUENCY: self._frequency,
-            "period": getattr(self, "_period", None),  # Ensure period is included
-            # Include other initial settings
-            const.ATTR_START_DATE: self._start_date,
-            const.ATTR_FORECAST_DATES: self._forecast_dates,
-            const.ATTR_SHOW_OVERDUE_TODAY: self.show_overdue_today,
             const.ATTR_ASSIGNEE: self._assignee_user_id,
             const.ATTR_LAST_ASSIGNED: self._last_assigned_user_id,
+            **self._stats.as_attributes(),
+        }
+
+    @property
+    def settings(self) -> dict[str, Any]:
+        """Return the configured settings, reported through diagnostics."""
+        return {
+            const.ATTR_FREQUENCY: self._config.frequency,
+            const.CONF_PERIOD: self._config.period,
+            const.ATTR_START_DATE: self._config.start_date,
+            const.ATTR_FORECAST_DATES: self._config.forecast_dates,
+            const.ATTR_SHOW_OVERDUE_TODAY: self.show_overdue_today,
             const.ATTR_AUTO_ASSIGN: self._auto_assign,
+            const.CONF_ASSIGN_STRATEGY: self._assign_strategy,
+            const.ATTR_EFFORT: self._effort,
         }
 
+    def _next_due_datetime(self) -> datetime | None:
+        """Return the next due date and time, converted once per date."""
+        if self._next_due_date is None:
+            return None
+        if self._next_due_datetime_cache[0] != self._next_due_date:
+            self._next_due_datetime_cache = (
+                self._next_due_date,
+                as_local(
+                    datetime.combine(
+                        self._next_due_date, self._config.due_time or time.min
+                    )
+                ),
+            )
+        return self._next_due_datetime_cache[1]
+
     @property
     def DEVICE_CLASS(self) -> str:  # pylint: disable=C0103
         """Return the class of the sensor."""
@@ -337,9 +610,10 @@ class Chore(RestoreEntity):
     def date_inside(self, dat: date) -> bool:
         """Check if the date is inside first and last date."""
         month = dat.month
-        if self._first_month <= self._last_month:
-            return bool(self._first_month <= month <= self._last_month)
-        return bool(self._first_month <= month or month <= self._last_month)
+        first_month, last_month = self._config.first_month, self._config.last_month
+        if first_month <= last_month:
+            return bool(first_month <= month <= last_month)
+        return bool(first_month <= month or month <= last_month)
 
     def move_to_range(self, day: date) -> date:
         """If the date is not in range, move to the range."""
@@ -347,27 +621,40 @@ class Chore(RestoreEntity):
             year = day.year
             month = day.month
             months = [m["label"] for m in const.MONTH_OPTIONS]
-            if self._first_month <= self._last_month < month:
-                LOGGER.debug(
-                    "(%s) %s outside the range, looking from %s next year",
-                    self._attr_name,
-                    day,
-                    months[self._first_month - 1],
+            if self._config.first_month <= self._config.last_month < month:
+                if self._trace is not None:
+                    self._trace_event(
+                        "move_to_range",
+                        day=day,
+                        month=months[self._config.first_month - 1],
+                        next_year=True,
+                    )
+                return date(year + 1, self._config.first_month, 1)
+            if self._trace is not None:
+                self._trace_event(
+                    "move_to_range",
+                    day=day,
+                    month=months[self._config.first_month - 1],
                 )
-                return date(year + 1, self._first_month, 1)
-            LOGGER.debug(
-                "(%s) %s outside the range, searching from %s",
-                self._attr_name,
-                day,
-                months[self._first_month - 1],
-            )
-            return date(year, self._first_month, 1)
+            return date(year, self._config.first_month, 1)
         return day
 
-    def chore_schedule(self) -> Generator[date, None, None]:
-        """Get dates within configured date range."""
+    def chore_schedule(
+        self, from_date: date | None = None
+    ) -> Generator[date, None, None]:
+        """Get dates within configured date range, optionally from a date.
+
+        Overrides are matched on day ordinals; dates are only built for the
+        dates yielded. Dates on blackout days are skipped or shifted, added
+        dates are kept as they are.
+        """
+        removed = helpers.date_ordinal_set(self._remove_dates)
+        offsets = helpers.offset_ordinals(self._offset_dates)
+        blackouts, shift = self._blackout, self._config.blackout_shift
         start_date: date = self._calculate_start_date()
-        for _ in range(int(self._forecast_dates) + 1):
+        if from_date is not None and from_date > start_date:
+            start_date = from_date
+        for _ in range(int(self._config.forecast_dates) + 1):
             try:
                 next_due_date = self._find_candidate_date(start_date)
             except (TypeError, ValueError):
@@ -376,42 +663,48 @@ class Chore(RestoreEntity):
                 break
             if (new_date := self.move_to_range(next_due_date)) != next_due_date:
                 start_date = new_date
-            else:
-                should_remove = False
-                if self._remove_dates is not None:
-                    for remove_date in self._remove_dates.split(" "):
-                        if remove_date == (next_due_date.strftime("%Y-%m-%d")):
-                            should_remove = True
-                            break
-                if not should_remove:
-                    offset = None
-                    if self._offset_dates is not None:
-                        offset_compare = next_due_date.strftime("%Y-%m-%d")
-                        for offset_date in self._offset_dates.split(" "):
-                            if offset_date.startswith(offset_compare):
-                                offset = int(offset_date.split(":")[1])
-                                break
-                    yield (
-                        next_due_date
-                        if offset is None
-                        else next_due_date + relativedelta(days=offset)
-                    )
-                start_date = next_due_date + relativedelta(
-                    days=1
-                )  # look from the next day
-        if self._add_dates is not None:
-            for add_date_str in self._add_dates.split(" "):
-                yield datetime.strptime(add_date_str, "%Y-%m-%d").date()
-        return
-
-    async def complete(self, last_completed: datetime) -> None:
+                continue
+            ordinal = next_due_date.toordinal()
+            if ordinal not in removed:
+                offset = offsets.get(ordinal)
+                due_date: date | None = (
+                    next_due_date
+                    if offset is None
+                    else date.fromordinal(ordinal + offset)
+                )
+                if blackouts is not None:
+                    due_date = blackouts.resolve(due_date, shift)
+                if due_date is not None:
+                    yield due_date
+            start_date = date.fromordinal(ordinal + 1)  # look from the next day
+        for ordinal in helpers.date_ordinals(self._add_dates):
+            yield date.fromordinal(ordinal)
+
+    async def complete(
+        self, last_completed: datetime, completed_by: str | None = None
+    ) -> None:
         """Mark the chore as completed and update the state."""
         LOGGER.debug(
             "(%s) Completing chore with last_completed: %s",
             self._attr_name,
             last_completed,
         )
+        if last_completed is not None:
+            lateness = (
+                (last_completed.date() - self._next_due_date).days
+                if self._next_due_date is not None
+                else None
+            )
+            self._stats.add(last_completed, lateness)
+            if (ledger := self.hass.data[const.DOMAIN].get(const.LEDGER)) is not None:
+                ledger.record(
+                    self.unique_id,
+                    completed_by or self._assignee_user_id,
+                    last_completed,
+                    lateness,
+                )
         self.last_completed = last_completed
+        await self._async_load_blackout()
         await self._async_load_due_dates()
         if not self._due_dates:
             LOGGER.warning(
@@ -419,39 +712,10 @@ class Chore(RestoreEntity):
                 self._attr_name,
             )
 
-        # Assignment logic: if auto_assign is enabled, rotate assignment among person entities
+        # Assignment logic: if auto_assign is enabled, pick the next person entity
         if self._auto_assign:
             try:
-                # Fetch all person entities
-                states = (
-                    self.hass.states.async_all()
-                    if hasattr(self.hass.states, "async_all")
-                    else self.hass.states
-                )
-                persons = [
-                    s
-                    for s in states
-                    if getattr(s, "entity_id", "").startswith("person.")
-                ]
-
-                # Prefer persons linked to active users when possible
-                try:
-                    users = await self.hass.auth.async_get_users()
-                    eligible_user_ids = [
-                        u.id
-                        for u in users
-                        if not getattr(u, "is_system", False)
-                        and getattr(u, "is_active", True)
-                    ]
-                    linked_persons = [
-                        p
-                        for p in persons
-                        if p.attributes.get("user_id") in eligible_user_ids
-                    ]
-                except Exception:
-                    linked_persons = []
-
-                candidates = linked_persons or persons
+                candidates = await self._async_assignment_candidates()
 
                 if not candidates:
                     LOGGER.warning(
@@ -460,21 +724,7 @@ class Chore(RestoreEntity):
                     )
                     self._assignee_user_id = None
                 else:
-                    # Deterministic order by person friendly name (fallback to entity_id)
-                    candidates.sort(
-                        key=lambda p: (
-                            (getattr(p, "name", "") or "").lower(),
-                            p.entity_id,
-                        )
-                    )
-                    next_person = None
-                    if self._last_assigned_user_id is not None:
-                        ids = [p.entity_id for p in candidates]
-                        if self._last_assigned_user_id in ids:
-                            idx = ids.index(self._last_assigned_user_id)
-                            next_person = candidates[(idx + 1) % len(candidates)]
-                    if next_person is None:
-                        next_person = candidates[0]
+                    next_person = self._next_assignee(candidates)
 
                     self._assignee_user_id = next_person.entity_id
                     self._last_assigned_user_id = next_person.entity_id
@@ -500,23 +750,177 @@ class Chore(RestoreEntity):
 
         self.update_state()
 
-    async def _async_load_due_dates(self) -> None:
-        """Load due dates based on the last completed date."""
-        LOGGER.debug(
-            "(%s) Loading due dates. Last completed: %s, Start date: %s",
-            self._attr_name,
+    async def _async_assignment_candidates(self) -> list[Any]:
+        """Return person states eligible for assignment, in rotation order."""
+        # Fetch all person entities
+        states = (
+            self.hass.states.async_all()
+            if hasattr(self.hass.states, "async_all")
+            else self.hass.states
+        )
+        persons = [
+            s for s in states if getattr(s, "entity_id", "").startswith("person.")
+        ]
+
+        # Prefer persons linked to active users when possible
+        try:
+            users = await self.hass.auth.async_get_users()
+            eligible_user_ids = [
+                u.id
+                for u in users
+                if not getattr(u, "is_system", False) and getattr(u, "is_active", True)
+            ]
+            linked_persons = [
+                p for p in persons if p.attributes.get("user_id") in eligible_user_ids
+            ]
+        except Exception:
+            linked_persons = []
+
+        candidates = linked_persons or persons
+        # Deterministic order by person friendly name (fallback to entity_id)
+        candidates.sort(
+            key=lambda p: (
+                (getattr(p, "name", "") or "").lower(),
+                p.entity_id,
+            )
+        )
+        self._roster = tuple(p.entity_id for p in candidates)
+        return candidates
+
+    def projected_assignees(self) -> dict[str, str | None]:
+        """Return the projected assignee for each forecast occurrence.
+
+        The current assignee does the next occurrence; later ones follow the
+        assignment strategy, as _next_assignee would apply it. The result is
+        cached until the schedule, the roster or the rotation state change.
+        """
+        least_loaded = self._assign_strategy == const.ASSIGN_STRATEGY_LEAST_LOADED
+        order: tuple[str, ...] = self._roster
+        loads: dict[str, float] = {}
+        if self._auto_assign and least_loaded and self.hass is not None:
+            order = tuple(self._least_loaded_order(list(self._roster)))
+            tracker = self._workload_tracker()
+            loads = {person: tracker.load(person) for person in order}
+            # This chore must not count against its current assignee
+            held = tracker.assignment(self.config_entry.entry_id)
+            if held is not None and held[0] in loads:
+                loads[held[0]] -= held[1]
+        key = (
+            self._next_due_date,
+            tuple(self._due_dates),
             self.last_completed,
-            self._start_date,
+            self._offset_dates,
+            self._add_dates,
+            self._remove_dates,
+            self._config,
+            self._blackout,
+            self._roster,
+            self._assignee_user_id,
+            self._auto_assign,
+            self._assign_strategy,
+            order,
+            tuple(loads.values()),
         )
+        if key == self._projection_key:
+            self.metrics.cache_access("assignee_forecast", True)
+            return self._projection
+        self.metrics.cache_access("assignee_forecast", False)
+
+        occurrences = self._forecast_occurrences()
+        assignees: list[str | None] = []
+        current = self._assignee_user_id
+        for _ in occurrences:
+            assignees.append(current)
+            if not self._auto_assign or not self._roster:
+                continue
+            if least_loaded:
+                current = min(order, key=lambda p: loads.get(p, 0))
+            elif current in self._roster:
+                idx = self._roster.index(current)
+                current = self._roster[(idx + 1) % len(self._roster)]
+            else:
+                current = self._roster[0]
+
+        self._projection = dict(zip(helpers.dates_to_texts(occurrences), assignees))
+        self._projection_key = key
+        return self._projection
+
+    def _forecast_occurrences(self) -> list[date]:
+        """Return the next due date, then the schedule after it."""
+        count = max(self._config.forecast_dates, 1)
+        if (first := self._next_due_date) is None:
+            return sorted(set(self.chore_schedule()))[:count]
+        later = {day for day in self.chore_schedule(first) if day > first}
+        return [first, *sorted(later)[: count - 1]]
+
+    def _least_loaded_order(self, ids: list[str]) -> list[str]:
+        """Order people for least-loaded ties: fewest completions first."""
+        if (ledger := self.hass.data[const.DOMAIN].get(const.LEDGER)) is not None:
+            ids.sort(key=ledger.completion_count)
+        return ids
+
+    def _next_assignee(self, candidates: list[Any]) -> Any:
+        """Pick the person to assign next, using the configured strategy."""
+        if self._assign_strategy == const.ASSIGN_STRATEGY_LEAST_LOADED:
+            tracker = self._workload_tracker()
+            # The chore being reassigned must not count against its current assignee
+            tracker.remove(self.config_entry.entry_id)
+            by_id = {p.entity_id: p for p in candidates}
+            ids = self._least_loaded_order(list(by_id))
+            return by_id[tracker.least_loaded(ids)]
+
+        if self._last_assigned_user_id is not None:
+            ids = [p.entity_id for p in candidates]
+            if self._last_assigned_user_id in ids:
+                idx = ids.index(self._last_assigned_user_id)
+                return candidates[(idx + 1) % len(candidates)]
+        return candidates[0]
+
+    def _workload_tracker(self) -> WorkloadTracker:
+        """Return the integration-wide workload tracker."""
+        return self.hass.data[const.DOMAIN].setdefault(
+            const.WORKLOAD, WorkloadTracker()
+        )
+
+    async def _async_load_due_dates(self) -> None:
+        """Load due dates based on the last completed date."""
         if self.last_completed is None:
             LOGGER.warning(
                 "(%s) Last completed is None. Using start date to calculate due dates.",
                 self._attr_name,
             )
-            self._due_dates = [self._add_period_offset(self._start_date)]
+            due_date = self._add_period_offset(self._config.start_date)
         else:
-            self._due_dates = [self._add_period_offset(self.last_completed.date())]
-        LOGGER.debug("(%s) Calculated due dates: %s", self._attr_name, self._due_dates)
+            due_date = self._add_period_offset(self.last_completed.date())
+        if self._blackout is not None:
+            due_date = self._avoid_blackout(due_date)
+        self._due_dates = [] if due_date is None else [due_date]
+        if self._trace is not None:
+            self._trace_event(
+                "load_due_dates",
+                last_completed=self.last_completed,
+                start_date=self._config.start_date,
+                due_dates=self._due_dates,
+            )
+
+    async def _async_load_blackout(self) -> None:
+        """Load the blackout index the schedule is computed with."""
+        self._blackout = await blackout.async_blackout_index(self.hass, self._config)
+
+    def _avoid_blackout(self, due_date: date) -> date | None:
+        """Move a due date off blackout days.
+
+        A skipped occurrence is replaced by the one a period later.
+        """
+        if self._config.blackout_shift:
+            return self._blackout.resolve(due_date, True)
+        for _ in range(blackout.MAX_SHIFT):
+            if due_date not in self._blackout:
+                return due_date
+            if self._trace is not None:
+                self._trace_event("blackout", skipped=due_date)
+            due_date = self._add_period_offset(due_date)
+        return None
 
     async def add_date(self, chore_date: date) -> None:
         """Add date to due dates."""
@@ -577,16 +981,25 @@ class Chore(RestoreEntity):
         self._offset_dates = " ".join(offset_dates)
         self.update_state()
 
+    def set_tracing(self, enabled: bool) -> None:
+        """Switch tracing of the schedule computations on or off."""
+        if not enabled:
+            self._trace = None
+        elif self._trace is None:
+            self._trace = tracing.new_buffer()
+
+    @property
+    def trace(self) -> list[dict[str, Any]] | None:
+        """Return the recent trace events, or None if tracing is off."""
+        return list(self._trace) if self._trace is not None else None
+
+    def _trace_event(self, event: str, **fields: Any) -> None:
+        """Record a trace event; callers check that tracing is on."""
+        tracing.record(self._trace, self.entity_id, event, fields)
+
     def get_next_due_date(self, start_date: date, ignore_today=False) -> date | None:
         """Get next date from self._due_dates."""
         current_date_time = ha_now()  # Use timezone-aware `now`
-        LOGGER.debug(
-            "(%s) Calculating next due date: start_date=%s, ignore_today=%s, due_dates=%s",
-            self._attr_name,
-            start_date,
-            ignore_today,
-            self._due_dates,
-        )
         for d in self._due_dates:  # pylint: disable=invalid-name
             if d < start_date:
                 continue
@@ -599,9 +1012,22 @@ class Chore(RestoreEntity):
                     and current_date_time.time() >= self.last_completed.time()
                 ):
                     continue
-            LOGGER.debug("(%s) Next due date found: %s", self._attr_name, d)
+            if self._trace is not None:
+                self._trace_event(
+                    "next_due_date",
+                    start_date=start_date,
+                    ignore_today=ignore_today,
+                    found=d,
+                )
             return d
-        LOGGER.debug("(%s) No next due date found.", self._attr_name)
+        if self._trace is not None:
+            self._trace_event(
+                "next_due_date",
+                start_date=start_date,
+                ignore_today=ignore_today,
+                due_dates=self._due_dates,
+                found=None,
+            )
         return None
 
     async def async_update(self) -> None:
@@ -624,21 +1050,37 @@ class Chore(RestoreEntity):
             return
 
         LOGGER.debug("(%s) Calling update", self._attr_name)
-        await self._async_load_due_dates()
+        started = monotonic()
+        await self._async_load_blackout()
+        with self.metrics.timed(SECTION_SCHEDULE):
+            await self._async_load_due_dates()
+        self._save_schedule_snapshot()
+        self.last_compute = ha_now()
+        if self._auto_assign:
+            # Keep the roster used for the assignee forecast current
+            await self._async_assignment_candidates()
         LOGGER.debug(
             "(%s) Dates loaded, firing a chore_helper_loaded event",
             self._attr_name,
         )
-        event_data = {
-            "entity_id": self.entity_id,
-            "due_dates": helpers.dates_to_texts(self._due_dates),
-        }
-        self.hass.bus.async_fire("chore_helper_loaded", event_data)
+        loaded_events(self.hass).loaded(self.entity_id, self._due_dates)
         if not self._manual:
-            self.update_state()
+            # Home Assistant writes the state after the update
+            self.update_state(write=False)
+        integration_throughput(self.hass).refreshed(started, monotonic())
 
-    def update_state(self) -> None:
+    def update_state(self, write: bool = True) -> None:
         """Pick the first event from chore dates, update attributes."""
+        with self.metrics.timed(SECTION_STATE):
+            self._update_state(write)
+
+    def _update_state(self, write: bool = True) -> None:
+        """Update the state and attributes from the chore dates.
+
+        With write False, the caller is about to have Home Assistant write the
+        state, which is then recorded as the last state written.
+        """
+        self._invalidate_attributes()
         if not self.entity_id:
             LOGGER.error(
                 "Entity ID is not assigned for %s. Skipping state update.",
@@ -646,34 +1088,33 @@ class Chore(RestoreEntity):
             )
             return
 
-        LOGGER.debug("(%s) Looking for next chore date", self._attr_name)
         self._last_updated = ha_now()  # Use timezone-aware `now`
         today = self._last_updated.date()
         self._next_due_date = self.get_next_due_date(self._calculate_start_date())
         if self._next_due_date is not None:
-            LOGGER.debug(
-                "(%s) next_due_date (%s), today (%s)",
-                self._attr_name,
-                self._next_due_date,
-                today,
-            )
             self._days = (self._next_due_date - today).days
-            LOGGER.debug(
-                "(%s) Found next chore date: %s, that is in %d days",
-                self._attr_name,
-                self._next_due_date,
-                self._days,
-            )
+            if self._trace is not None:
+                self._trace_event(
+                    "update_state",
+                    next_due_date=self._next_due_date,
+                    today=today,
+                    days=self._days,
+                )
             self._attr_state = self._days
-            if self._days > 1:
-                self._attr_icon = self._icon_normal
-            elif self._days < 0:
+            # With a due time, the chore is overdue from then on
+            self._overdue = self._days < 0 or (
+                self._days == 0
+                and self._timed
+                and self._last_updated >= self._next_due_datetime()
+            )
+            if self._overdue:
                 self._attr_icon = self._icon_overdue
+            elif self._days > 1:
+                self._attr_icon = self._icon_normal
             elif self._days == 0:
                 self._attr_icon = self._icon_today
             elif self._days == 1:
                 self._attr_icon = self._icon_tomorrow
-            self._overdue = self._days < 0
             self._overdue_days = 0 if self._days > -1 else abs(self._days)
         else:
             LOGGER.warning(
@@ -686,19 +1127,20 @@ class Chore(RestoreEntity):
             self._overdue = False
             self._overdue_days = None
 
-        # Add configuration attributes
-        self._attr_extra_state_attributes = {
-            # "frequency_type": self._frequency_type,
-            "period": self._period,
-            "start_date": self._start_date,
-            "last_completed": self.last_completed,
-            "next_due_date": self._next_due_date,
-            "overdue": self._overdue,
-            "overdue_days": self._overdue_days,
-            const.ATTR_ASSIGNEE: self._assignee_user_id,
-            const.ATTR_LAST_ASSIGNED: self._last_assigned_user_id,
-            const.ATTR_AUTO_ASSIGN: self._auto_assign,
-        }
+        self._workload_tracker().update(
+            self.config_entry.entry_id,
+            self._assignee_user_id,
+            self._effort,
+            self._next_due_date,
+            today,
+        )
+        self._save_runtime_state()
+        if self.platform is not None:
+            self._schedule_transition()
+            if write:
+                self._async_write_state_if_changed()
+            else:
+                self._written_fingerprint = self._state_fingerprint()
 
     async def assign_user(self, user_id: str | None) -> None:
         """Assign or clear an assignee for this chore.
@@ -758,15 +1200,15 @@ class Chore(RestoreEntity):
             and self.last_completed is not None
             and self.last_completed.date() == today
         ):
-            day1 = day1 + relativedelta(days=1)
+            day1 = day1 + timedelta(days=1)
         return day1
 
     def _calculate_start_date(self) -> date:
         """Calculate start date based on the last completed date."""
 
         start_date = (
-            self._start_date
-            if self._start_date is not None
+            self._config.start_date
+            if self._config.start_date is not None
             else date(helpers.now().date().year - 1, 1, 1)
         )
 
@@ -783,8 +1225,8 @@ class Chore(RestoreEntity):
     def _calculate_schedule_start_date(self) -> date:
         """Calculate start date for scheduling offsets."""
 
-        after = self._frequency[:6] == "after-"
-        start_date = self._start_date
+        after = self._config.after
+        start_date = self._config.start_date
 
         if after and self.last_completed is not None:
             earliest_date = self._add_period_offset(self.last_completed.date())
@@ -796,14 +1238,14 @@ class Chore(RestoreEntity):
 
     def _add_period_offset(self, start_date: date) -> date:
         """Add the period offset to the start date."""
-        if not hasattr(self, "_period") or self._period is None:
+        if self._config.period is None:
             raise ValueError(f"({self._attr_name}) Period is not configured.")
-        next_date = start_date + timedelta(days=self._period)
-        LOGGER.debug(
-            "(%s) Adding period offset: start_date=%s, period=%d, next_date=%s",
-            self._attr_name,
-            start_date,
-            self._period,
-            next_date,
-        )
+        next_date = start_date + timedelta(days=self._config.period)
+        if self._trace is not None:
+            self._trace_event(
+                "add_period_offset",
+                start_date=start_date,
+                period=self._config.period,
+                next_date=next_date,
+            )
         return next_date
@@ -6,6 +6,7 @@ from datetime import date
 
 from .chore import Chore
 from .const import LOGGER
+from .events import loaded_events
 
 
 class BlankChore(Chore):
@@ -30,8 +31,4 @@ class BlankChore(Chore):
             "(%s) Dates loaded, firing a chore_helper_loaded event",
             self._attr_name,
         )
-        event_data = {
-            "entity_id": self.entity_id,
-            "due_dates": [],
-        }
-        self.hass.bus.async_fire("chore_helper_loaded", event_data)
+        loaded_events(self.hass).loaded(self.entity_id, self._due_dates)
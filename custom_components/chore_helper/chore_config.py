@@ -0,0 +1,113 @@
+"""Schedule configuration shared by chores with identical schedules."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, time
+from typing import Any
+from weakref import WeakValueDictionary
+
+from . import const, helpers
+
+MONTHS = [m["value"] for m in const.MONTH_OPTIONS]
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class ChoreConfig:
+    """The options a schedule is computed from, parsed once.
+
+    Instances are interned: chores whose schedule options are equal share
+    one object, so caches can be keyed by identity.
+    """
+
+    frequency: str | None
+    period: int | None
+    start_date: date | None
+    first_month: int
+    last_month: int
+    forecast_dates: int
+    chore_day: str | None
+    first_week: int
+    day_of_month: int | None
+    force_week_numbers: bool
+    weekday_order_number: int | None
+    week_order_number: int | None
+    due_date_offset: int
+    month_day: tuple[int, int] | None
+    due_time: time | None
+    blackout_dates: tuple[int, ...]
+    blackout_file: str | None
+    blackout_calendar: str | None
+    blackout_shift: bool
+
+    @property
+    def after(self) -> bool:
+        """Return True for after-n-* frequencies."""
+        return self.frequency is not None and self.frequency.startswith("after-")
+
+    @property
+    def blackout(self) -> bool:
+        """Return True if blackout dates are configured."""
+        return bool(
+            self.blackout_dates or self.blackout_file or self.blackout_calendar
+        )
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> ChoreConfig:
+        """Parse config entry options into the shared configuration."""
+        config = cls._parse(options)
+        return _INTERNED.setdefault(config, config)
+
+    @classmethod
+    def _parse(cls, options: Mapping[str, Any]) -> ChoreConfig:
+        """Parse config entry options."""
+        first_month = options.get(const.CONF_FIRST_MONTH, const.DEFAULT_FIRST_MONTH)
+        last_month = options.get(const.CONF_LAST_MONTH, const.DEFAULT_LAST_MONTH)
+        try:
+            start_date = helpers.to_date(options.get(const.CONF_START_DATE))
+        except ValueError:
+            start_date = None
+        day_of_month = options.get(const.CONF_DAY_OF_MONTH)
+        force_week_numbers = bool(options.get(const.CONF_FORCE_WEEK_NUMBERS, False))
+        order_number = int(options.get(const.CONF_WEEKDAY_ORDER_NUMBER, 1))
+        period = options.get(const.CONF_PERIOD, 1)  # numbers come in as float
+        yearly_date = options.get(const.CONF_DATE)
+        month_day = None
+        if yearly_date is not None and yearly_date not in ("", "0"):
+            month, day = yearly_date.split("/")
+            month_day = (int(month), int(day))
+        return cls(
+            frequency=options.get(const.CONF_FREQUENCY),
+            period=int(period) if period is not None else None,
+            start_date=start_date,
+            first_month=(
+                MONTHS.index(first_month) + 1 if first_month in MONTHS else 1
+            ),
+            last_month=MONTHS.index(last_month) + 1 if last_month in MONTHS else 12,
+            forecast_dates=int(options.get(const.CONF_FORECAST_DATES) or 0),
+            chore_day=options.get(const.CONF_CHORE_DAY),
+            first_week=int(options.get(const.CONF_FIRST_WEEK, 1)),
+            day_of_month=(
+                int(day_of_month)
+                if day_of_month is not None and day_of_month > 0
+                else None
+            ),
+            force_week_numbers=force_week_numbers,
+            weekday_order_number=None if force_week_numbers else order_number,
+            week_order_number=order_number if force_week_numbers else None,
+            due_date_offset=int(options.get(const.CONF_DUE_DATE_OFFSET, 0)),
+            month_day=month_day,
+            due_time=helpers.to_time(options.get(const.CONF_TIME)),
+            blackout_dates=helpers.date_ordinals(
+                options.get(const.CONF_BLACKOUT_DATES) or None
+            ),
+            blackout_file=options.get(const.CONF_BLACKOUT_FILE) or None,
+            blackout_calendar=options.get(const.CONF_BLACKOUT_CALENDAR) or None,
+            blackout_shift=(
+                options.get(const.CONF_BLACKOUT_ACTION) == const.BLACKOUT_SHIFT
+            ),
+        )
+
+
+_INTERNED: WeakValueDictionary[ChoreConfig, ChoreConfig] = WeakValueDictionary()
@@ -0,0 +1,159 @@
+"""Entity for a chore due every few hours."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from datetime import date, datetime, time, timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.util.dt import as_local, as_utc
+
+from . import helpers
+from .chore import Chore
+from .const import LOGGER
+
+# Occurrences looked at per forecast due time, for removed and blackout days
+MAX_LOOKAHEAD = 100
+
+
+class HourlyChore(Chore):
+    """Chore every n hours or n hours after the last completion.
+
+    The schedule is anchored on the start date at the due time (midnight if
+    not set). Due times are computed in UTC, so a period is always the same
+    number of hours, also across daylight saving changes. Overrides and
+    blackout dates apply to all the due times of a day.
+    """
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Read configuration and initialise class variables."""
+        super().__init__(config_entry)
+        self._due_times: list[datetime] = []
+
+    @property
+    def due_times(self) -> list[datetime]:
+        """Return the forecast due times."""
+        return self._due_times
+
+    @property
+    def _timed(self) -> bool:
+        """Return True: sub-daily chores are always due at a time."""
+        return True
+
+    def _anchor(self) -> datetime:
+        """Return the first due time of the schedule."""
+        start_date = self._config.start_date or helpers.now().date()
+        return as_local(datetime.combine(start_date, self._config.due_time or time.min))
+
+    def _first_due_time(self, period: timedelta) -> datetime:
+        """Return the first due time after the last completion."""
+        anchor = as_utc(self._anchor())
+        if self.last_completed is None:
+            return anchor
+        last_completed = as_utc(self.last_completed)
+        if self._config.after:
+            return max(last_completed + period, anchor)
+        if last_completed < anchor:
+            return anchor
+        return anchor + ((last_completed - anchor) // period + 1) * period
+
+    def _forecast(
+        self, since: datetime | None = None
+    ) -> Generator[datetime, None, None]:
+        """Yield the due times in order, optionally from a time on.
+
+        The overrides are applied to the due times yielded.
+        """
+        if not self._config.period:
+            raise ValueError(f"({self._attr_name}) Period is not configured.")
+        period = timedelta(hours=self._config.period)
+        removed = helpers.date_ordinal_set(self._remove_dates)
+        offsets = helpers.offset_ordinals(self._offset_dates)
+        blackouts, shift = self._blackout, self._config.blackout_shift
+        due_time = self._first_due_time(period)
+        if since is not None and (since := as_utc(since)) > due_time:
+            due_time += -((due_time - since) // period) * period  # round up
+        for _ in range(max(self._config.forecast_dates, 1) * MAX_LOOKAHEAD):
+            local = as_local(due_time)
+            due_time += period
+            ordinal = local.toordinal()
+            if ordinal in removed:
+                continue
+            if (offset := offsets.get(ordinal)) is not None:
+                local += timedelta(days=offset)
+            if blackouts is not None and (
+                day := blackouts.resolve(local.date(), shift)
+            ) != local.date():
+                if day is None:
+                    continue
+                local += day - local.date()
+            yield local
+
+    def _load_due_times(self) -> None:
+        """Compute the forecast due times and their days."""
+        count = max(self._config.forecast_dates, 1)
+        # Offset and shifted days can land on due times already forecast
+        due_times: set[datetime] = set()
+        for due_time in self._forecast():
+            due_times.add(due_time)
+            if len(due_times) == count:
+                break
+        first = min(due_times, default=None)
+        for ordinal in helpers.date_ordinals(self._add_dates):
+            added = as_local(
+                datetime.combine(
+                    date.fromordinal(ordinal), self._config.due_time or time.min
+                )
+            )
+            if first is None or added >= first:
+                due_times.add(added)
+        self._due_times = sorted(due_times)[:count]
+        self._due_dates = sorted({due_time.date() for due_time in self._due_times})
+
+    async def _async_load_due_dates(self) -> None:
+        """Load the due times based on the last completion."""
+        self._load_due_times()
+        if not self._due_times:
+            LOGGER.warning("(%s) No due times found", self._attr_name)
+        if self._trace is not None:
+            self._trace_event(
+                "load_due_times",
+                last_completed=self.last_completed,
+                due_times=self._due_times,
+            )
+
+    def chore_schedule(
+        self, from_date: date | None = None
+    ) -> Generator[datetime, None, None]:
+        """Get the forecast due times, optionally from a date."""
+        since = None
+        if from_date is not None:
+            since = as_local(datetime.combine(from_date, time.min))
+        for due_time in self._forecast(since):
+            if from_date is None or due_time.date() >= from_date:
+                yield due_time
+
+    def get_next_due_date(self, start_date: date, ignore_today=False) -> date | None:
+        """Get the day of the next due time; a day can have several."""
+        for day in self._due_dates:
+            if day >= start_date:
+                return day
+        return None
+
+    def _forecast_occurrences(self) -> list[datetime]:
+        """Return the forecast due times, several a day if the period allows."""
+        return self._due_times
+
+    def _calculate_start_date(self) -> date:
+        """Return the day of the next due time."""
+        return self._due_times[0].date() if self._due_times else helpers.now().date()
+
+    def _next_due_datetime(self) -> datetime | None:
+        """Return the next due time."""
+        return self._due_times[0] if self._due_times else None
+
+    def _save_schedule_snapshot(self) -> None:
+        """Do not snapshot: the snapshot keeps days, and due times are cheap."""
+
+    def _warm_start(self) -> None:
+        """Do not warm start, see _save_schedule_snapshot."""
@@ -6,52 +6,14 @@ from calendar import monthrange
 from datetime import date, timedelta
 
 from dateutil.relativedelta import relativedelta
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import WEEKDAYS
 
-from . import const
 from .chore import Chore
 
 
 class MonthlyChore(Chore):
     """Chore every nth weekday of each month."""
 
-    __slots__ = (
-        "_day_of_month",
-        "_chore_day",
-        "_monthly_force_week_numbers",
-        "_period",
-        "_weekday_order_number",
-        "_week_order_number",
-        "_due_date_offset",
-    )
-
-    def __init__(self, config_entry: ConfigEntry) -> None:
-        """Read parameters specific for Monthly Chore Frequency."""
-        super().__init__(config_entry)
-        config = config_entry.options
-        day_of_month = config.get(const.CONF_DAY_OF_MONTH)
-        self._day_of_month: int | None = (
-            int(day_of_month) if day_of_month is not None and day_of_month > 0 else None
-        )
-        self._chore_day = config.get(const.CONF_CHORE_DAY, None)
-        self._monthly_force_week_numbers = config.get(
-            const.CONF_FORCE_WEEK_NUMBERS, False
-        )
-        self._due_date_offset = int(config.get(const.CONF_DUE_DATE_OFFSET, 0))
-        self._weekday_order_number: int | None
-        self._week_order_number: int | None
-        order_number: int = 1
-        if const.CONF_WEEKDAY_ORDER_NUMBER in config:
-            order_number = int(config[const.CONF_WEEKDAY_ORDER_NUMBER])
-        if self._monthly_force_week_numbers:
-            self._weekday_order_number = None
-            self._week_order_number = order_number
-        else:
-            self._weekday_order_number = order_number
-            self._week_order_number = None
-        self._period = config.get(const.CONF_PERIOD, 1)  # Default to 1 if not provided
-
     @staticmethod
     def viable_weeks_in_month(
         date_of_month: date,
@@ -126,9 +88,9 @@ class MonthlyChore(Chore):
 
         2nd value is the month to consider the date in, even if different.
         """
-        if self._chore_day is None:
-            day_of_month = self._day_of_month
-            if self._day_of_month is None:
+        if self._config.chore_day is None:
+            day_of_month = self._config.day_of_month
+            if self._config.day_of_month is None:
                 month_range = monthrange(day1.year, day1.month)
                 day_of_month = (
                     start_date.day
@@ -141,20 +103,22 @@ class MonthlyChore(Chore):
             if day1.month == 12:
                 return (date(day1.year + 1, 1, day_of_month), 1)
             return (date(day1.year, day1.month + 1, day_of_month), day1.month + 1)
-        if self._monthly_force_week_numbers:
-            if self._week_order_number is not None:
+        if self._config.force_week_numbers:
+            if self._config.week_order_number is not None:
                 candidate_date = MonthlyChore.nth_week_date(
-                    self._week_order_number, day1, WEEKDAYS.index(self._chore_day)
+                    self._config.week_order_number,
+                    day1,
+                    WEEKDAYS.index(self._config.chore_day),
                 )
                 # date is today or in the future -> we have the date
                 if candidate_date >= day1:
                     return (candidate_date, day1.month)
         else:
-            if self._weekday_order_number is not None:
+            if self._config.weekday_order_number is not None:
                 candidate_date = MonthlyChore.nth_weekday_date(
-                    self._weekday_order_number,
+                    self._config.weekday_order_number,
                     day1,
-                    WEEKDAYS.index(self._chore_day),
+                    WEEKDAYS.index(self._config.chore_day),
                 )
                 # date is today or in the future -> we have the date
                 if candidate_date >= day1:
@@ -163,28 +127,28 @@ class MonthlyChore(Chore):
             next_chore_month = date(day1.year + 1, 1, 1)
         else:
             next_chore_month = date(day1.year, day1.month + 1, 1)
-        if self._monthly_force_week_numbers:
+        if self._config.force_week_numbers:
             return (
                 MonthlyChore.nth_week_date(
-                    self._week_order_number,
+                    self._config.week_order_number,
                     next_chore_month,
-                    WEEKDAYS.index(self._chore_day),
+                    WEEKDAYS.index(self._config.chore_day),
                 ),
                 next_chore_month.month,
             )
         return (
             MonthlyChore.nth_weekday_date(
-                self._weekday_order_number,
+                self._config.weekday_order_number,
                 next_chore_month,
-                WEEKDAYS.index(self._chore_day),
+                WEEKDAYS.index(self._config.chore_day),
             ),
             next_chore_month.month,
         )
 
     def _add_period_offset(self, start_date: date) -> date:
-        if self._period is None:
+        if self._config.period is None:
             raise ValueError(f"({self._attr_name}) Period is not configured.")
-        return start_date + relativedelta(months=self._period)
+        return start_date + relativedelta(months=self._config.period)
 
     def _find_candidate_date(self, day1: date) -> date | None:
         schedule_start_date = self._calculate_schedule_start_date()
@@ -194,24 +158,26 @@ class MonthlyChore(Chore):
                 day1 = date(day1.year + 1, 1, 1)
             else:
                 day1 = date(day1.year, day1.month + 1, 1)
-        if self._period is None or self._period == 1:
+        if self._config.period is None or self._config.period == 1:
             return self._monthly_candidate(day1, schedule_start_date)[0]
         result = self._monthly_candidate(day1, schedule_start_date)
 
         candidate_date = result[0]
         candidate_month = result[1]
-        while (candidate_month - schedule_start_date.month) % self._period != 0:
+        while (candidate_month - schedule_start_date.month) % self._config.period != 0:
             remainder = (
                 candidate_date.month - schedule_start_date.month
-            ) % self._period
+            ) % self._config.period
+            # Skip to the next month of the cycle
             result = self._monthly_candidate(
-                candidate_date + relativedelta(months=remainder, day=1),
+                candidate_date
+                + relativedelta(months=self._config.period - remainder, day=1),
                 schedule_start_date,
             )
             candidate_date = result[0]
             candidate_month = result[1]
 
-        if self._due_date_offset is not None:
-            candidate_date += timedelta(days=self._due_date_offset)
+        if self._config.due_date_offset is not None:
+            candidate_date += timedelta(days=self._config.due_date_offset)
 
         return candidate_date
@@ -2,36 +2,20 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
 
-from dateutil.relativedelta import relativedelta
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import WEEKDAYS
 
-from . import const
 from .chore import Chore
 
 
 class WeeklyChore(Chore):
     """Chore every n weeks, odd weeks or even weeks."""
 
-    __slots__ = "_chore_day", "_first_week", "_period"
-
-    def __init__(self, config_entry: ConfigEntry) -> None:
-        """Read parameters specific for Weekly Chore Frequency."""
-        super().__init__(config_entry)
-        config = config_entry.options
-        self._chore_day = config.get(const.CONF_CHORE_DAY, None)
-        self._period: int
-        self._first_week: int
-        config.get(const.CONF_FREQUENCY)
-        self._period = config.get(const.CONF_PERIOD, 1)  # Default to 1 if not provided
-        self._first_week = config.get(const.CONF_FIRST_WEEK, 1)
-
     def _add_period_offset(self, start_date: date) -> date:
-        if self._period is None:
+        if self._config.period is None:
             raise ValueError(f"({self._attr_name}) Period is not configured.")
-        return start_date + relativedelta(weeks=self._period)
+        return start_date + timedelta(weeks=self._config.period)
 
     def _find_candidate_date(self, day1: date) -> date | None:
         """Calculate possible date, for weekly frequency."""
@@ -41,20 +25,20 @@ class WeeklyChore(Chore):
         week = day1.isocalendar()[1]
         weekday = day1.weekday()
         offset = -1
-        if self._chore_day is not None:
-            day_index = WEEKDAYS.index(self._chore_day)
+        if self._config.chore_day is not None:
+            day_index = WEEKDAYS.index(self._config.chore_day)
         else:  # if chore day is not set, just repeat the start date's day
             day_index = start_date.weekday()
 
-        if (week - start_week) % self._period == 0:  # Chore this week
+        if (week - start_week) % self._config.period == 0:  # Chore this week
             if day_index >= weekday:  # Chore still did not happen
                 offset = day_index - weekday
         iterate_by_week = 7 - weekday + day_index
         while offset == -1:  # look in following weeks
-            candidate = day1 + relativedelta(days=iterate_by_week)
+            candidate = day1 + timedelta(days=iterate_by_week)
             week = candidate.isocalendar()[1]
-            if (week - start_week) % self._period == 0:
+            if (week - start_week) % self._config.period == 0:
                 offset = iterate_by_week
                 break
             iterate_by_week += 7
-        return day1 + relativedelta(days=offset)
+        return day1 + timedelta(days=offset)
@@ -9,9 +9,11 @@ if TYPE_CHECKING:
     from homeassistant.helpers.schema_config_entry_flow import SchemaCommonFlowHandler
 
 import voluptuous as vol
+from homeassistant.config_entries import ConfigEntry, ConfigFlowResult
 from homeassistant.const import ATTR_HIDDEN, CONF_NAME
 from homeassistant.core import callback
 from homeassistant.helpers import selector
+from homeassistant.helpers.importlib import async_import_module
 from homeassistant.helpers.schema_config_entry_flow import (
     SchemaConfigFlowHandler,
     SchemaFlowError,
@@ -20,8 +22,12 @@ from homeassistant.helpers.schema_config_entry_flow import (
     SchemaOptionsFlowHandler,
 )
 
-from . import const, helpers
+from . import blackout, const, helpers, offload, registry
+from .chore_config import ChoreConfig
 from .const import LOGGER
+from .preview import PREVIEW_DATES, preview_dates, preview_text
+
+PREVIEW_STEP = "preview"
 
 
 async def _validate_config(
@@ -46,6 +52,14 @@ async def _validate_config(
             except vol.Invalid as exc:
                 raise SchemaFlowError("month_day") from exc
 
+    if const.CONF_BLACKOUT_DATES in data:
+        try:
+            data[const.CONF_BLACKOUT_DATES] = helpers.date_list_text(
+                data[const.CONF_BLACKOUT_DATES]
+            )
+        except vol.Invalid as exc:
+            raise SchemaFlowError("blackout_dates") from exc
+
     if (
         const.CONF_WEEKDAY_ORDER_NUMBER in data
         and int(data[const.CONF_WEEKDAY_ORDER_NUMBER]) == 0
@@ -143,6 +157,21 @@ def general_schema_definition(
         optional(
             const.CONF_AUTO_ASSIGN, handler.options, const.DEFAULT_AUTO_ASSIGN
         ): bool,
+        optional(
+            const.CONF_ASSIGN_STRATEGY, handler.options, const.DEFAULT_ASSIGN_STRATEGY
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(options=const.ASSIGN_STRATEGY_OPTIONS)
+        ),
+        optional(
+            const.CONF_EFFORT, handler.options, const.DEFAULT_EFFORT
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=100,
+                mode=selector.NumberSelectorMode.BOX,
+                step=1,
+            )
+        ),
     }
 
     return schema
@@ -273,16 +302,19 @@ async def detail_config_schema(
 
     if frequency not in const.BLANK_FREQUENCY:
         if frequency in (
-            const.DAILY_FREQUENCY
+            const.HOURLY_FREQUENCY
+            + const.DAILY_FREQUENCY
             + const.WEEKLY_FREQUENCY
             + const.MONTHLY_FREQUENCY
             + const.YEARLY_FREQUENCY
         ):
             uom = {
+                "every-n-hours": "hour(s)",
                 "every-n-days": "day(s)",
                 "every-n-weeks": "week(s)",
                 "every-n-months": "month(s)",
                 "every-n-years": "year(s)",
+                "after-n-hours": "hour(s)",
                 "after-n-days": "day(s)",
                 "after-n-weeks": "week(s)",
                 "after-n-months": "month(s)",
@@ -362,7 +394,7 @@ async def detail_config_schema(
                 )
             )
 
-        if frequency not in const.YEARLY_FREQUENCY:
+        if frequency not in const.YEARLY_FREQUENCY + const.HOURLY_FREQUENCY:
             options_schema[
                 optional(
                     const.CONF_FIRST_MONTH, handler.options, const.DEFAULT_FIRST_MONTH
@@ -382,6 +414,29 @@ async def detail_config_schema(
             required(const.CONF_START_DATE, handler.options, helpers.now().date())
         ] = selector.DateSelector()
 
+        options_schema[optional(const.CONF_TIME, handler.options)] = (
+            selector.TimeSelector()
+        )
+
+        options_schema[optional(const.CONF_BLACKOUT_DATES, handler.options)] = (
+            selector.TextSelector(selector.TextSelectorConfig(multiline=True))
+        )
+        options_schema[optional(const.CONF_BLACKOUT_FILE, handler.options)] = (
+            selector.TextSelector()
+        )
+        options_schema[optional(const.CONF_BLACKOUT_CALENDAR, handler.options)] = (
+            selector.EntitySelector(selector.EntitySelectorConfig(domain="calendar"))
+        )
+        options_schema[
+            optional(
+                const.CONF_BLACKOUT_ACTION,
+                handler.options,
+                const.DEFAULT_BLACKOUT_ACTION,
+            )
+        ] = selector.SelectSelector(
+            selector.SelectSelectorConfig(options=const.BLACKOUT_ACTION_OPTIONS)
+        )
+
     return vol.Schema(options_schema)
 
 
@@ -390,6 +445,79 @@ async def choose_details_step(_: dict[str, Any]) -> str:
     return "detail"
 
 
+async def choose_preview_step(options: dict[str, Any]) -> str | None:
+    """Show the schedule preview, unless there is no schedule to show."""
+    if options.get(const.CONF_FREQUENCY) in const.BLANK_FREQUENCY:
+        return None
+    return PREVIEW_STEP
+
+
+async def choose_after_preview_step(options: dict[str, Any]) -> str | None:
+    """Go back to the details to change the schedule, or finish."""
+    if options.pop(const.CONF_EDIT_SCHEDULE, False):
+        return "detail"
+    return None
+
+
+async def preview_schema(handler: SchemaCommonFlowHandler) -> vol.Schema:
+    """Generate the schedule preview schema.
+
+    The schema is awaited before the form is shown, so the next due dates are
+    computed here; async_show_form adds them to the form description.
+    """
+    handler.flow_state[PREVIEW_STEP] = await preview_placeholders(handler)
+    return vol.Schema({vol.Optional(const.CONF_EDIT_SCHEDULE, default=False): bool})
+
+
+async def preview_placeholders(handler: SchemaCommonFlowHandler) -> dict[str, str]:
+    """Compute the next due dates of the submitted options.
+
+    In the options flow, the last completion of the existing chore is taken
+    into account, as after-n-* schedules depend on it.
+    """
+    hass = handler.parent_handler.hass
+    options = handler.options
+    module_name, class_name = const.FREQUENCY_ENGINES[options[const.CONF_FREQUENCY]]
+    module = await async_import_module(hass, f"{__package__}.{module_name}")
+    last_completed = None
+    if (entry := getattr(handler.parent_handler, "config_entry", None)) is not None:
+        if (chore := registry.chore_by_entry_id(hass, entry.entry_id)) is not None:
+            last_completed = chore.last_completed
+    forecast_dates = int(options.get(const.CONF_FORECAST_DATES) or 0)
+    blackouts = await blackout.async_blackout_index(
+        hass, ChoreConfig.from_options(options)
+    )
+    try:
+        dates = await offload.async_run(
+            hass,
+            offload.schedule_inline(max(forecast_dates, PREVIEW_DATES)),
+            preview_dates,
+            getattr(module, class_name),
+            options,
+            last_completed,
+            PREVIEW_DATES,
+            blackouts,
+        )
+    except (TypeError, ValueError) as err:
+        LOGGER.debug("Schedule preview failed: %s", err)
+        dates = []
+    return {"preview": preview_text(dates)}
+
+
+def with_preview_placeholders(
+    handler: SchemaCommonFlowHandler,
+    step_id: str | None,
+    description_placeholders: Mapping[str, str] | None,
+) -> Mapping[str, str] | None:
+    """Add the next due dates to the placeholders of the preview step."""
+    if step_id != PREVIEW_STEP:
+        return description_placeholders
+    return {
+        **(description_placeholders or {}),
+        **handler.flow_state.get(PREVIEW_STEP, {"preview": "-"}),
+    }
+
+
 def _schema_with_parent_hass(schema_func):
     """Wrap a schema function so it extracts hass from the parent handler."""
 
@@ -415,7 +543,12 @@ CONFIG_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
         _schema_with_parent_hass(general_config_schema), next_step=choose_details_step
     ),
     "detail": SchemaFlowFormStep(
-        detail_config_schema, validate_user_input=_validate_with_parent_hass
+        detail_config_schema,
+        validate_user_input=_validate_with_parent_hass,
+        next_step=choose_preview_step,
+    ),
+    PREVIEW_STEP: SchemaFlowFormStep(
+        preview_schema, next_step=choose_after_preview_step
     ),
 }
 
@@ -424,7 +557,12 @@ OPTIONS_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
         _schema_with_parent_hass(general_options_schema), next_step=choose_details_step
     ),
     "detail": SchemaFlowFormStep(
-        detail_config_schema, validate_user_input=_validate_with_parent_hass
+        detail_config_schema,
+        validate_user_input=_validate_with_parent_hass,
+        next_step=choose_preview_step,
+    ),
+    PREVIEW_STEP: SchemaFlowFormStep(
+        preview_schema, next_step=choose_after_preview_step
     ),
 }
 
@@ -445,3 +583,52 @@ class ChoreHelperConfigFlowHandler(SchemaConfigFlowHandler, domain=const.DOMAIN)
         input from the config flow steps.
         """
         return cast(str, options["name"]) if "name" in options else ""
+
+    @callback
+    def async_show_form(
+        self,
+        *,
+        step_id: str | None = None,
+        description_placeholders: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> ConfigFlowResult:
+        """Show a form, with the next due dates on the preview step."""
+        return super().async_show_form(
+            step_id=step_id,
+            description_placeholders=with_preview_placeholders(
+                self._common_handler, step_id, description_placeholders
+            ),
+            **kwargs,
+        )
+
+
+class ChoreHelperOptionsFlowHandler(SchemaOptionsFlowHandler):
+    """Handle an options flow for Chore Helper."""
+
+    @callback
+    def async_show_form(
+        self,
+        *,
+        step_id: str | None = None,
+        description_placeholders: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> ConfigFlowResult:
+        """Show a form, with the next due dates on the preview step."""
+        return super().async_show_form(
+            step_id=step_id,
+            description_placeholders=with_preview_placeholders(
+                self._common_handler, step_id, description_placeholders
+            ),
+            **kwargs,
+        )
+
+
+@callback
+def _async_get_options_flow(config_entry: ConfigEntry) -> ChoreHelperOptionsFlowHandler:
+    """Get the options flow for a chore."""
+    return ChoreHelperOptionsFlowHandler(config_entry, OPTIONS_FLOW)
+
+
+# SchemaConfigFlowHandler generates async_get_options_flow when the class is
+# created, with the stock options flow handler
+ChoreHelperConfigFlowHandler.async_get_options_flow = _async_get_options_flow
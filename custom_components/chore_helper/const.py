@@ -10,6 +10,27 @@ DOMAIN = "chore_helper"
 CALENDAR_NAME = "Chores"
 SENSOR_PLATFORM = "sensor"
 CALENDAR_PLATFORM = "calendar"
+WORKLOAD = "workload"
+LEDGER = "ledger"
+STATE_STORE = "state_store"
+LOADED_EVENTS = "loaded_events"
+METRICS = "metrics"
+UNIQUE_ID_INDEX = "unique_id_index"
+ENTRY_ID_INDEX = "entry_id_index"
+THROUGHPUT = "throughput"
+TRACE_PATTERNS = "trace_patterns"
+SCHEDULE_SNAPSHOT = "schedule_snapshot"
+BLACKOUTS = "blackouts"
+DUE_TIMER = "due_timer"
+INTEGRATION_DIAGNOSTICS = "integration_diagnostics"
+CONF_ENABLED = "enabled"
+
+EVENT_LOADED = "chore_helper_loaded"
+CONF_LOADED_EVENT = "loaded_event"
+CONF_AGGREGATE_LOADED_EVENTS = "aggregate_loaded_events"
+LOADED_EVENT_FULL = "full"
+LOADED_EVENT_COMPACT = "compact"
+LOADED_EVENT_CHANGED = "changed"
 ATTRIBUTION = "Data is provided by chore_helper"
 CONFIG_VERSION = 6
 
@@ -30,13 +51,43 @@ ATTR_FORECAST_DATES = "forecast_dates"
 ATTR_DATE_FORMAT = "date_format"
 ATTR_SHOW_OVERDUE_TODAY = "show_overdue_today"
 
+# Completion statistics
+ATTR_COMPLETION_COUNT = "completion_count"
+ATTR_INTERVAL_MEAN = "completion_interval_mean"
+ATTR_INTERVAL_STDEV = "completion_interval_stdev"
+ATTR_LATENESS_MEAN = "lateness_mean"
+ATTR_ON_TIME_RATIO = "on_time_ratio"
+ATTR_RECENT_COMPLETIONS = "recent_completions"
+DEFAULT_HISTORY_SIZE = 10
+
+# Integration health sensor
+CONF_HEALTH_SENSOR = "health_sensor"
+HEALTH_SENSOR_NAME = "Chore Helper health"
+ATTR_CHORES = "chores"
+ATTR_LAST_REFRESH_MS = "last_refresh_ms"
+ATTR_STATE_WRITES_PER_MINUTE = "state_writes_per_minute"
+ATTR_SUPPRESSED_WRITES = "suppressed_writes"
+ATTR_CALENDAR_QUERIES_PER_MINUTE = "calendar_queries_per_minute"
+ATTR_CALENDAR_P95_MS = "calendar_p95_ms"
+ATTR_CACHE_HIT_RATES = "cache_hit_rates"
+
 # Assignment-related constants
 CONF_ASSIGNEE_USER = "assignee_user"
+CONF_COMPLETED_BY = "completed_by"
 CONF_AUTO_ASSIGN = "auto_assign"
 ATTR_ASSIGNEE = "assignee_user_id"
 ATTR_LAST_ASSIGNED = "last_assigned_user_id"
+ATTR_ASSIGNEE_FORECAST = "assignee_forecast"
 ATTR_AUTO_ASSIGN = "auto_assign"
 DEFAULT_AUTO_ASSIGN = False
+CONF_ASSIGN_STRATEGY = "assign_strategy"
+CONF_EFFORT = "effort"
+ATTR_EFFORT = "effort"
+ASSIGN_STRATEGY_ROUND_ROBIN = "round_robin"
+ASSIGN_STRATEGY_LEAST_LOADED = "least_loaded"
+DEFAULT_ASSIGN_STRATEGY = ASSIGN_STRATEGY_ROUND_ROBIN
+DEFAULT_EFFORT = 1
+DEFAULT_WORKLOAD_HORIZON = 14
 
 BINARY_SENSOR_DEVICE_CLASS = "connectivity"
 DEVICE_CLASS = "chore_helper__schedule"
@@ -60,6 +111,11 @@ CONF_CHORE_DAY = "chore_day"
 CONF_WEEKDAY_ORDER_NUMBER = "weekday_order_number"
 CONF_FORCE_WEEK_NUMBERS = "force_week_order_numbers"
 CONF_DATE = "date"
+CONF_EDIT_SCHEDULE = "edit_schedule"
+CONF_BLACKOUT_DATES = "blackout_dates"
+CONF_BLACKOUT_FILE = "blackout_file"
+CONF_BLACKOUT_CALENDAR = "blackout_calendar"
+CONF_BLACKOUT_ACTION = "blackout_action"
 CONF_TIME = "time"
 CONF_PERIOD = "period"
 CONF_FIRST_WEEK = "first_week"
@@ -76,6 +132,9 @@ DEFAULT_FIRST_WEEK = 1
 DEFAULT_DATE_FORMAT = "%b-%d-%Y"
 DEFAULT_FORECAST_DATES = 10
 DEFAULT_SHOW_OVERDUE_TODAY = False
+BLACKOUT_SKIP = "skip"
+BLACKOUT_SHIFT = "shift"
+DEFAULT_BLACKOUT_ACTION = BLACKOUT_SKIP
 
 DEFAULT_ICON_NORMAL = "mdi:broom"
 DEFAULT_ICON_TODAY = "mdi:bell"
@@ -86,6 +145,21 @@ ICON = DEFAULT_ICON_NORMAL
 STATE_TODAY = "today"
 STATE_TOMORROW = "tomorrow"
 
+# Module and class of the engine of each frequency
+FREQUENCY_ENGINES = {
+    "every-n-days": ("chore_daily", "DailyChore"),
+    "every-n-weeks": ("chore_weekly", "WeeklyChore"),
+    "every-n-months": ("chore_monthly", "MonthlyChore"),
+    "every-n-years": ("chore_yearly", "YearlyChore"),
+    "after-n-days": ("chore_daily", "DailyChore"),
+    "after-n-weeks": ("chore_weekly", "WeeklyChore"),
+    "after-n-months": ("chore_monthly", "MonthlyChore"),
+    "after-n-years": ("chore_yearly", "YearlyChore"),
+    "every-n-hours": ("chore_hourly", "HourlyChore"),
+    "after-n-hours": ("chore_hourly", "HourlyChore"),
+    "blank": ("chore_blank", "BlankChore"),
+}
+
 FREQUENCY_OPTIONS = [
     selector.SelectOptionDict(value="every-n-days", label="Every [x] days"),
     selector.SelectOptionDict(value="every-n-weeks", label="Every [x] weeks"),
@@ -95,15 +169,32 @@ FREQUENCY_OPTIONS = [
     selector.SelectOptionDict(value="after-n-weeks", label="After [x] weeks"),
     selector.SelectOptionDict(value="after-n-months", label="After [x] months"),
     selector.SelectOptionDict(value="after-n-years", label="After [x] years"),
+    selector.SelectOptionDict(value="every-n-hours", label="Every [x] hours"),
+    selector.SelectOptionDict(value="after-n-hours", label="After [x] hours"),
     selector.SelectOptionDict(value="blank", label="Manual"),
 ]
 
+HOURLY_FREQUENCY = ["every-n-hours", "after-n-hours"]
 DAILY_FREQUENCY = ["every-n-days", "after-n-days"]
 WEEKLY_FREQUENCY = ["every-n-weeks", "after-n-weeks"]
 MONTHLY_FREQUENCY = ["every-n-months", "after-n-months"]
 YEARLY_FREQUENCY = ["every-n-years", "after-n-years"]
 BLANK_FREQUENCY = ["blank"]
 
+BLACKOUT_ACTION_OPTIONS = [
+    selector.SelectOptionDict(value=BLACKOUT_SKIP, label="Skip the occurrence"),
+    selector.SelectOptionDict(
+        value=BLACKOUT_SHIFT, label="Move it to the next free day"
+    ),
+]
+
+ASSIGN_STRATEGY_OPTIONS = [
+    selector.SelectOptionDict(value=ASSIGN_STRATEGY_ROUND_ROBIN, label="Round robin"),
+    selector.SelectOptionDict(
+        value=ASSIGN_STRATEGY_LEAST_LOADED, label="Least loaded person"
+    ),
+]
+
 WEEKDAY_OPTIONS = [
     selector.SelectOptionDict(value="0", label="None"),
     selector.SelectOptionDict(value="mon", label="Monday"),
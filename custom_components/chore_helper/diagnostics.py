@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from heapq import nlargest
+from time import monotonic
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from . import const
+from . import const, registry
+from .metrics import integration_metrics
+
+SLOWEST_CHORES = 10
+# Seconds the integration-wide section is reused across entry downloads
+INTEGRATION_CACHE = 60
 
 
 async def async_get_config_entry_diagnostics(
@@ -15,16 +22,57 @@ async def async_get_config_entry_diagnostics(
     entry: ConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    entities = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
-    entity_data = [
-        entities[entity]
-        for entity in entities
-        if entities[entity].unique_id == entry.data["unique_id"]
-    ][0]
+    entity_data = registry.chore_by_entry_id(hass, entry.entry_id)
+    if entity_data is None and "unique_id" in entry.data:  # From legacy config
+        entity_data = registry.chore_by_unique_id(hass, entry.data["unique_id"])
+    if entity_data is None:
+        return {
+            "integration": _integration_diagnostics(hass),
+            "config_entry": entry.as_dict(),
+        }
     data = {
         "entity_id": entity_data.entity_id,
         "state": entity_data.state,
         "attributes": entity_data.extra_state_attributes,
+        "settings": entity_data.settings,
+        "suppressed_writes": entity_data.suppressed_writes,
+        "metrics": {
+            **entity_data.metrics.as_dict(),
+            "last_compute": entity_data.last_compute,
+        },
+        "integration": _integration_diagnostics(hass),
         "config_entry": entry.as_dict(),
     }
+    if (trace := entity_data.trace) is not None:
+        data["trace"] = trace
+    if (ledger := hass.data[const.DOMAIN].get(const.LEDGER)) is not None:
+        data["ledger"] = ledger.as_dict()["people"]
     return data
+
+
+def _integration_diagnostics(hass: HomeAssistant) -> dict[str, Any]:
+    """Return integration-wide metrics, with the slowest chores first.
+
+    The fleet is scanned at most once per INTEGRATION_CACHE seconds, however
+    many entries are downloaded.
+    """
+    now = monotonic()
+    cached = hass.data[const.DOMAIN].get(const.INTEGRATION_DIAGNOSTICS)
+    if cached is not None and now - cached[0] < INTEGRATION_CACHE:
+        return cached[1]
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM].values()
+    slowest = nlargest(SLOWEST_CHORES, chores, key=lambda chore: chore.metrics.max)
+    diagnostics = {
+        "chores": len(chores),
+        "metrics": integration_metrics(hass).as_dict(),
+        "slowest_chores": [
+            {
+                "entity_id": chore.entity_id,
+                "max_ms": round(chore.metrics.max * 1000, 3),
+                "total_ms": round(chore.metrics.total * 1000, 3),
+            }
+            for chore in slowest
+        ],
+    }
+    hass.data[const.DOMAIN][const.INTEGRATION_DIAGNOSTICS] = now, diagnostics
+    return diagnostics
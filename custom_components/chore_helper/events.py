@@ -0,0 +1,149 @@
+"""Dispatching of chore_helper_loaded events."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from . import const, helpers
+
+AGGREGATE_DELAY = 1
+LISTENER_CHECK_INTERVAL = 1
+
+
+class LoadedEventDispatcher:
+    """Fire chore_helper_loaded events, only when somebody listens.
+
+    The payload is either the full list of due dates, a compact form (start
+    ordinal plus deltas) or only the dates that changed since the last event.
+    Optionally, the events of one refresh cycle are aggregated into one.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_mode",
+        "_aggregate",
+        "_pending",
+        "_unsub_flush",
+        "_last_sent",
+        "_listening",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        mode: str = const.LOADED_EVENT_FULL,
+        aggregate: bool = False,
+    ) -> None:
+        """Create a dispatcher."""
+        self._hass = hass
+        self._mode = mode
+        self._aggregate = aggregate
+        self._pending: list[dict[str, Any]] = []
+        self._unsub_flush = None
+        self._last_sent: dict[str, tuple[int, ...]] = {}
+        self._listening: tuple[float, bool] = (float("-inf"), False)
+
+    def has_listeners(self) -> bool:
+        """Return True if anything listens to the event.
+
+        The answer is cached briefly, as a refresh cycle asks once per chore.
+        """
+        now = self._hass.loop.time()
+        if now - self._listening[0] > LISTENER_CHECK_INTERVAL:
+            listening = (
+                self._hass.bus.async_listeners().get(const.EVENT_LOADED, 0) > 0
+            )
+            self._listening = (now, listening)
+        return self._listening[1]
+
+    @callback
+    def loaded(self, entity_id: str, due_dates: list[date]) -> None:
+        """Report the due dates loaded by a chore.
+
+        While nobody listens, the dates last sent are forgotten: the first
+        changed event after a listener subscribes lists all the dates.
+        """
+        if not self.has_listeners():
+            self._last_sent.pop(entity_id, None)
+            return
+        payload = self._payload(entity_id, due_dates)
+        if payload is None:
+            return
+        if not self._aggregate:
+            self._hass.bus.async_fire(const.EVENT_LOADED, payload)
+            return
+        self._pending.append(payload)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self._hass, AGGREGATE_DELAY, self._async_flush
+            )
+
+    def _payload(self, entity_id: str, due_dates: list[date]) -> dict[str, Any] | None:
+        """Build the event payload for the configured mode."""
+        if self._mode == const.LOADED_EVENT_COMPACT:
+            ordinals = [d.toordinal() for d in due_dates]
+            return {
+                "entity_id": entity_id,
+                "start": ordinals[0] if ordinals else None,
+                "deltas": [b - a for a, b in zip(ordinals, ordinals[1:])],
+            }
+        if self._mode == const.LOADED_EVENT_CHANGED:
+            ordinals = tuple(d.toordinal() for d in due_dates)
+            previous = self._last_sent.get(entity_id)
+            if previous == ordinals:
+                return None
+            self._last_sent[entity_id] = ordinals
+            before = set(previous or ())
+            after = set(ordinals)
+            return {
+                "entity_id": entity_id,
+                "added": [
+                    date.fromordinal(o).isoformat() for o in sorted(after - before)
+                ],
+                "removed": [
+                    date.fromordinal(o).isoformat() for o in sorted(before - after)
+                ],
+            }
+        return {
+            "entity_id": entity_id,
+            "due_dates": helpers.dates_to_texts(due_dates),
+        }
+
+    @callback
+    def forget(self, entity_id: str) -> None:
+        """Drop what is kept for a removed chore."""
+        self._last_sent.pop(entity_id, None)
+        self._pending = [
+            payload for payload in self._pending if payload["entity_id"] != entity_id
+        ]
+        if not self._pending:
+            self.async_cancel()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the pending aggregated event."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._pending = []
+
+    @callback
+    def _async_flush(self, _: Any = None) -> None:
+        """Fire one event with all chores loaded in this cycle."""
+        self._unsub_flush = None
+        if self._pending:
+            self._hass.bus.async_fire(const.EVENT_LOADED, {"chores": self._pending})
+            self._pending = []
+
+
+def loaded_events(hass: HomeAssistant) -> LoadedEventDispatcher:
+    """Return the integration-wide dispatcher."""
+    if (dispatcher := hass.data[const.DOMAIN].get(const.LOADED_EVENTS)) is None:
+        dispatcher = hass.data[const.DOMAIN][const.LOADED_EVENTS] = (
+            LoadedEventDispatcher(hass)
+        )
+    return dispatcher
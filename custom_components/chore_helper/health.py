@@ -0,0 +1,112 @@
+"""Integration health sensor."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from time import monotonic
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from . import const
+from .metrics import SECTION_CALENDAR, integration_metrics, integration_throughput
+
+HEALTH_INTERVAL = timedelta(seconds=60)
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return round(seconds * 1000, 3) if seconds is not None else None
+
+
+def loop_time(hass: HomeAssistant) -> float:
+    """Return the total time the integration spent in instrumented code.
+
+    Only sections that do not contain one another are counted: service calls
+    are awaited and wrap schedule and state updates, and calendar queries are
+    timed per chore within the whole query, which is counted once. The time
+    of removed chores is kept, so that the total never goes down.
+    """
+    total = integration_throughput(hass).removed_loop_time + sum(
+        chore.metrics.loop_total
+        for chore in hass.data[const.DOMAIN][const.SENSOR_PLATFORM].values()
+    )
+    calendar = integration_metrics(hass).timings.get(SECTION_CALENDAR)
+    if calendar is not None:
+        total += calendar.total
+    return total
+
+
+def cache_hit_rates(hass: HomeAssistant) -> dict[str, float | None]:
+    """Return the hit rate of each cache, over all chores."""
+    counters: dict[str, list[int]] = {}
+    for chore in hass.data[const.DOMAIN][const.SENSOR_PLATFORM].values():
+        for cache, (hits, misses) in chore.metrics.cache.items():
+            total = counters.setdefault(cache, [0, 0])
+            total[0] += hits
+            total[1] += misses
+    return {
+        cache: round(hits / (hits + misses), 3) if hits + misses else None
+        for cache, (hits, misses) in counters.items()
+    }
+
+
+class HealthSensor(SensorEntity):
+    """Operational metrics of the whole integration.
+
+    The state is the event loop time spent by the integration per minute, in
+    milliseconds; the attributes hold the throughput counters.
+    """
+
+    _attr_has_entity_name = False
+    _attr_should_poll = False
+    _attr_icon = "mdi:heart-pulse"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({const.ATTR_CACHE_HIT_RATES})
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create the sensor."""
+        self.hass = hass
+        self._attr_name = const.HEALTH_SENSOR_NAME
+        self._attr_unique_id = f"{const.DOMAIN}_health"
+        self._sample: tuple[float, float] = (monotonic(), loop_time(hass))
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the metrics periodically."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(self.hass, self._async_refresh, HEALTH_INTERVAL)
+        )
+        self._async_refresh()
+
+    @callback
+    def _async_refresh(self, _: datetime | None = None) -> None:
+        """Sample the metrics and write the state."""
+        now, spent = monotonic(), loop_time(self.hass)
+        sampled, sampled_spent = self._sample
+        self._sample = (now, spent)
+        if now > sampled:
+            self._attr_native_value = round(
+                (spent - sampled_spent) * 1000 * 60 / (now - sampled), 3
+            )
+        throughput = integration_throughput(self.hass)
+        chores = self.hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+        self._attr_extra_state_attributes = {
+            const.ATTR_CHORES: len(chores),
+            const.ATTR_LAST_REFRESH_MS: _ms(throughput.last_refresh),
+            const.ATTR_STATE_WRITES_PER_MINUTE: throughput.state_writes.per_minute(),
+            const.ATTR_SUPPRESSED_WRITES: sum(
+                chore.suppressed_writes for chore in chores.values()
+            ),
+            const.ATTR_CALENDAR_QUERIES_PER_MINUTE: (
+                throughput.calendar_queries.per_minute()
+            ),
+            const.ATTR_CALENDAR_P95_MS: _ms(
+                throughput.calendar_queries.percentile(95)
+            ),
+            const.ATTR_CACHE_HIT_RATES: cache_hit_rates(self.hass),
+        }
+        self.async_write_ha_state()
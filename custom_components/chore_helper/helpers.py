@@ -3,12 +3,14 @@
 # Borrowed from Garbage Collection integration.
 from __future__ import annotations
 
-from datetime import date, datetime
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import homeassistant.util.dt as dt_util
 import voluptuous as vol
-from dateutil.parser import ParserError, parse
 
 
 def now() -> datetime:
@@ -33,14 +35,88 @@ def to_date(day: Any) -> date:
         raise ValueError(f"Invalid date format: {day}") from error
 
 
+def to_time(value: Any) -> time | None:
+    """Convert a time or "HH:MM[:SS]" text to time, None if not set or invalid."""
+    if isinstance(value, time):
+        return value
+    if not value:
+        return None
+    try:
+        return time.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def parse_datetime(text: str) -> datetime | None:
     """Parse text to datetime object."""
+    if isinstance(text, datetime):
+        return text
+    try:
+        return datetime.fromisoformat(text)
+    except (TypeError, ValueError):
+        pass
+    # Loaded on first use: most texts are ISO formatted
+    # pylint: disable-next=import-outside-toplevel
+    from dateutil.parser import ParserError, parse
+
     try:
         return parse(text)
     except (ParserError, TypeError):
         return None
 
 
+def freeze(value: Any) -> Any:
+    """Convert dicts and lists to tuples, so that the value can be hashed."""
+    if isinstance(value, dict):
+        return tuple((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _ordinal(text: str) -> int | None:
+    """Convert an ISO date text to a day ordinal, None if invalid."""
+    try:
+        return date.fromisoformat(text).toordinal()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def date_ordinals(texts: str | None) -> tuple[int, ...]:
+    """Convert space separated ISO dates (an override list) to day ordinals.
+
+    Override lists rarely change, so the result is cached per text.
+    """
+    if not texts:
+        return ()
+    ordinals = (_ordinal(text) for text in texts.split(" "))
+    return tuple(ordinal for ordinal in ordinals if ordinal is not None)
+
+
+@lru_cache(maxsize=1024)
+def date_ordinal_set(texts: str | None) -> frozenset[int]:
+    """Return the day ordinals of an override list as a set."""
+    return frozenset(date_ordinals(texts))
+
+
+@lru_cache(maxsize=1024)
+def offset_ordinals(texts: str | None) -> Mapping[int, int]:
+    """Convert space separated "date:offset" texts to a day ordinal map.
+
+    The first offset of a day wins.
+    """
+    offsets: dict[int, int] = {}
+    for text in (texts or "").split(" "):
+        day, _, offset = text.partition(":")
+        if (ordinal := _ordinal(day)) is not None and ordinal not in offsets:
+            try:
+                offsets[ordinal] = int(offset)
+            except ValueError:
+                continue
+    return MappingProxyType(offsets)
+
+
 def dates_to_texts(dates: list[date]) -> list[str]:
     """Convert list of dates to texts."""
     converted: list[str] = []
@@ -62,6 +138,22 @@ def time_text(value: Any) -> str:
         raise vol.Invalid(f"Invalid date: {value}") from error
 
 
+def date_list_text(value: Any) -> str:
+    """Validate a list of ISO dates, separated by spaces, commas or lines.
+
+    The dates are stored space separated, like the override lists.
+    """
+    if value is None or value == "":
+        return ""
+    texts = str(value).replace(",", " ").split()
+    for text in texts:
+        try:
+            date.fromisoformat(text)
+        except ValueError as error:
+            raise vol.Invalid(f"Invalid date: {text}") from error
+    return " ".join(texts)
+
+
 def month_day_text(value: Any) -> str:
     """Validate format month/day."""
     if value is None or value == "":
@@ -0,0 +1,88 @@
+"""Persistent ledger of who completed which chore."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from . import const
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{const.DOMAIN}.ledger"
+SAVE_DELAY = 30
+MAX_RECORDS = 1000
+
+
+class CompletionLedger:
+    """Append-only completion records with running per-person aggregates.
+
+    Records are kept in a bounded buffer; the aggregates cover every completion
+    ever recorded and are updated in constant time on each append. Saving is
+    delayed so that bursts of completions are written in a single batch.
+    """
+
+    __slots__ = "_store", "_records", "_people"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create an empty ledger."""
+        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._records: deque[dict[str, Any]] = deque(maxlen=MAX_RECORDS)
+        self._people: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the ledger from storage."""
+        if (data := await self._store.async_load()) is None:
+            return
+        self._records.extend(data.get("records", []))
+        self._people = data.get("people", {})
+
+    def record(
+        self,
+        chore_id: str,
+        person_id: str | None,
+        completed: datetime,
+        lateness: int | None,
+    ) -> None:
+        """Append a completion and update the person's aggregates."""
+        self._records.append(
+            {
+                "chore": chore_id,
+                "person": person_id,
+                "timestamp": completed.isoformat(),
+                "lateness": lateness,
+            }
+        )
+        if person_id is not None:
+            totals = self._people.setdefault(
+                person_id,
+                {"count": 0, "on_time": 0, "lateness_total": 0, "last": None},
+            )
+            totals["count"] += 1
+            if lateness is not None:
+                totals["lateness_total"] += lateness
+                if lateness <= 0:
+                    totals["on_time"] += 1
+            totals["last"] = completed.isoformat()
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def person_totals(self, person_id: str) -> dict[str, Any]:
+        """Return the aggregates of a person."""
+        return self._people.get(
+            person_id, {"count": 0, "on_time": 0, "lateness_total": 0, "last": None}
+        )
+
+    def completion_count(self, person_id: str) -> int:
+        """Return how many chores a person has completed."""
+        return self.person_totals(person_id)["count"]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the ledger contents for reporting."""
+        return {"people": self._people, "records": list(self._records)}
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return self.as_dict()
@@ -0,0 +1,227 @@
+"""Lightweight timing instrumentation of the chore hot paths."""
+
+from __future__ import annotations
+
+from collections import deque
+from time import monotonic, perf_counter
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import const
+
+SECTION_SCHEDULE = "schedule"
+SECTION_STATE = "state"
+SECTION_CALENDAR = "calendar"
+SECTION_SERVICE = "service"
+# Sections that await other work: they are timed in wall time, not loop time
+WALL_TIME_SECTIONS = frozenset({SECTION_SERVICE})
+# Chore sections that do not contain one another
+LOOP_SECTIONS = (SECTION_SCHEDULE, SECTION_STATE)
+
+RATE_WINDOW = 60
+REFRESH_GAP = 5
+
+
+class TimingStats:
+    """Count, cumulative, maximum and last duration of a code section."""
+
+    __slots__ = "count", "total", "max", "last"
+
+    def __init__(self) -> None:
+        """Create empty statistics."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, duration: float) -> None:
+        """Add a duration in seconds."""
+        self.count += 1
+        self.total += duration
+        self.last = duration
+        if duration > self.max:
+            self.max = duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in milliseconds."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "last_ms": round(self.last * 1000, 3),
+        }
+
+
+class _Timer:
+    """Context manager recording the time spent in a section."""
+
+    __slots__ = "_stats", "_started"
+
+    def __init__(self, stats: TimingStats) -> None:
+        self._stats = stats
+        self._started = 0.0
+
+    def __enter__(self) -> _Timer:
+        self._started = perf_counter()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self._stats.record(perf_counter() - self._started)
+
+
+class Metrics:
+    """Timings per section and cache hit/miss counters."""
+
+    __slots__ = "timings", "cache"
+
+    def __init__(self) -> None:
+        """Create empty metrics."""
+        self.timings: dict[str, TimingStats] = {}
+        self.cache: dict[str, list[int]] = {}
+
+    def timed(self, section: str) -> _Timer:
+        """Return a context manager timing a section."""
+        if (stats := self.timings.get(section)) is None:
+            stats = self.timings[section] = TimingStats()
+        return _Timer(stats)
+
+    def cache_access(self, cache: str, hit: bool) -> None:
+        """Count a cache hit or miss."""
+        if (counters := self.cache.get(cache)) is None:
+            counters = self.cache[cache] = [0, 0]
+        counters[0 if hit else 1] += 1
+
+    @property
+    def total(self) -> float:
+        """Return the total loop time spent in all sections, in seconds."""
+        return sum(
+            stats.total
+            for section, stats in self.timings.items()
+            if section not in WALL_TIME_SECTIONS
+        )
+
+    @property
+    def loop_total(self) -> float:
+        """Return the time spent in LOOP_SECTIONS, in seconds."""
+        return sum(
+            stats.total
+            for section in LOOP_SECTIONS
+            if (stats := self.timings.get(section)) is not None
+        )
+
+    @property
+    def max(self) -> float:
+        """Return the longest loop time of any section, in seconds."""
+        return max(
+            (
+                stats.max
+                for section, stats in self.timings.items()
+                if section not in WALL_TIME_SECTIONS
+            ),
+            default=0.0,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics, wall time sections apart."""
+        return {
+            "timings": {
+                section: stats.as_dict()
+                for section, stats in self.timings.items()
+                if section not in WALL_TIME_SECTIONS
+            },
+            "wall_timings": {
+                section: stats.as_dict()
+                for section, stats in self.timings.items()
+                if section in WALL_TIME_SECTIONS
+            },
+            "cache": {
+                cache: {"hits": hits, "misses": misses}
+                for cache, (hits, misses) in self.cache.items()
+            },
+        }
+
+
+def integration_metrics(hass: HomeAssistant) -> Metrics:
+    """Return the integration-wide metrics."""
+    if (metrics := hass.data[const.DOMAIN].get(const.METRICS)) is None:
+        metrics = hass.data[const.DOMAIN][const.METRICS] = Metrics()
+    return metrics
+
+
+class RateWindow:
+    """Events of the last minute, with an optional duration each."""
+
+    __slots__ = "_events"
+
+    def __init__(self) -> None:
+        """Create an empty window."""
+        self._events: deque[tuple[float, float]] = deque()
+
+    def add(self, duration: float = 0.0) -> None:
+        """Record an event that happened now."""
+        now = monotonic()
+        self._events.append((now, duration))
+        self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        """Drop the events older than the window."""
+        while self._events and now - self._events[0][0] > RATE_WINDOW:
+            self._events.popleft()
+
+    def per_minute(self) -> int:
+        """Return the number of events in the last minute."""
+        self._expire(monotonic())
+        return len(self._events)
+
+    def percentile(self, percent: int) -> float | None:
+        """Return a percentile of the durations in the last minute."""
+        self._expire(monotonic())
+        if not self._events:
+            return None
+        durations = sorted(duration for _, duration in self._events)
+        return durations[min(len(durations) - 1, len(durations) * percent // 100)]
+
+
+class Throughput:
+    """Integration-wide operational counters."""
+
+    __slots__ = (
+        "state_writes",
+        "calendar_queries",
+        "last_refresh",
+        "removed_loop_time",
+        "_refresh_started",
+        "_refresh_ended",
+    )
+
+    def __init__(self) -> None:
+        """Create empty counters."""
+        self.state_writes = RateWindow()
+        self.calendar_queries = RateWindow()
+        self.last_refresh: float | None = None
+        # Loop time of the chores removed since startup
+        self.removed_loop_time = 0.0
+        self._refresh_started: float | None = None
+        self._refresh_ended = 0.0
+
+    def refreshed(self, started: float, ended: float) -> None:
+        """Record a chore update (monotonic times).
+
+        Updates closer than REFRESH_GAP to each other belong to the same
+        refresh cycle; its duration runs from the first start to the last end.
+        """
+        if (
+            self._refresh_started is None
+            or started - self._refresh_ended > REFRESH_GAP
+        ):
+            self._refresh_started = started
+        self._refresh_ended = ended
+        self.last_refresh = ended - self._refresh_started
+
+
+def integration_throughput(hass: HomeAssistant) -> Throughput:
+    """Return the integration-wide operational counters."""
+    if (throughput := hass.data[const.DOMAIN].get(const.THROUGHPUT)) is None:
+        throughput = hass.data[const.DOMAIN][const.THROUGHPUT] = Throughput()
+    return throughput
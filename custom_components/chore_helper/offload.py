@@ -0,0 +1,32 @@
+"""Size-based policy for running schedule computations off the event loop.
+
+Handing a job to the executor costs a thread switch, which is more than
+most chores need, so only large computations are offloaded. The result is
+awaited on the event loop, where the caller merges it back.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+
+_T = TypeVar("_T")
+
+# Forecast dates and date overrides a schedule may have before it is offloaded
+SCHEDULE_INLINE_DATES = 100
+
+
+def schedule_inline(forecast_dates: int, overrides: int = 0) -> bool:
+    """Return True if a schedule is small enough to compute inline."""
+    return forecast_dates + overrides <= SCHEDULE_INLINE_DATES
+
+
+async def async_run(
+    hass: HomeAssistant, inline: bool, target: Callable[..., _T], *args: Any
+) -> _T:
+    """Run a job inline, or in the executor if it is too large for the loop."""
+    if inline:
+        return target(*args)
+    return await hass.async_add_executor_job(target, *args)
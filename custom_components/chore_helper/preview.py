@@ -0,0 +1,66 @@
+"""Schedule preview for the config and options flows."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from . import const, helpers
+
+if TYPE_CHECKING:
+    from .blackout import BlackoutIndex
+    from .chore import Chore
+
+PREVIEW_DATES = 10
+
+
+def preview_dates(
+    engine: type[Chore],
+    options: Mapping[str, Any],
+    last_completed: datetime | None = None,
+    count: int = PREVIEW_DATES,
+    blackouts: BlackoutIndex | None = None,
+) -> list[date]:
+    """Run the schedule engine on unsaved options and return the next dates.
+
+    Dates are listed from today on, or from the start date if it is later.
+
+    The chore is never added to Home Assistant, only its schedule is used.
+    """
+    options = {
+        **options,
+        const.CONF_FORECAST_DATES: max(
+            count, int(options.get(const.CONF_FORECAST_DATES) or 0)
+        ),
+    }
+    entry = SimpleNamespace(
+        options=options,
+        data={},
+        entry_id="preview",
+        title=options.get("name"),
+    )
+    chore = engine(entry)
+    chore.last_completed = last_completed
+    chore._blackout = blackouts  # pylint: disable=protected-access
+    today = helpers.now().date()
+    dates = chore.chore_schedule(today)
+    return sorted({day for day in dates if _day(day) >= today})[:count]
+
+
+def _day(value: date) -> date:
+    """Return the day of a due date or of a sub-daily due time."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def preview_text(dates: list[date]) -> str:
+    """Format the preview dates, or due times, for a form description."""
+    if not dates:
+        return "-"
+    return "\n".join(
+        f"- {day.strftime('%a %Y-%m-%d %H:%M')}"
+        if isinstance(day, datetime)
+        else f"- {day.strftime('%a')} {day.isoformat()}"
+        for day in dates
+    )
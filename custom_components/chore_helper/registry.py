@@ -0,0 +1,46 @@
+"""Lookup of chore entities by entity ID, unique ID and config entry ID."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+
+from . import const
+
+if TYPE_CHECKING:
+    from .chore import Chore
+
+
+def register(hass: HomeAssistant, chore: Chore) -> None:
+    """Add a chore to the entity ID map and its secondary indexes."""
+    data = hass.data[const.DOMAIN]
+    data[const.SENSOR_PLATFORM][chore.entity_id] = chore
+    data.setdefault(const.UNIQUE_ID_INDEX, {})[chore.unique_id] = chore
+    data.setdefault(const.ENTRY_ID_INDEX, {})[chore.config_entry.entry_id] = chore
+
+
+def unregister(hass: HomeAssistant, chore: Chore) -> None:
+    """Remove a chore from the entity ID map and its secondary indexes."""
+    data = hass.data[const.DOMAIN]
+    data[const.SENSOR_PLATFORM].pop(chore.entity_id, None)
+    if data.get(const.UNIQUE_ID_INDEX, {}).get(chore.unique_id) is chore:
+        del data[const.UNIQUE_ID_INDEX][chore.unique_id]
+    if data.get(const.ENTRY_ID_INDEX, {}).get(chore.config_entry.entry_id) is chore:
+        del data[const.ENTRY_ID_INDEX][chore.config_entry.entry_id]
+
+
+def chore_by_entity_id(hass: HomeAssistant, entity_id: str) -> Chore:
+    """Return the chore with an entity ID, raising KeyError if unknown."""
+    return hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
+
+
+def chore_by_unique_id(hass: HomeAssistant, unique_id: str) -> Chore | None:
+    """Return the chore with a unique ID."""
+    return hass.data[const.DOMAIN].get(const.UNIQUE_ID_INDEX, {}).get(unique_id)
+
+
+def chore_by_entry_id(hass: HomeAssistant, entry_id: str) -> Chore | None:
+    """Return the chore created by a config entry, None if it is not loaded."""
+    data = hass.data.get(const.DOMAIN, {})
+    return data.get(const.ENTRY_ID_INDEX, {}).get(entry_id)
@@ -8,22 +8,33 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import const
-from .chore_blank import BlankChore
-from .chore_daily import DailyChore
-from .chore_monthly import MonthlyChore
-from .chore_weekly import WeeklyChore
-from .chore_yearly import YearlyChore
 from .const import LOGGER
+from .health import HealthSensor
 
 
-SCAN_INTERVAL = timedelta(seconds=10)
 THROTTLE_INTERVAL = timedelta(seconds=60)
 
 
+async def async_setup_platform(
+    hass: HomeAssistant,
+    _: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Create the integration health sensor, when enabled in YAML."""
+    if discovery_info is None:
+        return
+    async_add_entities([HealthSensor(hass)])
+
+
 async def async_setup_entry(
-    _: HomeAssistant, config_entry: ConfigEntry, async_add_devices: AddEntitiesCallback
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_devices: AddEntitiesCallback,
 ) -> None:
     """Create chore entities defined in config_flow and add them to HA."""
     frequency = config_entry.options.get(const.CONF_FREQUENCY)
@@ -32,19 +43,11 @@ async def async_setup_entry(
         if config_entry.title is not None
         else config_entry.data.get(CONF_NAME)
     )
-    _frequency_function = {
-        "every-n-days": DailyChore,
-        "every-n-weeks": WeeklyChore,
-        "every-n-months": MonthlyChore,
-        "every-n-years": YearlyChore,
-        "after-n-days": DailyChore,
-        "after-n-weeks": WeeklyChore,
-        "after-n-months": MonthlyChore,
-        "after-n-years": YearlyChore,
-        "blank": BlankChore,
-    }
-    if frequency in _frequency_function:
-        async_add_devices([_frequency_function[frequency](config_entry)], True)
+    if frequency in const.FREQUENCY_ENGINES:
+        # Engines are imported on first use
+        module_name, class_name = const.FREQUENCY_ENGINES[frequency]
+        module = await async_import_module(hass, f"{__package__}.{module_name}")
+        async_add_devices([getattr(module, class_name)(config_entry)], True)
     else:
         LOGGER.error("(%s) Unknown frequency %s", name, frequency)
         raise ValueError
@@ -0,0 +1,62 @@
+"""Snapshot of the computed schedules, for a warm start after a restart."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from . import const
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{const.DOMAIN}.schedule"
+SAVE_DELAY = 30
+
+
+class ScheduleSnapshot:
+    """Computed due dates of all chores, kept in a single compact file.
+
+    Each chore is stored as [fingerprint, day, due dates...], where the day
+    and the due dates are ordinals. A snapshot is only served on the day it
+    was computed, for the same input fingerprint.
+    """
+
+    __slots__ = "_store", "_chores"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create an empty snapshot."""
+        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._chores: dict[str, list[int]] = {}
+
+    async def async_load(self) -> None:
+        """Load the snapshot saved before the restart."""
+        if (data := await self._store.async_load()) is not None:
+            self._chores = data.get("chores", {})
+
+    def get(self, chore_id: str, fingerprint: int, today: date) -> list[date] | None:
+        """Return the due dates of a chore, if still valid."""
+        entry = self._chores.get(chore_id)
+        if entry is None or entry[:2] != [fingerprint, today.toordinal()]:
+            return None
+        return [date.fromordinal(ordinal) for ordinal in entry[2:]]
+
+    def set(
+        self, chore_id: str, fingerprint: int, today: date, due_dates: list[date]
+    ) -> None:
+        """Record the due dates of a chore, scheduling a save if they changed."""
+        entry = [fingerprint, today.toordinal(), *(d.toordinal() for d in due_dates)]
+        if self._chores.get(chore_id) == entry:
+            return
+        self._chores[chore_id] = entry
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def remove(self, chore_id: str) -> None:
+        """Forget the schedule of a chore."""
+        if self._chores.pop(chore_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"chores": self._chores}
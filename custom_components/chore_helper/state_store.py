@@ -0,0 +1,54 @@
+"""Storage of chore runtime state, independent of the recorder."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from . import const
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{const.DOMAIN}.state"
+SAVE_DELAY = 10
+
+
+class ChoreStateStore:
+    """Runtime state of all chores, kept in a single versioned file.
+
+    The file is read once at startup. Changes are written with a delay so that
+    many chores changing together result in a single write.
+    """
+
+    __slots__ = "_store", "_chores"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create an empty state store."""
+        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._chores: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the state of all chores."""
+        if (data := await self._store.async_load()) is not None:
+            self._chores = data.get("chores", {})
+
+    def get(self, chore_id: str) -> dict[str, Any] | None:
+        """Return the stored state of a chore."""
+        return self._chores.get(chore_id)
+
+    def set(self, chore_id: str, state: dict[str, Any]) -> None:
+        """Update the state of a chore, scheduling a save if it changed."""
+        if self._chores.get(chore_id) == state:
+            return
+        self._chores[chore_id] = state
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def remove(self, chore_id: str) -> None:
+        """Forget the state of a chore."""
+        if self._chores.pop(chore_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"chores": self._chores}
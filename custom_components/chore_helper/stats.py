@@ -0,0 +1,124 @@
+"""Streaming statistics over the completions of a chore."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+import math
+from typing import Any
+
+from . import const, helpers
+
+
+class CompletionStats:
+    """Recent completions plus single-pass aggregates.
+
+    The mean and variance of the interval between completions use Welford's
+    online algorithm, so each completion is folded in without revisiting the
+    history.
+    """
+
+    __slots__ = (
+        "history",
+        "count",
+        "_last",
+        "_interval_count",
+        "_interval_mean",
+        "_interval_m2",
+        "_lateness_count",
+        "_lateness_mean",
+        "_on_time",
+    )
+
+    def __init__(self, size: int = const.DEFAULT_HISTORY_SIZE) -> None:
+        """Create empty statistics."""
+        self.history: deque[str] = deque(maxlen=size)
+        self.count = 0
+        self._last: datetime | None = None
+        self._interval_count = 0
+        self._interval_mean = 0.0
+        self._interval_m2 = 0.0
+        self._lateness_count = 0
+        self._lateness_mean = 0.0
+        self._on_time = 0
+
+    def add(self, completed: datetime, lateness: int | None) -> None:
+        """Fold a completion into the statistics."""
+        self.history.append(completed.isoformat())
+        self.count += 1
+        try:
+            interval = (completed - self._last).total_seconds() / 86400
+        except TypeError:  # no previous completion, or naive and aware mixed
+            interval = None
+        if interval is not None:
+            self._interval_count += 1
+            delta = interval - self._interval_mean
+            self._interval_mean += delta / self._interval_count
+            self._interval_m2 += delta * (interval - self._interval_mean)
+        self._last = completed
+        if lateness is not None:
+            self._lateness_count += 1
+            self._lateness_mean += (lateness - self._lateness_mean) / (
+                self._lateness_count
+            )
+            if lateness <= 0:
+                self._on_time += 1
+
+    @property
+    def interval_variance(self) -> float | None:
+        """Return the sample variance of the interval between completions."""
+        if self._interval_count < 2:
+            return None
+        return self._interval_m2 / (self._interval_count - 1)
+
+    def as_attributes(self) -> dict[str, Any]:
+        """Return the statistics as state attributes."""
+        variance = self.interval_variance
+        return {
+            const.ATTR_COMPLETION_COUNT: self.count,
+            const.ATTR_INTERVAL_MEAN: (
+                round(self._interval_mean, 2) if self._interval_count else None
+            ),
+            const.ATTR_INTERVAL_STDEV: (
+                round(math.sqrt(variance), 2) if variance is not None else None
+            ),
+            const.ATTR_LATENESS_MEAN: (
+                round(self._lateness_mean, 2) if self._lateness_count else None
+            ),
+            const.ATTR_ON_TIME_RATIO: (
+                round(self._on_time / self._lateness_count, 3)
+                if self._lateness_count
+                else None
+            ),
+            const.ATTR_RECENT_COMPLETIONS: list(self.history),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for storage."""
+        return {
+            "history": list(self.history),
+            "count": self.count,
+            "last": self._last.isoformat() if self._last else None,
+            "interval": [self._interval_count, self._interval_mean, self._interval_m2],
+            "lateness": [self._lateness_count, self._lateness_mean, self._on_time],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CompletionStats:
+        """Restore statistics saved by as_dict."""
+        stats = cls()
+        stats.history.extend(data.get("history", []))
+        stats.count = data.get("count", 0)
+        if (last := data.get("last")) is not None:
+            stats._last = helpers.parse_datetime(last)
+        (
+            stats._interval_count,
+            stats._interval_mean,
+            stats._interval_m2,
+        ) = data.get("interval", [0, 0.0, 0.0])
+        (
+            stats._lateness_count,
+            stats._lateness_mean,
+            stats._on_time,
+        ) = data.get("lateness", [0, 0.0, 0])
+        return stats
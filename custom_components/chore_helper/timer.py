@@ -0,0 +1,122 @@
+"""A single timer for the state transitions of all chores.
+
+Chores change state at midnight and, when they have a due time, when they
+become overdue. Instead of polling every chore, each chore schedules its
+next transition here: the transitions are kept in a heap and only the
+earliest one is armed with async_track_point_in_time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from heapq import heapify, heappop, heappush
+from itertools import count
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+
+from . import const
+from .const import LOGGER
+
+TimerAction = Callable[[datetime], None]
+
+
+class DueTimer:
+    """Heap of the next transition of each chore, with one armed timer.
+
+    Rescheduling a chore leaves its old heap entry behind; stale entries
+    are skipped when they come up, and the heap is compacted when they
+    outnumber the live ones.
+    """
+
+    __slots__ = "_hass", "_heap", "_entries", "_sequence", "_armed_at", "_cancel"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create an empty timer."""
+        self._hass = hass
+        self._heap: list[tuple[datetime, int, str]] = []
+        self._entries: dict[str, tuple[tuple[datetime, int, str], TimerAction]] = {}
+        self._sequence = count()
+        self._armed_at: datetime | None = None
+        self._cancel: CALLBACK_TYPE | None = None
+
+    def __len__(self) -> int:
+        """Return the number of scheduled transitions."""
+        return len(self._entries)
+
+    @property
+    def armed_at(self) -> datetime | None:
+        """Return the time the timer is armed for."""
+        return self._armed_at
+
+    def schedule(self, key: str, when: datetime, action: TimerAction) -> None:
+        """Call action at the given time, replacing the transition of key."""
+        if (current := self._entries.get(key)) is not None and current[0][0] == when:
+            self._entries[key] = current[0], action
+            return
+        entry = (when, next(self._sequence), key)
+        self._entries[key] = entry, action
+        heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = [entry for entry, _ in self._entries.values()]
+            heapify(self._heap)
+        self._arm()
+
+    def cancel(self, key: str) -> None:
+        """Forget the transition of key."""
+        if self._entries.pop(key, None) is not None and not self._entries:
+            self._disarm()
+
+    def _arm(self) -> None:
+        """Arm the timer for the earliest live transition."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heappop(self._heap)
+        if not self._heap:
+            self._disarm()
+            return
+        when = self._heap[0][0]
+        if self._armed_at is not None and self._armed_at <= when:
+            return  # Firing early only re-arms
+        self._disarm()
+        self._armed_at = when
+        self._cancel = async_track_point_in_time(self._hass, self._fired, when)
+
+    def _disarm(self) -> None:
+        """Cancel the armed timer."""
+        if self._cancel is not None:
+            self._cancel()
+        self._cancel = None
+        self._armed_at = None
+
+    def _is_live(self, entry: tuple[datetime, int, str]) -> bool:
+        """Return True if a heap entry is the current transition of its key."""
+        current = self._entries.get(entry[2])
+        return current is not None and current[0] is entry
+
+    @callback
+    def _fired(self, now: datetime) -> None:
+        """Run the transitions that are due, then re-arm."""
+        self._cancel = None
+        self._armed_at = None
+        actions: list[TimerAction] = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heappop(self._heap)
+            if self._is_live(entry):
+                actions.append(self._entries.pop(entry[2])[1])
+        try:
+            for action in actions:
+                try:
+                    action(now)
+                except Exception:
+                    # One failing chore must not stop the others
+                    LOGGER.exception("Error in a chore state transition")
+        finally:
+            self._arm()
+
+
+def due_timer(hass: HomeAssistant) -> DueTimer:
+    """Return the integration-wide transition timer."""
+    if (timer := hass.data[const.DOMAIN].get(const.DUE_TIMER)) is None:
+        timer = hass.data[const.DOMAIN][const.DUE_TIMER] = DueTimer(hass)
+    return timer
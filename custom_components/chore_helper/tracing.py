@@ -0,0 +1,69 @@
+"""Per-chore tracing of the schedule computations.
+
+Tracing is switched on at runtime with the chore_helper.trace service, for
+entity IDs matching shell-style patterns. The hot paths only check whether
+the chore has a trace buffer; everything else happens when tracing is on.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import date
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+from . import const
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from .chore import Chore
+
+TRACE_LOGGER = LOGGER.getChild("trace")
+TRACE_BUFFER = 100
+
+
+def _traceable(value: Any) -> Any:
+    """Return a value that can be logged and serialised to JSON."""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, list | tuple):
+        return [_traceable(item) for item in value]
+    return value
+
+
+def new_buffer() -> deque[dict[str, Any]]:
+    """Return an empty trace buffer."""
+    return deque(maxlen=TRACE_BUFFER)
+
+
+def record(
+    buffer: deque[dict[str, Any]], entity_id: str, event: str, fields: dict[str, Any]
+) -> None:
+    """Add a trace event to a buffer and to the trace log."""
+    entry = {"event": event, **{key: _traceable(v) for key, v in fields.items()}}
+    buffer.append(entry)
+    TRACE_LOGGER.info("%s %s", entity_id, entry)
+
+
+def is_traced(hass: HomeAssistant, entity_id: str | None) -> bool:
+    """Return True if an entity ID matches a trace pattern."""
+    patterns = hass.data[const.DOMAIN].get(const.TRACE_PATTERNS)
+    if not patterns or entity_id is None:
+        return False
+    return any(fnmatchcase(entity_id, pattern) for pattern in patterns)
+
+
+def set_tracing(hass: HomeAssistant, patterns: list[str], enabled: bool) -> None:
+    """Add or remove trace patterns and apply them to all chores."""
+    current: set[str] = hass.data[const.DOMAIN].setdefault(
+        const.TRACE_PATTERNS, set()
+    )
+    if enabled:
+        current.update(patterns)
+    else:
+        current.difference_update(patterns)
+    chore: Chore
+    for entity_id, chore in hass.data[const.DOMAIN][const.SENSOR_PLATFORM].items():
+        chore.set_tracing(is_traced(hass, entity_id))
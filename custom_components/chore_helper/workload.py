@@ -0,0 +1,100 @@
+"""Outstanding workload per person, used for least-loaded assignment."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+import heapq
+
+from . import const
+
+
+class WorkloadTracker:
+    """Track the weighted load of upcoming assigned chores for each person.
+
+    A chore counts towards its assignee's load with its effort points while its
+    next due date is within the horizon. Loads are adjusted incrementally when a
+    chore is reassigned or its due date moves, and a min-heap with lazy
+    invalidation returns the least loaded person without scanning all chores.
+    """
+
+    __slots__ = "_horizon", "_chores", "_loads", "_heap"
+
+    def __init__(self, horizon: int = const.DEFAULT_WORKLOAD_HORIZON) -> None:
+        """Create an empty tracker."""
+        self._horizon = timedelta(days=horizon)
+        self._chores: dict[str, tuple[str, float]] = {}
+        self._loads: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    def load(self, person_id: str) -> float:
+        """Return the current load of a person."""
+        return self._loads.get(person_id, 0)
+
+    def assignment(self, chore_id: str) -> tuple[str, float] | None:
+        """Return the assignee of a chore and the load it counts for."""
+        return self._chores.get(chore_id)
+
+    def update(
+        self,
+        chore_id: str,
+        person_id: str | None,
+        effort: float,
+        due_date: date | None,
+        today: date,
+    ) -> None:
+        """Record the assignee and next due date of a chore."""
+        counted = (
+            effort if due_date is not None and due_date <= today + self._horizon else 0
+        )
+        previous = self._chores.get(chore_id)
+        if previous == (person_id, counted):
+            return
+        self.remove(chore_id)
+        if person_id is not None:
+            self._chores[chore_id] = (person_id, counted)
+            self._adjust(person_id, counted)
+
+    def remove(self, chore_id: str) -> None:
+        """Drop a chore's contribution from its assignee's load."""
+        if (previous := self._chores.pop(chore_id, None)) is not None:
+            self._adjust(previous[0], -previous[1])
+
+    def least_loaded(self, candidates: list[str]) -> str | None:
+        """Return the candidate with the lowest load.
+
+        Candidates without any tracked load count as zero. Ties, tracked or
+        not, are broken by the order of the candidates list.
+        """
+        if not candidates:
+            return None
+        wanted = set(candidates)
+        lowest: float | None = None
+        skipped: list[tuple[float, str]] = []
+        while self._heap:
+            load, person_id = self._heap[0]
+            if self._loads.get(person_id) != load:
+                heapq.heappop(self._heap)  # stale entry
+                continue
+            if person_id in wanted:
+                lowest = load
+                break
+            skipped.append(heapq.heappop(self._heap))
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        if lowest is None or (lowest > 0 and not wanted <= self._loads.keys()):
+            lowest = 0
+        for person_id in candidates:
+            if self._loads.get(person_id, 0) == lowest:
+                return person_id
+        return candidates[0]
+
+    def _adjust(self, person_id: str, delta: float) -> None:
+        """Change the load of a person and push the new value to the heap."""
+        if not delta and person_id in self._loads:
+            return
+        load = self._loads.get(person_id, 0) + delta
+        self._loads[person_id] = load
+        heapq.heappush(self._heap, (load, person_id))
+        if len(self._heap) > 2 * len(self._loads) + 16:
+            self._heap = [(value, person) for person, value in self._loads.items()]
+            heapq.heapify(self._heap)
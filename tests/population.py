@@ -0,0 +1,128 @@
+"""Synthetic chore populations for benchmarks and load tests."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.chore_helper import const, registry
+from custom_components.chore_helper.chore_daily import DailyChore
+from custom_components.chore_helper.chore_monthly import MonthlyChore
+from custom_components.chore_helper.chore_weekly import WeeklyChore
+from custom_components.chore_helper.chore_yearly import YearlyChore
+
+START_DATE = date(2024, 1, 1)
+HEAVY_OVERRIDES = 200
+
+ENGINES = {
+    "every-n-days": DailyChore,
+    "after-n-days": DailyChore,
+    "every-n-weeks": WeeklyChore,
+    "after-n-weeks": WeeklyChore,
+    "every-n-months": MonthlyChore,
+    "after-n-months": MonthlyChore,
+    "every-n-years": YearlyChore,
+    "after-n-years": YearlyChore,
+}
+
+TEMPLATES: list[dict[str, Any]] = [
+    {"frequency": "every-n-days", "period": 3},
+    {"frequency": "after-n-days", "period": 10},
+    {"frequency": "every-n-weeks", "period": 2, "chore_day": "sat", "first_week": 1},
+    {"frequency": "after-n-weeks", "period": 1, "chore_day": "mon", "first_week": 1},
+    {"frequency": "every-n-months", "period": 1, "day_of_month": 15},
+    {
+        "frequency": "every-n-months",
+        "period": 2,
+        "chore_day": "wed",
+        "weekday_order_number": "-1",
+    },
+    {
+        "frequency": "after-n-months",
+        "period": 3,
+        "chore_day": "fri",
+        "weekday_order_number": "2",
+        "force_week_order_numbers": True,
+    },
+    {"frequency": "every-n-years", "period": 1, "date": "06/30"},
+    {"frequency": "after-n-years", "period": 2},
+]
+
+MONTH_WINDOWS = [("jan", "dec"), ("apr", "oct"), ("nov", "feb")]
+
+
+def _overrides(count: int) -> dict[str, str]:
+    """Return override strings with count entries each."""
+    days = [START_DATE + timedelta(days=3 * i) for i in range(count)]
+    return {
+        "remove_dates": " ".join(d.isoformat() for d in days),
+        "offset_dates": " ".join(f"{d.isoformat()}:1" for d in days),
+        "add_dates": " ".join((d + timedelta(days=1)).isoformat() for d in days),
+    }
+
+
+def make_options(index: int, heavy: bool = False) -> dict[str, Any]:
+    """Return the options of the index-th chore of a population."""
+    template = TEMPLATES[index % len(TEMPLATES)]
+    first_month, last_month = MONTH_WINDOWS[(index // len(TEMPLATES)) % 3]
+    options = {
+        "name": f"Chore {index}",
+        "start_date": START_DATE.isoformat(),
+        "forecast_dates": 10,
+        "first_month": first_month,
+        "last_month": last_month,
+        **template,
+    }
+    if heavy:
+        options["overrides"] = _overrides(HEAVY_OVERRIDES)
+    return options
+
+
+def make_chore(index: int, heavy: bool = False) -> Any:
+    """Create a chore entity without Home Assistant."""
+    options = make_options(index, heavy)
+    overrides = options.pop("overrides", {})
+    entry = SimpleNamespace(
+        options=options,
+        data={},
+        entry_id=f"entry_{index}",
+        title=options["name"],
+    )
+    chore = ENGINES[options["frequency"]](entry)
+    chore._remove_dates = overrides.get("remove_dates")
+    chore._offset_dates = overrides.get("offset_dates")
+    chore._add_dates = overrides.get("add_dates")
+    chore.entity_id = f"sensor.chore_{index}"
+    return chore
+
+
+def make_population(size: int, heavy_every: int = 10) -> list[Any]:
+    """Create size chores; every heavy_every-th one has long override lists."""
+    return [
+        make_chore(index, heavy=heavy_every > 0 and index % heavy_every == 0)
+        for index in range(size)
+    ]
+
+
+async def async_add_chore(
+    hass: HomeAssistant, options: dict[str, Any], entry_id: str | None = None
+) -> Any:
+    """Set up the integration if needed, then a chore; return its entity."""
+    if const.DOMAIN not in hass.config.components:
+        assert await async_setup_component(hass, const.DOMAIN, {})
+    entry = MockConfigEntry(
+        domain=const.DOMAIN,
+        title=options["name"],
+        options=options,
+        version=const.CONFIG_VERSION,
+        entry_id=entry_id,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return registry.chore_by_entry_id(hass, entry.entry_id)
@@ -8,32 +8,42 @@ from custom_components.chore_helper.chore import Chore
 
 
 class DummyConfigEntry:
+    """Config entry with options only."""
+
     def __init__(self, options, entry_id="entry_1", title="Test Chore"):
+        """Store the options, entry id and title."""
         self.options = options
         self.entry_id = entry_id
         self.title = title
 
 
 class DummyHass:
+    """Home Assistant with states, a bus and data only."""
+
     def __init__(self):
+        """Create empty states and data."""
         self.states = {}
         self.bus = SimpleNamespace(async_fire=lambda evt, data: None)
         self.data = {"chore_helper": {"sensor": {}}}
 
     def set_states(self, states_list):
+        """Set the states of the given entities."""
         # Accept list of SimpleNamespace with entity_id, name, attributes
         for s in states_list:
             self.states[s.entity_id] = s
 
     def states_get(self, entity_id):
+        """Return the state of an entity."""
         return self.states.get(entity_id)
 
     def states_async_all(self):
+        """Return all the states."""
         return list(self.states.values())
 
 
 @pytest.mark.asyncio
 async def test_manual_assign_person():
+    """Test assigning a person manually."""
     hass = DummyHass()
     person = SimpleNamespace(entity_id="person.john", name="John", attributes={})
     hass.set_states([person])
@@ -54,6 +64,7 @@ async def test_manual_assign_person():
 
 @pytest.mark.asyncio
 async def test_auto_assign_rotation_prefers_linked_users():
+    """Test that the rotation prefers persons linked to users."""
     hass = DummyHass()
     # Two persons: one linked to active user u1, another not linked
     person1 = SimpleNamespace(
@@ -0,0 +1,118 @@
+"""Micro-benchmarks for the schedule engine hot paths.
+
+Deselected by default. Run with ``pytest -m benchmark``, or with
+``-m "benchmark and not slow"`` to skip the 10,000 chore populations. Besides
+the latency reported by pytest-benchmark, each benchmark stores the memory
+allocated by one pass over the population in ``extra_info``.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.calendar import EntitiesCalendarData
+
+from .population import make_population
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+SCALES = [10, 1000, pytest.param(10000, marks=pytest.mark.slow)]
+TODAY = datetime(2024, 6, 1).date()
+
+
+def _measure_allocations(benchmark, func) -> None:
+    """Record the memory allocated by one call of func."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    func()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    benchmark.extra_info["allocated_blocks"] = sum(
+        max(stat.count_diff, 0) for stat in stats
+    )
+    benchmark.extra_info["peak_kib"] = round(peak / 1024, 1)
+
+
+def _run(benchmark, size: int, func) -> None:
+    """Benchmark func, with fewer rounds for large populations."""
+    _measure_allocations(benchmark, func)
+    benchmark.extra_info["chores"] = size
+    if size >= 10000:
+        benchmark.pedantic(func, rounds=3, iterations=1)
+    else:
+        benchmark(func)
+
+
+@pytest.mark.parametrize("size", SCALES)
+def test_find_candidate_date(benchmark, size):
+    """Benchmark finding the next candidate date."""
+    chores = make_population(size)
+
+    def find_all():
+        for chore in chores:
+            chore._find_candidate_date(TODAY)
+
+    _run(benchmark, size, find_all)
+
+
+@pytest.mark.parametrize("size", SCALES)
+def test_chore_schedule(benchmark, size):
+    """Benchmark generating the chore schedules."""
+    chores = make_population(size)
+
+    def schedule_all():
+        for chore in chores:
+            list(chore.chore_schedule())
+
+    _run(benchmark, size, schedule_all)
+
+
+@pytest.mark.parametrize("size", SCALES)
+def test_get_next_due_date(benchmark, size):
+    """Benchmark looking up the next due date."""
+    chores = make_population(size)
+    for chore in chores:
+        chore._due_dates = sorted(chore.chore_schedule())
+
+    def next_all():
+        for chore in chores:
+            chore.get_next_due_date(TODAY)
+
+    _run(benchmark, size, next_all)
+
+
+@pytest.mark.parametrize("size", SCALES)
+def test_calendar_get_events(benchmark, size):
+    """Benchmark listing the calendar events."""
+    chores = make_population(size)
+    for chore in chores:
+        chore._due_dates = sorted(chore.chore_schedule())
+    hass = SimpleNamespace(
+        data={
+            const.DOMAIN: {
+                const.SENSOR_PLATFORM: {chore.entity_id: chore for chore in chores}
+            }
+        }
+    )
+    calendar = EntitiesCalendarData(hass)
+    for chore in chores:
+        calendar.add_entity(chore.entity_id)
+    start = datetime(2024, 6, 1)
+    end = start + timedelta(days=90)
+    loop = asyncio.new_event_loop()
+
+    def query():
+        loop.run_until_complete(calendar.async_get_events(hass, start, end))
+
+    try:
+        _run(benchmark, size, query)
+    finally:
+        loop.close()
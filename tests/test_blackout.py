@@ -0,0 +1,158 @@
+"""Tests for the holiday and blackout date index."""
+
+import asyncio
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.chore_helper import blackout
+from custom_components.chore_helper.blackout import (
+    BlackoutIndex,
+    async_blackout_index,
+    parse_ics,
+)
+from custom_components.chore_helper.const import DOMAIN
+
+from .population import async_add_chore, make_chore, make_options
+
+ICS = """BEGIN:VCALENDAR
+BEGIN:VEVENT
+SUMMARY:Christmas
+ holidays
+DTSTART;VALUE=DATE:20241224
+DTEND;VALUE=DATE:20241227
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:New year
+DTSTART;VALUE=DATE:20200101
+RRULE:FREQ=YEARLY
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def test_index_membership():
+    """Test the membership of days in the index."""
+    index = BlackoutIndex([date(2024, 2, 29), date(2025, 12, 31)])
+    index.add_range(date(2024, 1, 1), date(2024, 1, 3))
+
+    assert date(2024, 2, 29) in index
+    assert date(2025, 12, 31) in index
+    assert date(2024, 1, 2) in index
+    assert date(2024, 1, 3) not in index
+    assert date(2025, 2, 28) not in index
+    assert date(2023, 12, 31) not in index
+    assert len(index) == 4
+
+
+def test_resolve_skips_or_shifts():
+    """Test that blackout dates are skipped or shifted."""
+    index = BlackoutIndex([date(2024, 5, 1), date(2024, 5, 2)])
+
+    assert index.resolve(date(2024, 4, 30), False) == date(2024, 4, 30)
+    assert index.resolve(date(2024, 5, 1), False) is None
+    assert index.resolve(date(2024, 5, 1), True) == date(2024, 5, 3)
+
+
+def test_ics_events_and_recurrences():
+    """Test reading ICS events and their recurrences."""
+    index = BlackoutIndex()
+    for first, end in parse_ics(ICS, date(2024, 1, 1), date(2025, 12, 31)):
+        index.add_range(first, end)
+
+    assert date(2024, 12, 24) in index
+    assert date(2024, 12, 26) in index
+    assert date(2024, 12, 27) not in index
+    assert date(2024, 1, 1) in index
+    assert date(2025, 1, 1) in index
+    assert date(2023, 1, 1) not in index
+    assert len(index) == 5
+
+
+def test_schedule_skips_blackout_dates():
+    """Test that the schedule skips blackout dates."""
+    chore = make_chore(0)  # every-n-days, every 3 days
+    baseline = list(chore.chore_schedule())
+    chore._blackout = BlackoutIndex([baseline[1]])
+
+    assert list(chore.chore_schedule()) == [baseline[0], *baseline[2:]]
+
+
+def test_schedule_shifts_blackout_dates():
+    """Test that the schedule shifts blackout dates."""
+    chore = make_chore(0)
+    baseline = list(chore.chore_schedule())
+    chore._config = replace(chore._config, blackout_shift=True)
+    chore._blackout = BlackoutIndex(
+        [baseline[1], date.fromordinal(baseline[1].toordinal() + 1)]
+    )
+
+    shifted = date.fromordinal(baseline[1].toordinal() + 2)
+    assert list(chore.chore_schedule()) == [baseline[0], shifted, *baseline[2:]]
+
+
+def test_next_due_date_avoids_blackout_dates():
+    """Test that the next due date is not a blackout date."""
+    chore = make_chore(1)  # after-n-days, every 10 days
+    chore.last_completed = datetime(2024, 5, 1, 9, 0)
+    chore._blackout = BlackoutIndex([date(2024, 5, 11)])
+
+    asyncio.run(chore._async_load_due_dates())
+    assert chore._due_dates == [date(2024, 5, 21)]
+
+    chore._config = replace(chore._config, blackout_shift=True)
+    asyncio.run(chore._async_load_due_dates())
+    assert chore._due_dates == [date(2024, 5, 12)]
+
+
+async def test_index_before_the_integration_is_set_up(hass):
+    """Test that the first chore's preview can build an index."""
+    assert DOMAIN not in hass.data
+    config = replace(
+        make_chore(0)._config, blackout_dates=(date(2024, 5, 1).toordinal(),)
+    )
+
+    index = await async_blackout_index(hass, config)
+
+    assert index is not None
+    assert date(2024, 5, 1) in index
+
+
+async def test_failed_read_is_retried(hass, monkeypatch):
+    """Test that an index missing an unreadable source is not cached."""
+    reads: list[str] = []
+
+    def load_ics(path, start, end):
+        reads.append(path)
+        if len(reads) == 1:
+            raise OSError("not mounted yet")
+        return [(date(2024, 5, 1), date(2024, 5, 2))]
+
+    monkeypatch.setattr(blackout, "_load_ics", load_ics)
+    config = replace(make_chore(0)._config, blackout_file="holidays.ics")
+
+    assert date(2024, 5, 1) not in await async_blackout_index(hass, config)
+    assert date(2024, 5, 1) in await async_blackout_index(hass, config)
+    await async_blackout_index(hass, config)
+    assert len(reads) == 2
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_complete_loads_the_blackout_index(
+    hass, auto_enable_custom_integrations
+):
+    """Test that a completion does not compute without the blackout dates."""
+    today = dt_util.now().date()
+    blocked = today + timedelta(days=10)
+    chore = await async_add_chore(
+        hass, {**make_options(1), "blackout_dates": blocked.isoformat()}
+    )
+    # As after a warm start, before the first update
+    chore._blackout = None
+
+    await chore.complete(dt_util.now())
+
+    assert chore._blackout is not None
+    assert chore._due_dates == [today + timedelta(days=20)]
@@ -0,0 +1,82 @@
+"""Tests for the parsed and interned schedule configuration."""
+
+from datetime import date, time
+
+import pytest
+
+from custom_components.chore_helper.chore_config import ChoreConfig
+
+
+def test_options_are_parsed():
+    """Test the parsing of the schedule options."""
+    config = ChoreConfig.from_options(
+        {
+            "frequency": "every-n-months",
+            "period": 2.0,
+            "start_date": "2024-01-01",
+            "first_month": "apr",
+            "last_month": "oct",
+            "chore_day": "wed",
+            "weekday_order_number": "-1",
+            "date": "06/30",
+            "time": "08:30:00",
+        }
+    )
+
+    assert config.period == 2
+    assert config.start_date == date(2024, 1, 1)
+    assert (config.first_month, config.last_month) == (4, 10)
+    assert config.weekday_order_number == -1
+    assert config.week_order_number is None
+    assert config.month_day == (6, 30)
+    assert config.due_time == time(8, 30)
+
+
+def test_defaults_and_blank_options():
+    """Test the values of missing, blank and unknown options."""
+    config = ChoreConfig.from_options(
+        {
+            "frequency": "every-n-days",
+            "start_date": "not a date",
+            "first_month": "never",
+            "day_of_month": 0,
+            "date": "0",
+        }
+    )
+
+    assert config.period == 1
+    assert config.start_date is None
+    assert (config.first_month, config.last_month) == (1, 12)
+    assert config.weekday_order_number == 1
+    assert config.day_of_month is None
+    assert config.month_day is None
+    assert config.due_time is None
+
+
+@pytest.mark.parametrize(
+    ("force", "weekday_order", "week_order"), [(False, 2, None), (True, None, 2)]
+)
+def test_order_number_goes_to_weekday_or_week(force, weekday_order, week_order):
+    """Test that forcing week numbers turns the order number into a week."""
+    config = ChoreConfig.from_options(
+        {
+            "frequency": "every-n-months",
+            "weekday_order_number": "2",
+            "force_week_order_numbers": force,
+        }
+    )
+
+    assert config.weekday_order_number == weekday_order
+    assert config.week_order_number == week_order
+
+
+def test_equal_options_share_one_config():
+    """Test that equal schedule options give the same object."""
+    options = {"frequency": "every-n-days", "period": 3, "start_date": "2024-01-01"}
+    config = ChoreConfig.from_options(options)
+
+    assert ChoreConfig.from_options(dict(options)) is config
+    # Options that are not part of the schedule do not count
+    assert ChoreConfig.from_options({**options, "name": "Other"}) is config
+    assert ChoreConfig.from_options({**options, "period": 4}) is not config
+    assert ChoreConfig.from_options({**options, "time": "08:00"}) is not config
@@ -0,0 +1,51 @@
+"""Tests for the diagnostics download."""
+
+import pytest
+
+from custom_components.chore_helper import diagnostics
+from custom_components.chore_helper.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.chore_helper.metrics import SECTION_SCHEDULE, SECTION_SERVICE
+
+from .population import async_add_chore, make_options
+
+pytestmark = [
+    # The chores keep their next state transition armed
+    pytest.mark.parametrize("expected_lingering_timers", [True]),
+]
+
+
+async def test_chore_diagnostics(hass, auto_enable_custom_integrations):
+    """Test the payload of a chore, with service time kept apart."""
+    chore = await async_add_chore(hass, make_options(0))
+    with chore.metrics.timed(SECTION_SERVICE):
+        chore.update_state()
+
+    data = await async_get_config_entry_diagnostics(hass, chore.config_entry)
+
+    assert data["entity_id"] == chore.entity_id
+    assert data["settings"]["frequency"] == "every-n-days"
+    assert "assignee_forecast" in data["attributes"]
+    assert SECTION_SCHEDULE in data["metrics"]["timings"]
+    assert SECTION_SERVICE not in data["metrics"]["timings"]
+    assert data["metrics"]["wall_timings"][SECTION_SERVICE]["count"] == 1
+    assert data["integration"]["chores"] == 1
+    assert data["integration"]["slowest_chores"][0]["entity_id"] == chore.entity_id
+    assert data["config_entry"]["entry_id"] == chore.config_entry.entry_id
+
+
+async def test_fleet_is_scanned_once_a_minute(
+    hass, auto_enable_custom_integrations, monkeypatch
+):
+    """Test that the integration section is cached across downloads."""
+    first = await async_add_chore(hass, make_options(0))
+    await async_get_config_entry_diagnostics(hass, first.config_entry)
+    second = await async_add_chore(hass, make_options(1))
+
+    data = await async_get_config_entry_diagnostics(hass, second.config_entry)
+    assert data["integration"]["chores"] == 1
+
+    monkeypatch.setattr(diagnostics, "INTEGRATION_CACHE", 0)
+    data = await async_get_config_entry_diagnostics(hass, second.config_entry)
+    assert data["integration"]["chores"] == 2
@@ -0,0 +1,109 @@
+"""Tests for the chore_helper_loaded event dispatcher."""
+
+from datetime import date, timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.chore_helper import const, events
+from custom_components.chore_helper.events import LoadedEventDispatcher
+
+DATES = [date(2024, 5, 1), date(2024, 5, 4), date(2024, 5, 10)]
+
+
+def _listen(hass) -> list[dict]:
+    """Collect the data of the loaded events."""
+    received: list[dict] = []
+    hass.bus.async_listen(const.EVENT_LOADED, lambda event: received.append(event.data))
+    return received
+
+
+async def test_nothing_is_built_without_listeners(hass):
+    """Test that no event is fired while nobody listens."""
+    dispatcher = LoadedEventDispatcher(hass, const.LOADED_EVENT_CHANGED)
+    dispatcher.loaded("sensor.a", DATES)
+    await hass.async_block_till_done()
+
+    assert not dispatcher._last_sent
+
+
+async def test_full_and_compact_payloads(hass):
+    """Test the full and the compact payloads."""
+    received = _listen(hass)
+    LoadedEventDispatcher(hass).loaded("sensor.a", DATES)
+    LoadedEventDispatcher(hass, const.LOADED_EVENT_COMPACT).loaded("sensor.a", DATES)
+    await hass.async_block_till_done()
+
+    assert received == [
+        {
+            "entity_id": "sensor.a",
+            "due_dates": ["2024-05-01", "2024-05-04", "2024-05-10"],
+        },
+        {"entity_id": "sensor.a", "start": DATES[0].toordinal(), "deltas": [3, 6]},
+    ]
+
+
+async def test_changed_payloads(hass, monkeypatch):
+    """Test that only the changes are sent, from a listener's first event on."""
+    monkeypatch.setattr(events, "LISTENER_CHECK_INTERVAL", -1)
+    dispatcher = LoadedEventDispatcher(hass, const.LOADED_EVENT_CHANGED)
+    received: list[dict] = []
+    unsub = hass.bus.async_listen(
+        const.EVENT_LOADED, lambda event: received.append(event.data)
+    )
+    dispatcher.loaded("sensor.a", DATES[:1])
+    dispatcher.loaded("sensor.a", DATES[:2])
+    dispatcher.loaded("sensor.a", DATES[:2])
+    await hass.async_block_till_done()
+    unsub()
+    # Not seen by anybody: the next listener starts from scratch
+    dispatcher.loaded("sensor.a", DATES[1:])
+    received_later = _listen(hass)
+    dispatcher.loaded("sensor.a", DATES[1:])
+    await hass.async_block_till_done()
+
+    assert received == [
+        {"entity_id": "sensor.a", "added": ["2024-05-01"], "removed": []},
+        {"entity_id": "sensor.a", "added": ["2024-05-04"], "removed": []},
+    ]
+    assert received_later == [
+        {"entity_id": "sensor.a", "added": ["2024-05-04", "2024-05-10"], "removed": []},
+    ]
+
+    dispatcher.forget("sensor.a")
+    assert not dispatcher._last_sent
+
+
+async def test_aggregated_events(hass):
+    """Test that the chores loaded in one cycle are sent in one event."""
+    received = _listen(hass)
+    dispatcher = LoadedEventDispatcher(hass, const.LOADED_EVENT_COMPACT, True)
+    dispatcher.loaded("sensor.a", DATES)
+    dispatcher.loaded("sensor.b", DATES[:1])
+    await hass.async_block_till_done()
+    assert received == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert [chore["entity_id"] for chore in received[0]["chores"]] == [
+        "sensor.a",
+        "sensor.b",
+    ]
+    assert len(received) == 1
+
+
+async def test_removed_chores_are_not_sent(hass):
+    """Test that removing the chores cancels the pending aggregated event."""
+    received = _listen(hass)
+    dispatcher = LoadedEventDispatcher(hass, const.LOADED_EVENT_FULL, True)
+    dispatcher.loaded("sensor.a", DATES)
+    dispatcher.loaded("sensor.b", DATES)
+
+    dispatcher.forget("sensor.a")
+    assert dispatcher._unsub_flush is not None
+    dispatcher.forget("sensor.b")
+    assert dispatcher._unsub_flush is None
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert received == []
@@ -0,0 +1,89 @@
+"""Tests for the every-n-hours and after-n-hours engine."""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.chore_helper.blackout import BlackoutIndex
+from custom_components.chore_helper.chore_hourly import HourlyChore
+
+
+def local(*args: int) -> datetime:
+    """Return a local datetime."""
+    return dt_util.as_local(datetime(*args))
+
+
+def make_chore(frequency: str, period: int) -> HourlyChore:
+    """Create an hourly chore without Home Assistant."""
+    options = {
+        "name": "Medication",
+        "frequency": frequency,
+        "period": period,
+        "start_date": "2024-01-01",
+        "time": "08:00:00",
+        "forecast_dates": 3,
+    }
+    entry = SimpleNamespace(
+        options=options, data={}, entry_id="hourly", title=options["name"]
+    )
+    return HourlyChore(entry)
+
+
+def test_every_n_hours_follows_the_anchor():
+    """Test that the due times follow the anchor."""
+    chore = make_chore("every-n-hours", 8)
+    chore.last_completed = local(2024, 5, 1, 9, 0)
+
+    chore._load_due_times()
+
+    assert chore.due_times == [
+        local(2024, 5, 1, 16, 0),
+        local(2024, 5, 2, 0, 0),
+        local(2024, 5, 2, 8, 0),
+    ]
+    assert chore._due_dates == [date(2024, 5, 1), date(2024, 5, 2)]
+    assert chore._next_due_datetime() == local(2024, 5, 1, 16, 0)
+
+
+def test_after_n_hours_follows_the_completion():
+    """Test that the due times follow the last completion."""
+    chore = make_chore("after-n-hours", 4)
+    chore.last_completed = local(2024, 5, 1, 9, 30)
+
+    chore._load_due_times()
+
+    assert chore.due_times == [
+        local(2024, 5, 1, 13, 30),
+        local(2024, 5, 1, 17, 30),
+        local(2024, 5, 1, 21, 30),
+    ]
+
+
+def test_overrides_and_blackouts_apply_to_whole_days():
+    """Test that overrides and blackouts apply to whole days."""
+    chore = make_chore("every-n-hours", 12)
+    chore.last_completed = local(2024, 5, 1, 9, 0)
+    chore._remove_dates = "2024-05-02"
+    chore._offset_dates = "2024-05-03:1"
+    chore._blackout = BlackoutIndex([date(2024, 5, 1)])
+
+    chore._load_due_times()
+
+    assert chore.due_times == [
+        local(2024, 5, 4, 8, 0),
+        local(2024, 5, 4, 20, 0),
+        local(2024, 5, 5, 8, 0),
+    ]
+
+
+def test_schedule_starts_from_a_later_date():
+    """Test the schedule from a later date."""
+    chore = make_chore("every-n-hours", 6)
+
+    schedule = chore.chore_schedule(date(2025, 3, 1))
+
+    assert [next(schedule) for _ in range(2)] == [
+        local(2025, 3, 1, 2, 0),
+        local(2025, 3, 1, 8, 0),
+    ]
@@ -0,0 +1,81 @@
+"""Import-time budget of the integration.
+
+Every Home Assistant restart waits for the integration and its sensor
+platform to import, so the frequency engines, the dateutil parser and the
+calendar platform must only load when they are needed.
+
+The wall-clock budget depends on the machine, so it only runs with
+``-m slow``; the lazy loading check always runs.
+"""
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET = 0.15  # seconds, on top of the Home Assistant modules
+
+# Home Assistant modules imported before the measurement, so only the
+# integration's own cost is measured
+PRELOADED = [
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.restore_state",
+    "homeassistant.helpers.selector",
+    "homeassistant.helpers.storage",
+]
+
+LAZY_MODULES = [
+    "custom_components.chore_helper.calendar",
+    "custom_components.chore_helper.chore",
+    "custom_components.chore_helper.chore_daily",
+    "custom_components.chore_helper.chore_hourly",
+    "custom_components.chore_helper.chore_monthly",
+    "custom_components.chore_helper.chore_weekly",
+    "custom_components.chore_helper.chore_yearly",
+    "dateutil.parser",
+    "dateutil.relativedelta",
+]
+
+SCRIPT = f"""
+import importlib, json, sys, time
+for name in {PRELOADED!r}:
+    importlib.import_module(name)
+before = set(sys.modules)
+started = time.perf_counter()
+import custom_components.chore_helper
+import custom_components.chore_helper.sensor
+elapsed = time.perf_counter() - started
+print(json.dumps({{"elapsed": elapsed, "new": sorted(set(sys.modules) - before)}}))
+"""
+
+
+def _measure() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parents[1],
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_heavy_modules_load_lazily():
+    """Test that the heavy modules are not loaded on import."""
+    loaded = _measure()["new"]
+
+    assert [name for name in LAZY_MODULES if name in loaded] == []
+
+
+@pytest.mark.slow
+def test_import_time_budget():
+    """Test that the integration imports within the time budget."""
+    elapsed = min(_measure()["elapsed"] for _ in range(3))
+
+    assert elapsed < IMPORT_BUDGET
@@ -0,0 +1,127 @@
+"""Tests for the persistent completion ledger."""
+
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.chore_helper import ledger
+from custom_components.chore_helper.chore_daily import DailyChore
+from custom_components.chore_helper.ledger import (
+    SAVE_DELAY,
+    STORAGE_KEY,
+    CompletionLedger,
+)
+from custom_components.chore_helper.workload import WorkloadTracker
+
+COMPLETED = datetime(2024, 5, 1, 9, 30)
+
+
+def test_aggregates_follow_each_completion(hass):
+    """Test the running per-person totals."""
+    book = CompletionLedger(hass)
+    book.record("chore_1", "person.a", COMPLETED, -1)
+    book.record("chore_2", "person.a", COMPLETED + timedelta(days=1), 2)
+    book.record("chore_1", "person.b", COMPLETED, None)
+    book.record("chore_1", None, COMPLETED, 0)
+
+    assert book.person_totals("person.a") == {
+        "count": 2,
+        "on_time": 1,
+        "lateness_total": 1,
+        "last": (COMPLETED + timedelta(days=1)).isoformat(),
+    }
+    assert book.completion_count("person.b") == 1
+    assert book.completion_count("person.c") == 0
+    assert len(book.as_dict()["records"]) == 4
+
+
+def test_records_are_bounded(hass, monkeypatch):
+    """Test that old records are dropped, but still counted."""
+    monkeypatch.setattr(ledger, "MAX_RECORDS", 3)
+    book = CompletionLedger(hass)
+    for day in range(5):
+        book.record("chore_1", "person.a", COMPLETED + timedelta(days=day), 0)
+
+    records = book.as_dict()["records"]
+    assert [record["timestamp"][:10] for record in records] == [
+        "2024-05-03",
+        "2024-05-04",
+        "2024-05-05",
+    ]
+    assert book.completion_count("person.a") == 5
+
+
+async def test_ledger_round_trip(hass, hass_storage):
+    """Test that the ledger is saved with a delay and loaded back."""
+    book = CompletionLedger(hass)
+    book.record("chore_1", "person.a", COMPLETED, 0)
+    assert STORAGE_KEY not in hass_storage
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+
+    loaded = CompletionLedger(hass)
+    await loaded.async_load()
+    assert loaded.as_dict() == book.as_dict()
+    assert loaded.completion_count("person.a") == 1
+
+
+def _least_loaded_chore(hass, book, tracker):
+    """Return a least-loaded chore using the given ledger and tracker."""
+    entry = SimpleNamespace(
+        options={
+            "frequency": "every-n-days",
+            "period": 1,
+            "start_date": "2024-04-01",
+            "auto_assign": True,
+            "assign_strategy": "least_loaded",
+        },
+        data={"unique_id": "chore_unique"},
+        entry_id="entry_1",
+        title="Dishes",
+    )
+    chore = DailyChore(entry)
+    chore.hass = SimpleNamespace(
+        bus=hass.bus,
+        data={"chore_helper": {"sensor": {}, "workload": tracker, "ledger": book}},
+    )
+    chore.entity_id = "sensor.dishes"
+    return chore
+
+
+def test_fewest_completions_break_least_loaded_ties(hass):
+    """Test that equally loaded people are ordered by their completions."""
+    book = CompletionLedger(hass)
+    book.record("chore_2", "person.a", COMPLETED, 0)
+    tracker = WorkloadTracker()
+    today = date(2024, 5, 1)
+    tracker.update("chore_2", "person.a", 2, today, today)
+    tracker.update("chore_3", "person.b", 2, today, today)
+    chore = _least_loaded_chore(hass, book, tracker)
+    candidates = [
+        SimpleNamespace(entity_id="person.a"),
+        SimpleNamespace(entity_id="person.b"),
+    ]
+
+    assert chore._next_assignee(candidates).entity_id == "person.b"
+
+    book.record("chore_3", "person.b", COMPLETED, 0)
+    book.record("chore_3", "person.b", COMPLETED, 0)
+    assert chore._next_assignee(candidates).entity_id == "person.a"
+
+
+async def test_completions_are_recorded_under_the_unique_id(hass):
+    """Test that the history of a chore survives an entity ID change."""
+    book = CompletionLedger(hass)
+    chore = _least_loaded_chore(hass, book, WorkloadTracker())
+    chore._auto_assign = False
+    chore._assignee_user_id = "person.a"
+
+    await chore.complete(COMPLETED)
+    chore.entity_id = "sensor.renamed_dishes"
+    await chore.complete(COMPLETED + timedelta(days=1))
+
+    records = book.as_dict()["records"]
+    assert [record["chore"] for record in records] == ["chore_unique"] * 2
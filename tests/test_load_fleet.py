@@ -0,0 +1,135 @@
+"""Load test harness for large chore fleets.
+
+Skipped unless ``CHORE_HELPER_LOAD_CHORES`` is set to the number of chores to
+create, for example::
+
+    CHORE_HELPER_LOAD_CHORES=2000 pytest tests/test_load_fleet.py -m slow
+
+The measurements are written as JSON to ``CHORE_HELPER_LOAD_REPORT`` (default
+``load_report.json`` in the pytest temporary directory).
+"""
+
+from datetime import timedelta
+import json
+import os
+from pathlib import Path
+import statistics
+import time
+import tracemalloc
+
+import pytest
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.chore_helper import const, registry, state_store
+
+from .population import make_options
+
+LOAD_CHORES = int(os.environ.get("CHORE_HELPER_LOAD_CHORES", "0"))
+CALENDAR_QUERIES = 20
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        LOAD_CHORES <= 0, reason="set CHORE_HELPER_LOAD_CHORES to run the load test"
+    ),
+]
+
+
+def _percentile(samples: list[float], percent: int) -> float:
+    """Return the given percentile of samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+@pytest.mark.asyncio
+# The chores keep their next state transition armed
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_large_fleet(
+    hass, hass_storage, auto_enable_custom_integrations, tmp_path
+):
+    """Measure setup, rollover, calendar and service costs of a large fleet."""
+    report: dict = {"chores": LOAD_CHORES}
+
+    # Heavy overrides are loaded from the state file, as after a restart
+    stored: dict = {}
+    for index in range(LOAD_CHORES):
+        options = make_options(index, heavy=index % 10 == 0)
+        overrides = options.pop("overrides", None)
+        entry = MockConfigEntry(
+            domain=const.DOMAIN,
+            title=options["name"],
+            options=options,
+            version=const.CONFIG_VERSION,
+        )
+        entry.add_to_hass(hass)
+        if overrides is not None:
+            stored[entry.entry_id] = overrides
+    hass_storage[state_store.STORAGE_KEY] = {
+        "version": state_store.STORAGE_VERSION,
+        "key": state_store.STORAGE_KEY,
+        "data": {"chores": stored},
+    }
+    report["chores_with_overrides"] = len(stored)
+
+    tracemalloc.start()
+    memory_before, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    # Sets up the config entries added above
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await hass.async_block_till_done()
+    report["setup_seconds"] = round(time.perf_counter() - started, 3)
+    memory_after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    chores = list(hass.data[const.DOMAIN][const.SENSOR_PLATFORM].values())
+    assert len(chores) == LOAD_CHORES
+    for entry_id, overrides in stored.items():
+        chore = registry.chore_by_entry_id(hass, entry_id)
+        assert chore.offset_dates == overrides["offset_dates"]
+    report["memory_per_entity_kib"] = round(
+        (memory_after - memory_before) / LOAD_CHORES / 1024, 2
+    )
+
+    # State transitions of all chores share one armed timer
+    report["scheduled_transitions"] = len(hass.data[const.DOMAIN][const.DUE_TIMER])
+
+    # Midnight rollover: every chore becomes due for an update at once
+    for chore in chores:
+        chore._last_updated = None
+    started = time.perf_counter()
+    for chore in chores:
+        await chore.async_update_ha_state(True)
+    await hass.async_block_till_done()
+    report["rollover_seconds"] = round(time.perf_counter() - started, 3)
+
+    calendar = hass.data[const.DOMAIN][const.CALENDAR_PLATFORM]
+    start = dt_util.now()
+    latencies = []
+    for query in range(CALENDAR_QUERIES):
+        query_start = start + timedelta(days=query)
+        started = time.perf_counter()
+        await calendar.async_get_events(
+            hass, query_start, query_start + timedelta(days=31)
+        )
+        latencies.append(time.perf_counter() - started)
+    report["calendar_query_ms"] = {
+        "median": round(statistics.median(latencies) * 1000, 2),
+        "p95": round(_percentile(latencies, 95) * 1000, 2),
+    }
+
+    entity_ids = [chore.entity_id for chore in chores]
+    started = time.perf_counter()
+    for entity_id in entity_ids:
+        await hass.services.async_call(
+            const.DOMAIN, "update_state", {"entity_id": entity_id}, blocking=True
+        )
+    elapsed = time.perf_counter() - started
+    report["service_calls_per_second"] = round(len(entity_ids) / elapsed, 1)
+
+    report_path = Path(
+        os.environ.get("CHORE_HELPER_LOAD_REPORT", tmp_path / "load_report.json")
+    )
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    assert report["setup_seconds"] >= 0
@@ -0,0 +1,89 @@
+"""Tests for the throughput counters behind the health sensor."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.chore_helper import metrics
+from custom_components.chore_helper.const import DOMAIN, METRICS, SENSOR_PLATFORM
+from custom_components.chore_helper.health import loop_time
+from custom_components.chore_helper.metrics import (
+    Metrics,
+    RateWindow,
+    Throughput,
+    TimingStats,
+)
+
+from .population import async_add_chore, make_options
+
+
+def test_rate_window_counts_last_minute(monkeypatch):
+    """Test that the rate window counts the last minute only."""
+    now = [1000.0]
+    monkeypatch.setattr(metrics, "monotonic", lambda: now[0])
+    window = RateWindow()
+    window.add(0.1)
+    now[0] += 30
+    window.add(0.3)
+
+    assert window.per_minute() == 2
+    now[0] += 45
+    assert window.per_minute() == 1
+    assert window.percentile(95) == 0.3
+
+
+def test_rate_window_percentile():
+    """Test the percentile of the rate window."""
+    window = RateWindow()
+    for duration in range(1, 101):
+        window.add(duration / 1000)
+
+    assert window.percentile(95) == 0.096
+    assert RateWindow().percentile(95) is None
+
+
+def test_refresh_cycle_spans_close_updates():
+    """Test that close updates belong to one refresh cycle."""
+    throughput = Throughput()
+    throughput.refreshed(100.0, 100.5)
+    throughput.refreshed(101.0, 101.2)
+
+    assert round(throughput.last_refresh, 3) == 1.2
+    throughput.refreshed(200.0, 200.3)
+    assert round(throughput.last_refresh, 3) == 0.3
+
+
+def test_loop_time_counts_nested_sections_once():
+    """Test that service and per-chore calendar time is not counted twice."""
+    chore = SimpleNamespace(metrics=Metrics())
+    for section, duration in [
+        (metrics.SECTION_SCHEDULE, 0.2),
+        (metrics.SECTION_STATE, 0.1),
+        (metrics.SECTION_SERVICE, 0.4),
+        (metrics.SECTION_CALENDAR, 0.05),
+    ]:
+        chore.metrics.timings[section] = TimingStats()
+        chore.metrics.timings[section].record(duration)
+    integration = Metrics()
+    integration.timings[metrics.SECTION_CALENDAR] = TimingStats()
+    integration.timings[metrics.SECTION_CALENDAR].record(0.08)
+    hass = SimpleNamespace(
+        data={DOMAIN: {SENSOR_PLATFORM: {"sensor.chore": chore}, METRICS: integration}}
+    )
+
+    assert round(loop_time(hass), 3) == 0.38
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_loop_time_keeps_removed_chores(hass, auto_enable_custom_integrations):
+    """Test that removing a chore does not take its time off the total."""
+    chore = await async_add_chore(hass, make_options(0))
+    await async_add_chore(hass, make_options(1))
+    chore.metrics.timings[metrics.SECTION_STATE].record(0.5)
+    before = loop_time(hass)
+
+    await hass.config_entries.async_remove(chore.config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert chore.entity_id not in hass.data[DOMAIN][SENSOR_PLATFORM]
+    assert loop_time(hass) == pytest.approx(before)
@@ -0,0 +1,44 @@
+"""Tests for the every-n-months and after-n-months engine."""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.chore_helper.chore_monthly import MonthlyChore
+
+
+@pytest.mark.parametrize(
+    ("options", "expected"),
+    [
+        (
+            {"frequency": "every-n-months", "day_of_month": 15},
+            [date(2024, 1, 15), date(2024, 4, 15), date(2024, 7, 15)],
+        ),
+        (
+            {
+                "frequency": "after-n-months",
+                "chore_day": "fri",
+                "weekday_order_number": "2",
+                "force_week_order_numbers": True,
+            },
+            [date(2024, 1, 12), date(2024, 4, 12), date(2024, 7, 12)],
+        ),
+    ],
+)
+def test_period_of_three_months(options, expected):
+    """Test that the schedule steps to the next month of the cycle."""
+    entry = SimpleNamespace(
+        options={
+            "name": "Filters",
+            "period": 3,
+            "start_date": "2024-01-01",
+            "forecast_dates": 3,
+            **options,
+        },
+        data={},
+        entry_id="monthly",
+        title="Filters",
+    )
+
+    assert list(MonthlyChore(entry).chore_schedule())[:3] == expected
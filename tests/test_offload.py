@@ -0,0 +1,21 @@
+"""Tests for the executor offloading policy."""
+
+import threading
+
+import pytest
+
+from custom_components.chore_helper import offload
+
+
+def test_small_jobs_stay_inline():
+    """Test that small schedules are computed inline."""
+    assert offload.schedule_inline(10)
+    assert not offload.schedule_inline(10, overrides=500)
+
+
+@pytest.mark.asyncio
+async def test_large_jobs_run_in_the_executor(hass):
+    """Test that large schedules are computed in the executor."""
+    loop_thread = threading.get_ident()
+    assert await offload.async_run(hass, True, threading.get_ident) == loop_thread
+    assert await offload.async_run(hass, False, threading.get_ident) != loop_thread
@@ -0,0 +1,61 @@
+"""Tests for applying changed options to a chore in place."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from custom_components.chore_helper import const
+
+from .population import make_chore
+
+
+def test_read_options_keeps_runtime_state():
+    """Test that reading the options keeps the runtime state."""
+    chore = make_chore(0)
+    chore.last_completed = datetime(2024, 3, 1, 10, 0)
+    chore._add_dates = "2024-04-01"
+    chore.config_entry.options = {
+        **chore.config_entry.options,
+        "period": 5,
+        "icon_normal": "mdi:broom",
+    }
+
+    chore._read_options(chore.config_entry)
+
+    assert chore._config.period == 5
+    assert chore._icon_normal == "mdi:broom"
+    assert chore.last_completed == datetime(2024, 3, 1, 10, 0)
+    assert chore._add_dates == "2024-04-01"
+
+
+def test_apply_options_moves_hidden_chore_out_of_calendar():
+    """Test that hiding a chore removes it from the calendar."""
+    chore = make_chore(0)
+    calendar = SimpleNamespace(entities=[chore.entity_id])
+    calendar.remove_entity = calendar.entities.remove
+    calendar.add_entity = calendar.entities.append
+    chore.hass = SimpleNamespace(
+        data={const.DOMAIN: {const.CALENDAR_PLATFORM: calendar}}
+    )
+    refreshed = []
+    chore.async_schedule_update_ha_state = refreshed.append
+    chore.config_entry.options = {
+        **chore.config_entry.options,
+        "hidden": True,
+        "period": 4,
+    }
+
+    chore.apply_options()
+
+    assert calendar.entities == []
+    assert refreshed == [True]
+    assert chore._last_updated is None
+
+
+def test_chores_with_equal_schedules_share_config():
+    """Test that chores with equal schedules share their config."""
+    chore, twin, other = make_chore(0), make_chore(0), make_chore(1)
+    twin.config_entry.options = {**twin.config_entry.options, "name": "Twin"}
+    twin._read_options(twin.config_entry)
+
+    assert chore._config is twin._config
+    assert chore._config is not other._config
@@ -0,0 +1,36 @@
+"""Tests for override lists matched on day ordinals."""
+
+from datetime import date, timedelta
+
+from custom_components.chore_helper import helpers
+
+from .population import make_chore
+
+
+def test_override_texts_parse_to_ordinals():
+    """Test that the override texts parse to date ordinals."""
+    assert helpers.date_ordinals("2024-05-01 bad 2024-05-03") == (
+        date(2024, 5, 1).toordinal(),
+        date(2024, 5, 3).toordinal(),
+    )
+    assert helpers.date_ordinals(None) == ()
+    assert helpers.offset_ordinals("2024-05-01:2 2024-05-01:5 2024-05-02:x") == {
+        date(2024, 5, 1).toordinal(): 2
+    }
+
+
+def test_schedule_applies_overrides():
+    """Test that the schedule applies the overrides."""
+    chore = make_chore(0)
+    baseline = list(chore.chore_schedule())
+    extra = baseline[-1] + timedelta(days=100)
+
+    chore._remove_dates = baseline[0].isoformat()
+    chore._offset_dates = f"{baseline[1].isoformat()}:-1"
+    chore._add_dates = extra.isoformat()
+    schedule = list(chore.chore_schedule())
+
+    assert baseline[0] not in schedule
+    assert schedule[0] == baseline[1] - timedelta(days=1)
+    assert schedule[1:-1] == baseline[2:]
+    assert schedule[-1] == extra
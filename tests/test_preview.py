@@ -0,0 +1,98 @@
+"""Tests for the schedule preview of the config flow."""
+
+from datetime import date, datetime
+from unittest.mock import patch
+
+from homeassistant import config_entries
+from homeassistant.data_entry_flow import FlowResultType
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.chore_helper.chore_daily import DailyChore
+from custom_components.chore_helper.const import DOMAIN
+from custom_components.chore_helper.chore_weekly import WeeklyChore
+from custom_components.chore_helper.preview import preview_dates, preview_text
+
+from .population import make_options
+
+
+def test_preview_lists_next_dates():
+    """Test that the preview lists the next due dates."""
+    options = {**make_options(0), "forecast_dates": 2.0, "period": 3.0}
+
+    dates = preview_dates(DailyChore, options, count=5)
+
+    assert len(dates) == 5
+    assert dates[0] >= date.today()
+    assert dates == sorted(dates)
+    assert all((b - a).days == 3 for a, b in zip(dates, dates[1:]))
+
+
+def test_preview_follows_weekly_rules():
+    """Test that the preview follows the weekly rules."""
+    dates = preview_dates(WeeklyChore, make_options(2), count=4)
+
+    assert [day.weekday() for day in dates] == [5, 5, 5, 5]
+
+
+def test_preview_uses_last_completion():
+    """Test that the preview starts from the last completion."""
+    options = make_options(1)  # after-n-days, every 10 days
+    completed = datetime(2099, 1, 1, 8, 0)
+
+    assert preview_dates(DailyChore, options, completed, count=1) == [date(2099, 1, 11)]
+
+
+def test_preview_text():
+    """Test the text of the preview."""
+    assert preview_text([date(2024, 5, 4)]) == "- Sat 2024-05-04"
+    assert preview_text([]) == "-"
+
+
+# Creating the entry sets up the integration, whose stores save with a delay
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_config_flow_shows_the_preview(hass, auto_enable_custom_integrations):
+    """Test that the config flow reaches the preview with the next due dates."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"name": "Dishes", "frequency": "every-n-days"}
+    )
+    assert result["step_id"] == "detail"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"period": 3, "start_date": "2099-01-01"}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "preview"
+    assert result["description_placeholders"]["preview"].startswith(
+        "- Thu 2099-01-01\n- Sun 2099-01-04"
+    )
+
+    with patch("custom_components.chore_helper.async_setup_entry", return_value=True):
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["options"]["period"] == 3
+
+
+async def test_options_flow_shows_the_preview(hass, auto_enable_custom_integrations):
+    """Test that the options flow reaches the preview with the next due dates."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={"name": "Dishes", "frequency": "every-n-days", "period": 3},
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"frequency": "every-n-days"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"period": 7, "start_date": "2099-01-01"}
+    )
+
+    assert result["step_id"] == "preview"
+    assert result["description_placeholders"]["preview"].startswith(
+        "- Thu 2099-01-01\n- Thu 2099-01-08"
+    )
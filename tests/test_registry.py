@@ -0,0 +1,80 @@
+"""Tests for the lookup of chores by entity, unique and config entry ID."""
+
+from types import SimpleNamespace
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.chore_helper import const, registry
+from custom_components.chore_helper.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+def _chore(entity_id: str, unique_id: str, entry_id: str) -> SimpleNamespace:
+    """Return a stand-in for a chore entity."""
+    return SimpleNamespace(
+        entity_id=entity_id,
+        unique_id=unique_id,
+        config_entry=SimpleNamespace(entry_id=entry_id),
+    )
+
+
+def _hass() -> SimpleNamespace:
+    """Return a stand-in for Home Assistant with the integration data."""
+    return SimpleNamespace(data={const.DOMAIN: {const.SENSOR_PLATFORM: {}}})
+
+
+def test_chores_are_found_by_each_id():
+    """Test the entity, unique and config entry ID lookups."""
+    hass = _hass()
+    chore = _chore("sensor.dishes", "dishes", "entry_1")
+    registry.register(hass, chore)
+
+    assert registry.chore_by_entity_id(hass, "sensor.dishes") is chore
+    assert registry.chore_by_unique_id(hass, "dishes") is chore
+    assert registry.chore_by_entry_id(hass, "entry_1") is chore
+    assert registry.chore_by_unique_id(hass, "laundry") is None
+    assert registry.chore_by_entry_id(hass, "entry_2") is None
+    with pytest.raises(KeyError):
+        registry.chore_by_entity_id(hass, "sensor.laundry")
+
+    registry.unregister(hass, chore)
+    assert registry.chore_by_unique_id(hass, "dishes") is None
+    assert registry.chore_by_entry_id(hass, "entry_1") is None
+    with pytest.raises(KeyError):
+        registry.chore_by_entity_id(hass, "sensor.dishes")
+
+
+def test_unregister_keeps_a_newer_chore():
+    """Test that removing a replaced chore leaves its successor indexed."""
+    hass = _hass()
+    old = _chore("sensor.dishes", "dishes", "entry_1")
+    new = _chore("sensor.dishes_2", "dishes", "entry_1")
+    registry.register(hass, old)
+    registry.register(hass, new)
+
+    registry.unregister(hass, old)
+
+    assert registry.chore_by_unique_id(hass, "dishes") is new
+    assert registry.chore_by_entry_id(hass, "entry_1") is new
+    assert registry.chore_by_entity_id(hass, "sensor.dishes_2") is new
+
+
+def test_lookup_before_the_integration_is_set_up():
+    """Test that an entry lookup does not need the integration data."""
+    assert registry.chore_by_entry_id(SimpleNamespace(data={}), "entry_1") is None
+
+
+async def test_diagnostics_of_an_entry_without_chore(hass):
+    """Test the diagnostics of an entry whose chore is not loaded."""
+    hass.data[const.DOMAIN] = {const.SENSOR_PLATFORM: {}}
+    entry = MockConfigEntry(
+        domain=const.DOMAIN, data={"unique_id": "legacy"}, options={}
+    )
+
+    data = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert set(data) == {"integration", "config_entry"}
+    assert data["integration"]["chores"] == 0
+    assert data["config_entry"]["entry_id"] == entry.entry_id
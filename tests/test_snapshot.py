@@ -0,0 +1,82 @@
+"""Tests for the warm-start schedule snapshot."""
+
+from datetime import date, datetime, timedelta
+
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.chore_config import ChoreConfig
+from custom_components.chore_helper.snapshot import ScheduleSnapshot
+
+from .population import async_add_chore, make_chore, make_options
+
+TODAY = date(2024, 5, 1)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_served_for_same_inputs_and_day(hass):
+    """Test that the snapshot is served for the same inputs and day."""
+    snapshot = ScheduleSnapshot(hass)
+    snapshot.set("chore", 42, TODAY, [date(2024, 5, 3), date(2024, 5, 6)])
+
+    assert snapshot.get("chore", 42, TODAY) == [date(2024, 5, 3), date(2024, 5, 6)]
+    assert snapshot.get("chore", 43, TODAY) is None
+    assert snapshot.get("chore", 42, date(2024, 5, 2)) is None
+    assert snapshot.get("other", 42, TODAY) is None
+
+
+def test_fingerprint_follows_schedule_inputs():
+    """Test that the fingerprint changes with the schedule inputs."""
+    chore, same = make_chore(0), make_chore(0)
+    assert chore._schedule_fingerprint() == same._schedule_fingerprint()
+
+    chore.last_completed = datetime(2024, 4, 30, 9, 0)
+    completed = chore._schedule_fingerprint()
+    assert completed != same._schedule_fingerprint()
+
+    chore._remove_dates = "2024-05-03"
+    assert chore._schedule_fingerprint() != completed
+
+
+def test_fingerprint_ignores_name_and_icon():
+    """Test that cosmetic options keep the snapshot valid."""
+    chore = make_chore(0)
+    fingerprint = chore._schedule_fingerprint()
+    options = {**chore.config_entry.options, "name": "Renamed", "icon": "mdi:broom"}
+    renamed = make_chore(0)
+    renamed.config_entry.options = options
+    renamed._config = ChoreConfig.from_options(options)
+
+    assert renamed._config is chore._config
+    assert renamed._schedule_fingerprint() == fingerprint
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_warm_start_fires_loaded_and_refreshes_roster(
+    hass, auto_enable_custom_integrations
+):
+    """Test that a warm start still fires the event and fetches the roster."""
+    options = {**make_options(0), "auto_assign": True}
+    today = dt_util.now().date()
+    served = [today + timedelta(days=5)]
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    hass.data[const.DOMAIN][const.SCHEDULE_SNAPSHOT].set(
+        "warm",
+        make_chore(0)._schedule_fingerprint(),
+        today,
+        served,
+    )
+    hass.states.async_set("person.a", "home", {"friendly_name": "A"})
+    received: list[dict] = []
+    hass.bus.async_listen(const.EVENT_LOADED, lambda event: received.append(event.data))
+
+    chore = await async_add_chore(hass, options, entry_id="warm")
+    await hass.async_block_till_done()
+
+    assert chore._due_dates == served
+    assert chore._roster == ("person.a",)
+    assert received == [
+        {"entity_id": chore.entity_id, "due_dates": [served[0].isoformat()]}
+    ]
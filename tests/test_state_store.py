@@ -0,0 +1,44 @@
+"""Tests for the integration state file."""
+
+from datetime import date, datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.chore_helper.state_store import (
+    SAVE_DELAY,
+    STORAGE_KEY,
+    ChoreStateStore,
+)
+
+from .population import make_chore
+
+
+async def test_runtime_state_round_trip(hass, hass_storage):
+    """Test that a chore restores what it saved, through the state file."""
+    chore = make_chore(0)
+    chore.last_completed = datetime(2024, 5, 1, 9, 30)
+    chore._next_due_date = date(2024, 5, 4)
+    chore._attr_state = -2
+    chore._days = -2
+    chore._overdue = True
+    chore._overdue_days = 2
+    chore._add_dates = "2024-05-10"
+    chore._assignee_user_id = "person.a"
+    store = ChoreStateStore(hass)
+    store.set(chore.unique_id, chore._runtime_state())
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+    assert chore.unique_id in hass_storage[STORAGE_KEY]["data"]["chores"]
+
+    loaded = ChoreStateStore(hass)
+    await loaded.async_load()
+    restored = make_chore(0)
+    restored._restore_runtime_state(loaded.get(chore.unique_id))
+
+    assert restored._runtime_state() == chore._runtime_state()
+    assert restored._attr_state == -2
+    assert restored.overdue is True
+    assert restored.overdue_days == 2
+    assert restored._next_due_date == date(2024, 5, 4)
@@ -0,0 +1,60 @@
+"""Tests for skipping state writes that would not change anything."""
+
+from datetime import timedelta
+
+import pytest
+
+from .population import async_add_chore, make_options
+
+pytestmark = [
+    # The chore keeps its next state transition armed
+    pytest.mark.parametrize("expected_lingering_timers", [True]),
+]
+
+
+def _count_writes(chore) -> list[None]:
+    """Record the state writes the chore asks for itself."""
+    writes: list[None] = []
+    write = chore.async_write_ha_state
+
+    def counted() -> None:
+        writes.append(None)
+        write()
+
+    chore.async_write_ha_state = counted
+    return writes
+
+
+async def test_unchanged_state_is_not_written_again(
+    hass, auto_enable_custom_integrations
+):
+    """Test that only state updates that change something are written."""
+    chore = await async_add_chore(hass, make_options(0))
+    writes = _count_writes(chore)
+
+    chore.update_state()
+    assert writes == []
+    assert chore.suppressed_writes == 1
+
+    await chore.add_date(chore.next_due_date - timedelta(days=1))
+    assert len(writes) == 1
+    assert hass.states.get(chore.entity_id).state == str(chore.native_value)
+    assert chore.suppressed_writes == 1
+
+
+async def test_refresh_is_written_once(hass, auto_enable_custom_integrations):
+    """Test that a refresh leaves the write to Home Assistant."""
+    chore = await async_add_chore(hass, make_options(0))
+    writes = _count_writes(chore)
+    chore._last_updated = None
+
+    await chore.async_update_ha_state(True)
+
+    assert writes == []
+    assert chore.suppressed_writes == 0
+    assert chore.last_updated is not None
+
+    # The state Home Assistant wrote is the one to compare against
+    chore.update_state()
+    assert writes == []
+    assert chore.suppressed_writes == 1
@@ -0,0 +1,44 @@
+"""Tests for streaming completion statistics."""
+
+from datetime import datetime, timedelta
+import statistics
+
+from custom_components.chore_helper.stats import CompletionStats
+
+
+def test_interval_mean_and_stdev_match_batch_formulas():
+    """Test the running interval statistics against the batch formulas."""
+    stats = CompletionStats()
+    start = datetime(2024, 1, 1, 9, 0)
+    gaps = [3, 5, 4, 10, 2]
+    completed = start
+    stats.add(completed, None)
+    for gap in gaps:
+        completed += timedelta(days=gap)
+        stats.add(completed, 0)
+
+    attributes = stats.as_attributes()
+    assert attributes["completion_interval_mean"] == round(statistics.mean(gaps), 2)
+    assert attributes["completion_interval_stdev"] == round(statistics.stdev(gaps), 2)
+
+
+def test_lateness_and_on_time_ratio():
+    """Test the lateness and on-time ratio of completions."""
+    stats = CompletionStats()
+    for day, lateness in enumerate([-1, 0, 2, 3]):
+        stats.add(datetime(2024, 1, 1 + day), lateness)
+
+    attributes = stats.as_attributes()
+    assert attributes["lateness_mean"] == 1.0
+    assert attributes["on_time_ratio"] == 0.5
+
+
+def test_history_is_bounded_and_round_trips():
+    """Test that the history is bounded and survives a round trip."""
+    stats = CompletionStats(size=3)
+    for day in range(5):
+        stats.add(datetime(2024, 1, 1 + day), None)
+
+    restored = CompletionStats.from_dict(stats.as_dict())
+    assert len(restored.history) == 3
+    assert restored.as_attributes() == stats.as_attributes()
@@ -0,0 +1,153 @@
+"""Tests for the shared state transition timer."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.timer import DueTimer, due_timer
+
+from .population import async_add_chore, make_options
+
+
+@pytest.mark.asyncio
+async def test_one_timer_is_armed_for_the_earliest_transition(hass):
+    """Test that one timer is armed for the earliest transition."""
+    timer = DueTimer(hass)
+    now = dt_util.now()
+    fired = []
+    timer.schedule("a", now + timedelta(hours=2), lambda _: fired.append("a"))
+    timer.schedule("b", now + timedelta(hours=1), lambda _: fired.append("b"))
+    assert timer.armed_at == now + timedelta(hours=1)
+
+    # Moved later: the timer fires early, runs nothing and re-arms
+    timer.schedule("b", now + timedelta(hours=3), lambda _: fired.append("b"))
+    assert len(timer) == 2
+    async_fire_time_changed(hass, now + timedelta(hours=1))
+    await hass.async_block_till_done()
+    assert fired == []
+    assert timer.armed_at == now + timedelta(hours=2)
+
+    async_fire_time_changed(hass, now + timedelta(hours=2))
+    await hass.async_block_till_done()
+    assert fired == ["a"]
+
+    async_fire_time_changed(hass, now + timedelta(hours=3))
+    await hass.async_block_till_done()
+    assert fired == ["a", "b"]
+    assert len(timer) == 0
+    assert timer.armed_at is None
+
+
+@pytest.mark.asyncio
+async def test_cancel_disarms_the_timer(hass):
+    """Test that cancelling the last transition disarms the timer."""
+    timer = DueTimer(hass)
+    timer.schedule("a", dt_util.now() + timedelta(hours=1), lambda _: None)
+
+    timer.cancel("a")
+
+    assert len(timer) == 0
+    assert timer.armed_at is None
+
+
+@pytest.mark.asyncio
+async def test_a_failing_transition_does_not_stop_the_others(hass):
+    """Test that the timer runs the other transitions and re-arms."""
+    timer = DueTimer(hass)
+    now = dt_util.now()
+    fired = []
+
+    def fail(_):
+        raise ValueError("broken chore")
+
+    timer.schedule("a", now + timedelta(hours=1), fail)
+    timer.schedule("b", now + timedelta(hours=1), lambda _: fired.append("b"))
+    timer.schedule("c", now + timedelta(hours=2), lambda _: fired.append("c"))
+
+    async_fire_time_changed(hass, now + timedelta(hours=1))
+    await hass.async_block_till_done()
+    assert fired == ["b"]
+    assert timer.armed_at == now + timedelta(hours=2)
+
+    async_fire_time_changed(hass, now + timedelta(hours=2))
+    await hass.async_block_till_done()
+    assert fired == ["b", "c"]
+
+
+def _at(day: date, hour: int = 0) -> datetime:
+    """Return a local time on a day."""
+    return dt_util.start_of_local_day(day) + timedelta(hours=hour)
+
+
+async def _move_to(hass, freezer, when: datetime) -> None:
+    """Move the clock and fire the timers due by then."""
+    freezer.move_to(when)
+    async_fire_time_changed(hass, when)
+    await hass.async_block_till_done()
+
+
+def _chore_options(**options) -> dict:
+    """Return the options of a chore every 3 days, first due on May 1st."""
+    return {**make_options(0), "start_date": "2024-04-28", **options}
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_timed_chore_turns_overdue_at_its_due_time(
+    hass, auto_enable_custom_integrations, freezer
+):
+    """Test that the timer makes a timed chore overdue at its due time."""
+    freezer.move_to(_at(date(2024, 5, 1), 6))
+    chore = await async_add_chore(hass, _chore_options(time="08:00:00"))
+    due = _at(date(2024, 5, 1), 8)
+
+    state = hass.states.get(chore.entity_id)
+    assert state.state == "0"
+    assert state.attributes[const.ATTR_NEXT_DATE] == due
+    assert state.attributes[const.ATTR_OVERDUE] is False
+    assert due_timer(hass).armed_at == due
+
+    await _move_to(hass, freezer, due - timedelta(seconds=1))
+    assert hass.states.get(chore.entity_id).attributes[const.ATTR_OVERDUE] is False
+
+    await _move_to(hass, freezer, due)
+    assert hass.states.get(chore.entity_id).attributes[const.ATTR_OVERDUE] is True
+    assert due_timer(hass).armed_at == _at(date(2024, 5, 2))
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_midnight_rollover_goes_through_the_timer(
+    hass, auto_enable_custom_integrations, freezer
+):
+    """Test that the timer refreshes a chore on a new day."""
+    freezer.move_to(_at(date(2024, 5, 2), 12))
+    chore = await async_add_chore(hass, _chore_options(start_date="2024-05-01"))
+    assert hass.states.get(chore.entity_id).state == "2"
+    assert due_timer(hass).armed_at == _at(date(2024, 5, 3))
+
+    await _move_to(hass, freezer, _at(date(2024, 5, 3)))
+    assert hass.states.get(chore.entity_id).state == "1"
+    assert chore.last_updated.date() == date(2024, 5, 3)
+    assert due_timer(hass).armed_at == _at(date(2024, 5, 4))
+
+
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_calendar_events_carry_the_due_time(
+    hass, auto_enable_custom_integrations, freezer
+):
+    """Test that timed chores have events from their due time, others all day."""
+    freezer.move_to(_at(date(2024, 5, 1), 6))
+    await async_add_chore(hass, _chore_options(name="Timed", time="08:00:00"))
+    await async_add_chore(hass, _chore_options(name="All day"))
+    calendar = hass.data[const.DOMAIN][const.CALENDAR_PLATFORM]
+
+    events = await calendar.async_get_events(
+        hass, _at(date(2024, 5, 1)), _at(date(2024, 5, 2))
+    )
+
+    assert {event.summary: (event.start, event.end) for event in events} == {
+        "Timed": (_at(date(2024, 5, 1), 8), _at(date(2024, 5, 1), 9)),
+        "All day": (date(2024, 5, 1), date(2024, 5, 2)),
+    }
@@ -0,0 +1,46 @@
+"""Tests for per-chore tracing."""
+
+from datetime import date
+from types import SimpleNamespace
+
+from custom_components.chore_helper import const, tracing
+
+from .population import make_chore
+
+
+def _hass(chores):
+    return SimpleNamespace(
+        data={const.DOMAIN: {const.SENSOR_PLATFORM: {c.entity_id: c for c in chores}}}
+    )
+
+
+def test_tracing_is_off_by_default():
+    """Test that no chore is traced by default."""
+    chore = make_chore(0)
+    chore._add_period_offset(date(2024, 1, 1))
+
+    assert chore.trace is None
+
+
+def test_tracing_follows_patterns():
+    """Test that tracing follows the entity id patterns."""
+    traced, other = make_chore(0), make_chore(1)
+    traced.entity_id = "sensor.kitchen_floor"
+    hass = _hass([traced, other])
+
+    tracing.set_tracing(hass, ["sensor.kitchen_*"], True)
+    traced._add_period_offset(date(2024, 1, 1))
+    other._add_period_offset(date(2024, 1, 1))
+
+    assert traced.trace == [
+        {
+            "event": "add_period_offset",
+            "start_date": "2024-01-01",
+            "period": 3,
+            "next_date": "2024-01-04",
+        }
+    ]
+    assert other.trace is None
+
+    tracing.set_tracing(hass, ["sensor.kitchen_*"], False)
+    assert traced.trace is None
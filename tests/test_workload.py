@@ -0,0 +1,212 @@
+"""Tests for the least-loaded assignment strategy."""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.chore_helper.chore_daily import DailyChore
+from custom_components.chore_helper.chore_hourly import HourlyChore
+from custom_components.chore_helper.workload import WorkloadTracker
+
+TODAY = date(2024, 5, 1)
+
+
+def test_tracker_counts_only_chores_within_horizon():
+    """Test that only due dates within the horizon count as load."""
+    tracker = WorkloadTracker(horizon=7)
+    tracker.update("c1", "person.a", 3, date(2024, 5, 3), TODAY)
+    tracker.update("c2", "person.a", 5, date(2024, 6, 1), TODAY)
+
+    assert tracker.load("person.a") == 3
+
+
+def test_tracker_moves_load_on_reassignment():
+    """Test that reassigning a chore moves its load to the new person."""
+    tracker = WorkloadTracker()
+    tracker.update("c1", "person.a", 4, TODAY, TODAY)
+    tracker.update("c1", "person.b", 4, TODAY, TODAY)
+
+    assert tracker.load("person.a") == 0
+    assert tracker.load("person.b") == 4
+
+
+def test_least_loaded_prefers_untracked_then_lowest_load():
+    """Test the choice of the least loaded person."""
+    tracker = WorkloadTracker()
+    tracker.update("c1", "person.a", 5, TODAY, TODAY)
+    tracker.update("c2", "person.b", 2, TODAY, TODAY)
+
+    assert tracker.least_loaded(["person.a", "person.b", "person.c"]) == "person.c"
+    assert tracker.least_loaded(["person.a", "person.b"]) == "person.b"
+
+    tracker.remove("c1")
+    assert tracker.least_loaded(["person.a", "person.b"]) == "person.a"
+
+
+def test_least_loaded_breaks_ties_by_candidate_order():
+    """Test that equal loads, tracked or not, follow the candidates order."""
+    tracker = WorkloadTracker()
+    tracker.update("c1", "person.a", 2, TODAY, TODAY)
+    tracker.update("c2", "person.c", 2, TODAY, TODAY)
+
+    assert tracker.least_loaded(["person.c", "person.a"]) == "person.c"
+    assert tracker.least_loaded(["person.a", "person.c"]) == "person.a"
+
+    # A tracked person down to zero ties with the untracked ones
+    tracker.remove("c1")
+    assert tracker.least_loaded(["person.b", "person.a"]) == "person.b"
+    assert tracker.least_loaded(["person.a", "person.b"]) == "person.a"
+
+
+@pytest.mark.asyncio
+async def test_complete_assigns_least_loaded_person():
+    """Test that completing a chore assigns the least loaded person."""
+    persons = [
+        SimpleNamespace(entity_id="person.a", name="A", attributes={}),
+        SimpleNamespace(entity_id="person.b", name="B", attributes={}),
+    ]
+    tracker = WorkloadTracker()
+    tracker.update("other_chore", "person.a", 10, TODAY, TODAY)
+
+    hass = SimpleNamespace(
+        states=SimpleNamespace(async_all=lambda: list(persons)),
+        bus=SimpleNamespace(async_fire=lambda evt, data: None),
+        data={"chore_helper": {"sensor": {}, "workload": tracker}},
+    )
+    entry = SimpleNamespace(
+        options={
+            "frequency": "every-n-days",
+            "period": 1,
+            "start_date": "2024-04-01",
+            "auto_assign": True,
+            "assign_strategy": "least_loaded",
+        },
+        entry_id="entry_1",
+        title="Heavy chore",
+    )
+    chore = DailyChore(entry)
+    chore.hass = hass
+
+    await chore.complete(None)
+
+    assert chore._assignee_user_id == "person.b"
+
+
+def _forecast_chore(strategy: str, tracker: WorkloadTracker) -> DailyChore:
+    """Return a daily auto-assigned chore, next due on May 2nd."""
+    entry = SimpleNamespace(
+        options={
+            "frequency": "every-n-days",
+            "period": 1,
+            "start_date": "2024-04-01",
+            "forecast_dates": 3,
+            "auto_assign": True,
+            "assign_strategy": strategy,
+        },
+        entry_id="entry_1",
+        title="Dishes",
+    )
+    chore = DailyChore(entry)
+    chore.hass = SimpleNamespace(data={"chore_helper": {"workload": tracker}})
+    chore._roster = ("person.a", "person.b", "person.c")
+    chore._assignee_user_id = "person.a"
+    chore._next_due_date = date(2024, 5, 2)
+    return chore
+
+
+def test_round_robin_forecast_follows_the_schedule():
+    """Test that each forecast date of the engine gets the next person."""
+    chore = _forecast_chore("round_robin", WorkloadTracker())
+
+    assert chore.projected_assignees() == {
+        "2024-05-02": "person.a",
+        "2024-05-03": "person.b",
+        "2024-05-04": "person.c",
+    }
+
+
+def test_least_loaded_forecast_matches_the_next_pick():
+    """Test that the forecast picks who _next_assignee would pick."""
+    tracker = WorkloadTracker()
+    chore = _forecast_chore("least_loaded", tracker)
+    chore._roster = ("person.a", "person.b")
+    # This chore is the whole load of its assignee: it stays with them
+    tracker.update("entry_1", "person.a", 5, TODAY, TODAY)
+
+    assert list(chore.projected_assignees().values()) == ["person.a"] * 3
+    persons = [SimpleNamespace(entity_id=p) for p in chore._roster]
+    assert chore._next_assignee(persons).entity_id == "person.a"
+
+
+def test_assignee_forecast_follows_other_chores():
+    """Test that the forecast attribute is not served from a stale cache."""
+    tracker = WorkloadTracker()
+    chore = _forecast_chore("least_loaded", tracker)
+    chore._roster = ("person.a", "person.b")
+    tracker.update("other_chore", "person.a", 10, TODAY, TODAY)
+
+    assert list(chore.extra_state_attributes["assignee_forecast"].values()) == [
+        "person.a",
+        "person.b",
+        "person.b",
+    ]
+
+    tracker.update("other_chore", "person.b", 10, TODAY, TODAY)
+    assert list(chore.extra_state_attributes["assignee_forecast"].values()) == [
+        "person.a",
+        "person.a",
+        "person.a",
+    ]
+
+
+def test_assignee_forecast_cache_follows_the_schedule():
+    """Test that the cached forecast is dropped when its inputs change."""
+    chore = _forecast_chore("round_robin", WorkloadTracker())
+    first = chore.projected_assignees()
+    assert chore.projected_assignees() is first
+    assert chore.metrics.cache["assignee_forecast"] == [1, 1]
+
+    chore._remove_dates = "2024-05-03"
+    assert list(chore.projected_assignees()) == [
+        "2024-05-02",
+        "2024-05-04",
+        "2024-05-05",
+    ]
+
+    chore._roster = ("person.c", "person.a")
+    assert list(chore.projected_assignees().values()) == [
+        "person.a",
+        "person.c",
+        "person.a",
+    ]
+    assert chore.metrics.cache["assignee_forecast"] == [1, 3]
+
+
+def test_hourly_forecast_has_one_entry_per_due_time():
+    """Test that due times on the same day are projected one by one."""
+    entry = SimpleNamespace(
+        options={
+            "frequency": "every-n-hours",
+            "period": 12,
+            "start_date": "2024-01-01",
+            "time": "08:00:00",
+            "forecast_dates": 3,
+            "auto_assign": True,
+        },
+        data={},
+        entry_id="hourly",
+        title="Medication",
+    )
+    chore = HourlyChore(entry)
+    chore.last_completed = dt_util.as_local(datetime(2024, 5, 1, 9, 0))
+    chore._load_due_times()
+    chore._roster = ("person.a", "person.b")
+    chore._assignee_user_id = "person.a"
+
+    assert list(chore.projected_assignees().values()) == [
+        "person.a",
+        "person.b",
+        "person.a",
+    ]